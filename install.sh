@@ -67,6 +67,12 @@ eval ${IPTABLES_SAVE}
 pip3 install --upgrade pip
 pip3 install -r requirements.txt
 
+# Install the PostgreSQL driver if a PostgreSQL database is configured, psycopg2
+# 2.9 and newer are not compatible with Django 2.1
+if [[ -f ${CURDIR}/data/keys/database.json ]]; then
+    pip3 install "psycopg2-binary<2.9"
+fi
+
 # Create the application directories
 mkdirIfNotExists ${CURDIR}/data/keys
 mkdirIfNotExists ${CURDIR}/data/logs
@@ -78,8 +84,10 @@ chmod 600 ${CURDIR}/data/keys/secret.key
 
 # Create database and set proper permissions
 python3 manage.py migrate
-chown root:root ${CURDIR}/data/mangle.db
-chmod 600 ${CURDIR}/data/mangle.db
+if [[ -f ${CURDIR}/data/mangle.db ]]; then
+    chown root:root ${CURDIR}/data/mangle.db
+    chmod 600 ${CURDIR}/data/mangle.db
+fi
 
 # perform the application initialization
 python3 manage.py install
@@ -31,6 +31,8 @@ class Command(BaseCommand):
         self.ok("  - web systemd unit created.")
         create_vpn_unit()
         self.ok("  - vpn systemd unit created.")
+        create_hooks_unit()
+        self.ok("  - hooks systemd unit created.")
         create_tasks_unit()
         self.ok("  - tasks systemd unit created.")
         bash.run("systemctl", "daemon-reload")
@@ -79,6 +81,19 @@ def create_vpn_unit():
         })
 
 
+def create_hooks_unit():
+    """
+    Creates the 'mangle-hooks' systemd service unit file.
+    :return: None
+    """
+    _create_unit_from_template(
+        path=settings.SYSTEMD_HOOKS_FILE,
+        template="install/systemd/mangle-hooks.service",
+        data={
+            "root_dir": settings.BASE_DIR,
+        })
+
+
 ######################################
 # Web
 ######################################
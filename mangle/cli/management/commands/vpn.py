@@ -1,13 +1,16 @@
 import logging
 import os
 import pathlib
+import signal
 import sys
+import threading
 
 from django.conf import settings
 from django.template.loader import render_to_string
 from django.utils import timezone
 from mangle.cli.command import BaseCommand
-from mangle.common import config, iptables, models, openvpn
+from mangle.common import (bandwidth, config, events, firewall, hooks,
+                           iptables, ipset, models, nftables, openvpn)
 from mangle.common.utils import net, strings
 
 
@@ -30,12 +33,11 @@ class Command(BaseCommand):
             vpn_post_start()
         elif action == "post-stop":
             vpn_post_stop()
-        elif action == "client-authenticate":
-            vpn_client_authenticate()
-        elif action == "client-connect":
-            vpn_client_connect()
-        elif action == "client-disconnect":
-            vpn_client_disconnect()
+        elif action == "hook-server":
+            vpn_hook_server()
+        elif action in HOOKS:
+            if not HOOKS[action](os.environ):
+                sys.exit(1)
         else:
             self.exit("unknown action: %s", action)
 
@@ -59,19 +61,46 @@ def vpn_pre_start():
 
 def vpn_post_start():
     """
-    Creates the OpenVPN firewall rules.
+    Creates the OpenVPN firewall rules. Unless the firewall backend has changed
+    since the rules were last created, the existing group chains and client
+    rules are reconciled rather than deleted and re-created.
     :return: None
     """
-    vpn_post_stop()
-    iptables.create_chain("filter", "MangleVPN")
-    iptables.create_chain("filter", "MangleVPN_Clients")
+    backend = config.get("vpn_firewall_backend", "iptables")
+    use_ipset = (backend == "iptables" and
+                 config.get_bool("vpn_firewall_ipset", False))
 
+    if (config.get("vpn_firewall_backend_active") != backend or
+            ipset.enabled() != use_ipset):
+        vpn_post_stop()
+
+    # the firewall settings only take effect when the server is (re)started
+    config.set("vpn_firewall_backend_active", backend)
+    config.set("vpn_firewall_ipset_active", use_ipset)
+
+    # delete any clients left behind by a dirty restart or reboot
+    models.Client.objects.all().delete()
+
+    old_rules = config.get("vpn_firewall_rules", "")
     rules = render_rules()
-    for rule in rules.split("\n"):
-        iptables.run(rule)
 
-    for group in models.Group.objects.filter(is_enabled=True).all():
-        group.create_firewall_chain()
+    # all of the chains and rules are applied at once in a single transaction
+    with iptables.transaction() as tx:
+        for rule in old_rules.split("\n"):
+            # the MangleVPN chain is re-created below, which removes its rules
+            if rule and " -A MangleVPN " not in " {} ".format(rule):
+                tx.run(rule.replace("-A", "-D"))
+
+        if not nftables.enabled():
+            tx.create_chain("filter", "MangleVPN")
+            firewall.reconcile(tx)
+
+        for rule in rules.split("\n"):
+            tx.run(rule)
+
+    # the nftables ruleset is applied as a single table replacement
+    if nftables.enabled():
+        nftables.replace_table(nftables.VPN_TABLE, render_nft_rules())
 
     config.set("vpn_firewall_rules", rules)
     config.set("vpn_restart_pending", False)
@@ -83,73 +112,133 @@ def vpn_post_stop():
     :return: None
     """
     rules = config.get("vpn_firewall_rules", "")
+    chains = iptables.get_chains("filter")
 
-    for rule in rules.split("\n"):
-        iptables.run(rule.replace("-A", "-D"))
+    with iptables.transaction() as tx:
+        for rule in rules.split("\n"):
+            tx.run(rule.replace("-A", "-D"))
 
-    # delete the application chains
-    iptables.delete_chain("filter", "MangleVPN")
-    iptables.delete_chain("filter", "MangleVPN_Clients")
+        # delete the application chains
+        for chain in ("MangleVPN", "MangleVPN_Clients"):
+            if chain in chains:
+                tx.delete_chain("filter", chain)
 
-    config.delete("vpn_firewall_rules")
+        # delete all of the group chains
+        for group in models.Group.objects.filter(is_enabled=True).all():
+            if group.chain in chains:
+                tx.delete_chain("filter", group.chain)
+
+    # the group sets can only be destroyed once no rules reference them
+    if ipset.enabled():
+        for group in models.Group.objects.filter(is_enabled=True).all():
+            ipset.destroy(group.set_name)
+
+    nftables.delete_table(nftables.VPN_TABLE)
 
-    # delete all of the group chains
-    for group in models.Group.objects.filter(is_enabled=True).all():
-        group.delete_firewall_chain()
+    config.delete("vpn_firewall_rules")
+    config.delete("vpn_firewall_backend_active")
+    config.delete("vpn_firewall_ipset_active")
 
     # delete all clients to avoid potential stale clients persisting through
     # dirty restarts or reboots
     models.Client.objects.all().delete()
 
 
-def vpn_client_authenticate():
+def vpn_hook_server():
     """
-    Handles OpenVPN client user authentication.
+    Runs the OpenVPN hook server which handles the OpenVPN client hooks sent by
+    the hook shim until the process is stopped. If `vpn_deferred_connect` is
+    enabled then client connects are handled asynchronously. Events recorded
+    by the hooks are buffered and written in bulk. Unless the
+    `vpn_bytecount_interval` setting is 0, the client bandwidth is collected
+    from the management interface as well.
     :return: None
     """
-    username = os.environ["username"]
-    password = os.environ["password"]
+    deferred = ()
+    if config.get_bool("vpn_deferred_connect", False):
+        deferred = ("client-connect", )
+
+    config.subscribe()
+    events.start()
+
+    interval = config.get_int("vpn_bytecount_interval", 5)
+    if interval > 0:
+        bandwidth.start(
+            interval=interval,
+            rollup_interval=config.get_int("vpn_bandwidth_rollup_interval", 30),
+        )
+
+    # stop gracefully on SIGTERM, so that deferred hooks finish and buffered
+    # events are written before the server exits
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    server = hooks.HookServer(
+        path=settings.OPENVPN_HOOK_SOCKET,
+        hooks=HOOKS,
+        deferred=deferred,
+        workers=config.get_int("vpn_connect_workers", 4),
+    )
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        bandwidth.stop()
+        events.stop()
+
+
+def vpn_client_authenticate(env):
+    """
+    Handles OpenVPN client user authentication and returns whether the client
+    is allowed to connect.
+    :return: bool
+    """
+    username = env["username"]
+    password = env["password"]
 
     user = models.User.objects.by_email(username)
 
     if not user:
-        print("user with username {} not found".format(username))
-        sys.exit(1)
+        logger.warning("user with username %s not found", username)
+        return False
 
     if not user.is_active:
-        models.Event.objects.create(
+        events.record(
             name="vpn.error",
             user=user,
             detail="User is not currently active.",
         )
-        sys.exit(1)
+        return False
 
     if user.mfa_required and not user.verify_mfa_code(password):
-        models.Event.objects.create(
+        events.record(
             name="vpn.error",
             user=user,
             detail="User two-factor authentication code invalid.",
         )
-        sys.exit(1)
+        return False
+
+    return True
 
 
-def vpn_client_connect():
+def vpn_client_connect(env):
     """
-    Handles OpenVPN clients connecting (after authentications).
-    :return: None
+    Handles OpenVPN clients connecting (after authentications) and returns
+    whether the client is allowed to connect.
+    :return: bool
     """
-    common_name = os.environ["common_name"]
-    platform = os.environ["IV_PLAT"]
-    fingerprint = os.environ["tls_digest_0"]
-    virtual_ip = os.environ["ifconfig_pool_remote_ip"]
-    remote_ip = os.environ["trusted_ip"]
-    trusted_port = os.environ["trusted_port"]
+    common_name = env["common_name"]
+    platform = env["IV_PLAT"]
+    fingerprint = env["tls_digest_0"]
+    virtual_ip = env["ifconfig_pool_remote_ip"]
+    remote_ip = env["trusted_ip"]
+    trusted_port = env["trusted_port"]
 
     device = models.Device.objects.by_fingerprint(fingerprint)
 
     if not device:
-        print("unknown device with fingerprint: {}".format(fingerprint))
-        sys.exit(1)
+        logger.warning("unknown device with fingerprint: %s", fingerprint)
+        return False
 
     # create the device client
     models.Client.objects.create(
@@ -161,7 +250,7 @@ def vpn_client_connect():
     )
 
     # create the user event
-    models.Event.objects.create(
+    events.record(
         name="vpn.connect",
         user=device.user,
         detail="Device {} connected from {}".format(device.name, remote_ip),
@@ -169,30 +258,86 @@ def vpn_client_connect():
 
     device.last_login = timezone.now()
     device.save()
+    return True
 
 
-def vpn_client_disconnect():
+def vpn_client_disconnect(env):
     """
     Handles OpenVPN clients disconnecting.
-    :return: None
+    :return: bool
     """
-    common_name = os.environ["common_name"]
-    remote_ip = os.environ["trusted_ip"]
+    common_name = env["common_name"]
+    remote_ip = env["trusted_ip"]
 
     client = models.Client.objects.by_common_name(common_name)
     if client:
-        models.Event.objects.create(
+        # OpenVPN gives the final byte counts of the connection, which are
+        # more accurate than the last bandwidth rollup
+        events.record(
             name="vpn.disconnect",
             user=client.device.user,
-            detail="Device {} disconnected from {} after {}".format(
+            detail=("Device {} disconnected from {} after {} "
+                    "({} up, {} down)").format(
                 client.device.name,
                 remote_ip,
                 strings.secs_to_hhmmss(client.duration),
+                strings.format_bytes(env.get("bytes_received", 0)),
+                strings.format_bytes(env.get("bytes_sent", 0)),
             ),
         )
 
+        # the client is gone, so there is no connection left to kill
+        client.disconnected = True
         client.delete()
 
+    return True
+
+
+def vpn_client_kill(env):
+    """
+    Kills the OpenVPN client connection with the `client` address. The hook
+    returns without waiting for OpenVPN, which cannot answer management
+    commands while it runs a synchronous hook that is waiting for this server.
+    When the bandwidth collector is running it holds the only management
+    connection, so the command is sent over its connection instead.
+    :return: bool
+    """
+    client = env["client"]
+
+    if bandwidth.is_running():
+        bandwidth.send("kill", client)
+    else:
+        threading.Thread(target=_kill_client, args=(client, ),
+                         daemon=True).start()
+
+    return True
+
+
+def _kill_client(client):
+    """
+    Kills the OpenVPN client connection with the given address over a new
+    management connection.
+    :return: None
+    """
+    try:
+        with openvpn.management() as m:
+            m.run("kill", client)
+    except (openvpn.ManagementError, OSError) as e:
+        logger.warning("failed to kill client %s: %s", client, e)
+
+
+HOOKS = {
+    "client-authenticate": vpn_client_authenticate,
+    "client-connect": vpn_client_connect,
+    "client-disconnect": vpn_client_disconnect,
+    "client-kill": vpn_client_kill,
+}
+"""dict: the OpenVPN client hooks.
+
+Maps each OpenVPN client hook action to the function that handles it. Each
+hook is given the OpenVPN environment and returns whether the hook succeeded.
+"""
+
 
 def render_rules():
     """
@@ -201,13 +346,39 @@ def render_rules():
     """
     return render_to_string(
         template_name="firewall/vpn.rules",
-        context={
-            "interface": config.get("vpn_interface"),
-            "nat_interface": config.get("vpn_nat_interface"),
-            "local_addrs": net.ip_addresses(),
-            "port": config.get("vpn_port"),
-            "protocol": config.get("vpn_protocol"),
-            "nameservers": config.get_list("vpn_nameservers"),
-            "subnet": config.get("vpn_subnet"),
-        },
+        context=rules_context(),
     )
+
+
+def render_nft_rules():
+    """
+    Returns the OpenVPN nftables ruleset, including all of the group chains
+    and client mappings.
+    :return: str
+    """
+    context = rules_context()
+    context["groups"] = models.Group.objects.filter(is_enabled=True).all()
+    context["clients"] = models.Client.objects.select_related(
+        "device__user__group").filter(device__user__group__is_enabled=True)
+
+    return render_to_string(
+        template_name="firewall/vpn.nft",
+        context=context,
+    )
+
+
+def rules_context():
+    """
+    Returns the template context used to render the OpenVPN rules.
+    :return: dict
+    """
+    return {
+        "interface": config.get("vpn_interface"),
+        "nat_interface": config.get("vpn_nat_interface"),
+        "local_addrs": net.ip_addresses(),
+        "nftables": nftables.enabled(),
+        "port": config.get("vpn_port"),
+        "protocol": config.get("vpn_protocol"),
+        "nameservers": config.get_list("vpn_nameservers"),
+        "subnet": config.get("vpn_subnet"),
+    }
@@ -31,8 +31,9 @@ def web_post_start():
 
     rules = _render_rules()
 
-    for rule in _render_rules().split("\n"):
-        iptables.run(rule)
+    with iptables.transaction() as tx:
+        for rule in rules.split("\n"):
+            tx.run(rule)
 
     # save the firewall rules so they can be properly removed
     config.set("web_firewall_rules", rules)
@@ -45,8 +46,9 @@ def web_post_stop():
     """
     rules = config.get("web_firewall_rules", "")
 
-    for rule in rules.split("\n"):
-        iptables.run(rule.replace("-A", "-D"))
+    with iptables.transaction() as tx:
+        for rule in rules.split("\n"):
+            tx.run(rule.replace("-A", "-D"))
 
     config.delete("web_firewall_rules")
 
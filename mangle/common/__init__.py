@@ -1,5 +1,5 @@
 from django.apps import AppConfig
-from django.db.utils import OperationalError
+from django.db.utils import DatabaseError
 from django.template import defaultfilters
 from mangle.common.utils import net
 
@@ -20,18 +20,21 @@ class CommonConfig(AppConfig):
             config.set_default("app_http_port", 80)
             config.set_default("app_https_port", 443)
             config.set_default("oauth2_provider", "none")
+            config.set_default("pki_key_algorithm", "rsa")
             config.set_default("pki_key_size", 4096)
             config.set_default("smtp_reply_address", "Mangle VPN")
+            config.set_default("vpn_firewall_backend", "iptables")
             config.set_default("vpn_interface", interfaces[0])
             config.set_default("vpn_nat_interface", interfaces[0])
             config.set_default("vpn_port", 1194)
             config.set_default("vpn_protocol", "udp")
             config.set_default("vpn_redirect_gateway", False)
             config.set_default("vpn_subnet", "172.25.0.0/16")
-        except OperationalError:
-            # an OperationalError is raised when attempting to load the
-            # application settings before the DB has been created, which will
-            # happen when calling ``makemigrations`` or ``migrate``
+        except DatabaseError:
+            # a DatabaseError is raised when attempting to load the application
+            # settings before the DB has been created, which will happen when
+            # calling ``makemigrations`` or ``migrate`` (SQLite raises an
+            # OperationalError and PostgreSQL a ProgrammingError)
             pass
 
         # register template filters
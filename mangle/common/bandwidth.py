@@ -0,0 +1,299 @@
+import asyncio
+import atexit
+import collections
+import functools
+import logging
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from django import db
+from django.conf import settings
+from mangle.common import models, openvpn
+
+
+logger = logging.getLogger(__name__)
+
+
+SAMPLES = 6
+"""int: the number of bytecount samples kept for each client. The client rates
+are averaged over the samples, eg. the last 30 seconds with a 5 second
+bytecount interval."""
+
+_collector = None
+"""BandwidthCollector: the running bandwidth collector, or None."""
+
+
+def start(interval=5, rollup_interval=30):
+    """
+    Starts the bandwidth collector for the current process. OpenVPN reports the
+    client byte counts every `interval` seconds, and the client totals and
+    rates are written to the database every `rollup_interval` seconds.
+    :return: BandwidthCollector
+    """
+    global _collector
+
+    if _collector is None or not _collector.is_alive():
+        _collector = BandwidthCollector(interval, rollup_interval)
+        _collector.start()
+        atexit.register(stop)
+
+    return _collector
+
+
+def stop():
+    """
+    Stops the bandwidth collector.
+    :return: None
+    """
+    global _collector
+
+    if _collector is not None:
+        _collector.stop()
+        _collector = None
+
+
+def is_running():
+    """
+    Returns whether the bandwidth collector is running in the current process
+    and its management connection has been established, so commands can be
+    sent over it.
+    :return: bool
+    """
+    return (_collector is not None and _collector.is_alive() and
+            _collector.started)
+
+
+def send(*args, timeout=10):
+    """
+    Sends the given command over the collector's management connection and
+    returns without waiting for the response. Failed commands are logged.
+    Since OpenVPN only accepts a single management connection, this must be
+    used instead of `openvpn.Management` while the collector is running.
+    :return: None
+    """
+    if not is_running():
+        raise ValueError("bandwidth collector is not running")
+
+    future = asyncio.run_coroutine_threadsafe(
+        asyncio.wait_for(_collector.management.run(*args), timeout),
+        _collector.loop,
+    )
+    future.add_done_callback(functools.partial(_log_failure, " ".join(args)))
+
+
+def _log_failure(command, future):
+    """
+    Logs the error of the given management command future, if it failed.
+    :return: None
+    """
+    if not future.cancelled() and future.exception():
+        logger.warning("management command %r failed: %r", command,
+                       future.exception())
+
+
+class BandwidthCollector(threading.Thread):
+    """
+    BandwidthCollector is a background thread that enables `bytecount` on the
+    OpenVPN management interface and keeps the byte counts OpenVPN reports for
+    each client in a ring buffer. The client totals and rates are periodically
+    written to the database, so they can be read without management calls.
+
+    OpenVPN only accepts a single management connection at a time, so the
+    collector keeps it open for as long as it is running.
+    """
+    def __init__(self, interval=5, rollup_interval=30):
+        super().__init__(name="bandwidth-collector", daemon=True)
+        self.interval = interval
+        self.rollup_interval = rollup_interval
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.management = None
+        self.started = False
+        self.names = {}
+        self.samples = {}
+        self.refreshed_at = 0
+        self.task = None
+
+    def run(self):
+        """
+        Collects the client byte counts until the collector is stopped.
+        :return: None
+        """
+        asyncio.set_event_loop(self.loop)
+        self.task = self.loop.create_task(self.collect())
+
+        try:
+            self.loop.run_until_complete(self.task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.loop.close()
+
+            # the rollups are written on the executor thread, which has its own
+            # database connection
+            self.executor.submit(db.connections.close_all).result()
+            self.executor.shutdown(wait=True)
+
+    def stop(self):
+        """
+        Stops the collector thread and closes the management connection.
+        :return: None
+        """
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._cancel)
+        self.join()
+
+    async def collect(self):
+        """
+        Reads the management notifications and rolls up the client traffic.
+        :return: None
+        """
+        self.management = openvpn.AsyncManagement(
+            settings.OPENVPN_MANAGEMENT_SOCKET,
+            init_commands=["bytecount {}".format(self.interval)],
+        )
+
+        rollups = asyncio.ensure_future(self.rollups())
+
+        try:
+            await self.management.start()
+            self.started = True
+
+            async for notification in self.management.notifications():
+                self.notify(notification)
+        finally:
+            self.started = False
+
+            # the rollups task is awaited, otherwise it is destroyed while
+            # still pending when the loop is closed
+            rollups.cancel()
+            try:
+                await rollups
+            except asyncio.CancelledError:
+                pass
+
+            await self.management.close()
+
+    async def rollups(self):
+        """
+        Writes the client traffic to the database every rollup interval.
+        :return: None
+        """
+        while True:
+            await asyncio.sleep(self.rollup_interval)
+            await self.loop.run_in_executor(
+                self.executor, self.write, self.traffic())
+
+    async def refresh_names(self):
+        """
+        Refreshes the common names of the connected clients from the server
+        status, which is needed for clients that connected before the
+        collector started.
+        :return: None
+        """
+        try:
+            lines = await self.management.run("status", "2")
+        except openvpn.ManagementError as e:
+            logger.warning("failed to read the client status: %s", e)
+            return
+
+        status = openvpn.parse_status(lines)
+        if not status:
+            return
+
+        for client in status.clients:
+            if "Client ID" in client:
+                self.names[client["Client ID"]] = client.get("Common Name", "")
+
+    def notify(self, notification):
+        """
+        Handles the given management notification.
+        :return: None
+        """
+        if notification.type == "BYTECOUNT_CLI":
+            cid, received, sent = notification.message.split(",")[:3]
+            self.add_sample(cid, int(received), int(sent))
+
+        elif notification.type == "CLIENT":
+            event, _, args = notification.message.partition(",")
+            cid = args.split(",")[0]
+
+            if event == "DISCONNECT":
+                self.names.pop(cid, None)
+                self.samples.pop(cid, None)
+            elif "common_name" in notification.env:
+                self.names[cid] = notification.env["common_name"]
+
+    def add_sample(self, cid, received, sent):
+        """
+        Adds the byte counts of the given client to its ring buffer. The client
+        names are refreshed (at most once per interval) for unknown clients.
+        :return: None
+        """
+        now = time.monotonic()
+
+        if cid not in self.samples:
+            self.samples[cid] = collections.deque(maxlen=SAMPLES)
+        self.samples[cid].append((now, received, sent))
+
+        if cid not in self.names and now - self.refreshed_at > self.interval:
+            self.refreshed_at = now
+            asyncio.ensure_future(self.refresh_names())
+
+    def traffic(self):
+        """
+        Returns a dict that maps the common name of each client to a tuple
+        containing its bytes received, bytes sent, receive rate and send rate.
+        Clients that have not been reported for a while are dropped, since
+        their client IDs are not reused once they disconnect.
+        :return: Dict[str,Tuple[int,int,int,int]]
+        """
+        now = time.monotonic()
+        traffic = {}
+
+        for cid, samples in list(self.samples.items()):
+            if now - samples[-1][0] > self.interval * 3:
+                del self.samples[cid]
+                self.names.pop(cid, None)
+                continue
+
+            name = self.names.get(cid)
+            if not name:
+                continue
+
+            first, last = samples[0], samples[-1]
+            elapsed = last[0] - first[0]
+
+            rates = (0, 0)
+            if elapsed > 0:
+                rates = (int(max(last[1] - first[1], 0) / elapsed),
+                         int(max(last[2] - first[2], 0) / elapsed))
+
+            traffic[name] = (last[1], last[2]) + rates
+
+        return traffic
+
+    def write(self, traffic):
+        """
+        Writes the given client traffic to the database.
+        :return: None
+        """
+        if not traffic:
+            return
+
+        try:
+            models.Client.objects.update_traffic(traffic)
+        except Exception:
+            logger.exception("failed to write traffic of %s clients",
+                             len(traffic))
+        finally:
+            db.close_old_connections()
+
+    def _cancel(self):
+        """
+        Cancels the collector task. This must be run on the collector loop.
+        :return: None
+        """
+        if self.task:
+            self.task.cancel()
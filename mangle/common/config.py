@@ -1,7 +1,25 @@
+import collections
+import logging
 import os
+import threading
+import time
+
+import redis
 
 from django.conf import settings
-from mangle.common import models
+from django.db import transaction
+from django.utils.http import urlencode
+from mangle.common import models, validators
+
+
+logger = logging.getLogger(__name__)
+
+
+GENERATION_KEY = "mangle-vpn:settings:generation"
+"""str: the Redis key of the application settings generation counter."""
+
+CHANNEL = "mangle-vpn:settings"
+"""str: the Redis channel that application setting changes are published to."""
 
 
 _settings = {}
@@ -12,6 +30,186 @@ have been loaded from the database via reload(), preventing the need to run
 multiple SELECT queries each time a value is requested.
 """
 
+_state = {
+    "client": None,
+    "generation": None,
+    "listening": False,
+    "parsed": {},
+    "pid": None,
+    "snapshot": None,
+    "stale": True,
+}
+"""dict: contains the state used to determine whether the settings changed.
+
+The `generation` is the value of the Redis generation counter when the settings
+were last loaded. When a process subscribes to setting changes, `listening` is
+True while it is subscribed and `stale` is set when a change is published.
+The `parsed` dict and `snapshot` hold the typed values of the registered
+settings, which are parsed once each time the settings change.
+"""
+
+
+#######################################
+# Registry
+#######################################
+
+def parse_bool(value):
+    """
+    Returns the given setting value as a bool by checking for 'truthy' string
+    values.
+    :return: bool
+    """
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in ("true", "yes", "1", "on")
+
+
+def parse_list(value):
+    """
+    Returns the given setting value as a tuple of its lines.
+    :return: Tuple[str]
+    """
+    return tuple(str(value).split("\n"))
+
+
+class Definition:
+    """
+    Definition declares a known application setting with the function used to
+    parse its stored value, its default value and an optional validator that
+    the parsed value must pass.
+    """
+    def __init__(self, name, type=str, default=None, validator=None):
+        self.name = name
+        self.type = type
+        self.default = default
+        self.validator = validator
+
+    def parse(self, value):
+        """
+        Returns the given stored value parsed into the setting type. If the
+        value can't be parsed or is invalid, the default value is returned.
+        :return: Any
+        """
+        try:
+            parsed = self.type(value)
+        except (TypeError, ValueError):
+            logger.warning("invalid value for setting %s: %r", self.name,
+                           value)
+            return self.default
+
+        if self.validator and not self.validator(parsed):
+            logger.warning("invalid value for setting %s: %r", self.name,
+                           value)
+            return self.default
+
+        return parsed
+
+
+REGISTRY = {}
+"""dict: the known application settings mapped to their Definition."""
+
+
+def register(name, type=str, default=None, validator=None):
+    """
+    Registers a known application setting.
+    :return: None
+    """
+    REGISTRY[name] = Definition(name, type, default, validator)
+
+
+register("app_hostname")
+register("app_http_port", int, 80, validators.is_port)
+register("app_https_port", int, 443, validators.is_port)
+register("app_installed", parse_bool, False)
+register("app_organization", str, "Mangle")
+register("event_retention_days", int, 365, lambda v: v >= 0)
+register("oauth2_provider", str, "none")
+register("pki_key_algorithm", str, "rsa")
+register("pki_key_pool_size", int, 10, lambda v: v >= 0)
+register("pki_key_size", int, 2048, lambda v: v >= 2048)
+register("smtp_batch_size", int, 50, lambda v: v > 0)
+register("smtp_host")
+register("smtp_password")
+register("smtp_port", int, None, validators.is_port)
+register("smtp_rate_limit", float, 0.0, lambda v: v >= 0)
+register("smtp_reply_address")
+register("smtp_retries", int, 3, lambda v: v >= 0)
+register("smtp_tls", parse_bool, True)
+register("smtp_username")
+register("vpn_bandwidth_rollup_interval", int, 30, lambda v: v > 0)
+register("vpn_bytecount_interval", int, 5, lambda v: v >= 0)
+register("vpn_connect_workers", int, 4, lambda v: v > 0)
+register("vpn_deferred_connect", parse_bool, False)
+register("vpn_firewall_backend", str, "iptables",
+         lambda v: v in ("iptables", "nftables"))
+register("vpn_firewall_ipset", parse_bool, False)
+register("vpn_firewall_ipset_active", parse_bool, False)
+register("vpn_nameservers", parse_list, ())
+register("vpn_port", int, 1194, validators.is_port)
+register("vpn_protocol", str, "udp", lambda v: v in ("udp", "tcp"))
+register("vpn_redirect_gateway", parse_bool, False)
+register("vpn_restart_pending", parse_bool, False)
+register("vpn_routes", parse_list, ())
+register("vpn_subnet", str, "172.25.0.0/16", validators.is_cidr_network)
+
+
+Snapshot = collections.namedtuple("Snapshot", sorted(REGISTRY))
+"""type: an immutable snapshot of the typed registered setting values."""
+
+
+def snapshot():
+    """
+    Returns an immutable snapshot of the typed values of all of the registered
+    settings, which allows values to be accessed as attributes without being
+    parsed again. Settings that do not exist have their default value.
+    :return: Snapshot
+    """
+    if _state["snapshot"] is None:
+        _rebuild()
+    return _state["snapshot"]
+
+
+def _rebuild():
+    """
+    Parses the values of the registered settings and replaces the snapshot.
+    :return: None
+    """
+    parsed = {}
+    for name, definition in REGISTRY.items():
+        if name in _settings:
+            parsed[name] = definition.parse(_settings[name])
+
+    # the parsed values and snapshot are replaced rather than updated, so
+    # readers in other threads never see a partially parsed snapshot
+    _state["parsed"] = parsed
+    _state["snapshot"] = Snapshot(**{
+        name: parsed.get(name, definition.default)
+        for name, definition in REGISTRY.items()
+    })
+
+
+def _parsed(name, type):
+    """
+    Returns a tuple containing whether the given setting exists and has been
+    parsed into the given type, and the parsed value.
+    :return: Tuple[bool,Any]
+    """
+    definition = REGISTRY.get(name)
+
+    if definition is None or definition.type is not type:
+        return False, None
+
+    parsed = _state["parsed"]
+    if name in parsed:
+        return True, parsed[name]
+
+    return False, None
+
+
+#######################################
+# Settings
+#######################################
+
 
 def all():
     """
@@ -35,6 +233,11 @@ def get_int(name, default=0):
     Returns the value of the given application setting as an int.
     :return: int
     """
+    found, value = _parsed(name, int)
+    if found:
+        # an invalid value of a setting without a default is parsed as None
+        return default if value is None else value
+
     return int(get(name, default))
 
 
@@ -52,6 +255,10 @@ def get_bool(name, default=False):
     for 'truthy' string values.
     :return: bool
     """
+    found, value = _parsed(name, parse_bool)
+    if found:
+        return value
+
     value = get(name, default)
 
     if isinstance(value, bool):
@@ -68,6 +275,11 @@ def get_list(name, sep="\n"):
     given `sep` string.
     :return: List
     """
+    if sep == "\n":
+        found, value = _parsed(name, parse_list)
+        if found:
+            return list(value)
+
     return get(name, "").split(sep)
 
 
@@ -87,6 +299,8 @@ def set(name, value):
     """
     models.Setting.objects.update_or_create({"value": value}, name=name)
     _settings[name] = value
+    _rebuild()
+    _changed()
 
 
 def set_default(name, value):
@@ -118,14 +332,137 @@ def delete(name):
     if has(name):
         del _settings[name]
 
+    _rebuild()
+    _changed()
+
 
 def reload():
     """
-    Reloads the application settings from the database.
+    Reloads the application settings from the database. Settings that have been
+    deleted by another process are removed.
+    :return: None
+    """
+    values = dict(models.Setting.objects.values_list("name", "value"))
+
+    for name in [name for name in _settings if name not in values]:
+        _settings.pop(name, None)
+
+    _settings.update(values)
+    _rebuild()
+
+
+def refresh():
+    """
+    Reloads the application settings from the database only if they have been
+    changed since they were last loaded. If the process is subscribed to setting
+    changes, then this does not need to query Redis either. If Redis can't be
+    reached, then the settings are always reloaded.
     :return: None
     """
-    for setting in models.Setting.objects.all():
-        _settings[setting.name] = setting.value
+    if _state["listening"] and _state["pid"] == os.getpid():
+        if _state["stale"]:
+            # the flag is cleared before reloading, so a change published
+            # while reloading causes another reload
+            _state["stale"] = False
+            reload()
+        return
+
+    # the generation is read before reloading, so a change made while
+    # reloading causes another reload
+    current = generation()
+
+    if current is None or current != _state["generation"]:
+        reload()
+        _state["generation"] = current
+
+
+def subscribe():
+    """
+    Subscribes the process to setting changes in a background thread, so that
+    refresh() only reloads the settings after a change has been published. This
+    does nothing if the process is already subscribed.
+    :return: None
+    """
+    if _state["pid"] == os.getpid():
+        return
+
+    _state["pid"] = os.getpid()
+    _state["listening"] = False
+
+    thread = threading.Thread(target=_listen, name="config-subscriber")
+    thread.daemon = True
+    thread.start()
+
+
+def generation():
+    """
+    Returns the current generation of the application settings, which changes
+    each time a setting is changed, or None if Redis can't be reached.
+    :return: Optional[int]
+    """
+    try:
+        return int(_redis().get(GENERATION_KEY) or 0)
+    except redis.RedisError:
+        return None
+
+
+def _changed():
+    """
+    Increments the settings generation and publishes the change to subscribed
+    processes once the current database transaction has been committed.
+    :return: None
+    """
+    transaction.on_commit(_publish)
+
+
+def _publish():
+    """
+    Increments the settings generation and publishes a change notification.
+    :return: None
+    """
+    try:
+        client = _redis()
+        client.publish(CHANNEL, client.incr(GENERATION_KEY))
+    except redis.RedisError as e:
+        # other processes reload the settings on every refresh while Redis
+        # can't be reached, so they will still see the change
+        logger.warning("failed to publish settings change: %s", e)
+
+
+def _listen():
+    """
+    Listens for published setting changes and marks the settings as stale when
+    a change is received. The settings are marked stale whenever the connection
+    is (re)established, since changes may have been missed.
+    :return: None
+    """
+    while True:
+        try:
+            pubsub = redis.Redis.from_url(settings.REDIS_URL).pubsub(
+                ignore_subscribe_messages=True)
+            pubsub.subscribe(CHANNEL)
+
+            _state["stale"] = True
+            _state["listening"] = True
+
+            for _ in pubsub.listen():
+                _state["stale"] = True
+        except redis.RedisError as e:
+            logger.warning("settings subscription failed: %s", e)
+
+        _state["listening"] = False
+        time.sleep(5)
+
+
+def _redis():
+    """
+    Returns the Redis client used for the settings generation counter.
+    :return: redis.Redis
+    """
+    if _state["client"] is None:
+        _state["client"] = redis.Redis.from_url(
+            settings.REDIS_URL, socket_timeout=1, socket_connect_timeout=1)
+    return _state["client"]
 
 
 def url(*paths, **params):
@@ -134,22 +471,20 @@ def url(*paths, **params):
     base URL and with the given URL parameters.
     :return: str
     """
-    hostname = get("app_hostname")
-    port = get("app_https_port")
+    values = snapshot()
 
     # the base URL will use HTTPs by default
-    value = "https://{}".format(hostname)
+    value = "https://{}".format(values.app_hostname)
 
     # if the HTTPs port is not the standard 443 value, then append to URL
-    if port != "443":
-        value += ":{}".format(port)
+    if values.app_https_port != 443:
+        value += ":{}".format(values.app_https_port)
 
     # add each of the URL paths
-    value += "/" + "/".join(paths)
+    value = (value + "/" + "/".join(paths)).lower()
 
-    # add each of the URL keyword parameters
-    for key, val in params.items():
-        value += "?" + "{}={}&".format(key, val)
-    value = value.rstrip("&")
+    # add the URL keyword parameters as a single encoded query string
+    if params:
+        value += "?" + urlencode(params)
 
-    return value.lower()
+    return value
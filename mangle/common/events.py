@@ -0,0 +1,361 @@
+import atexit
+import gzip
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+
+from django import db
+from django.conf import settings
+from django.db.models import Q
+from mangle.common import models
+
+
+logger = logging.getLogger(__name__)
+
+
+ARCHIVE_BATCH_SIZE = 500
+"""int: the number of events read and deleted in each batch. Each batch is
+deleted by primary key, so this must stay below SQLite's 999 query parameter
+limit."""
+
+ARCHIVE_NAME = re.compile(r"^events-(\d{4}-\d{2})(?:\.(\d+))?\.ndjson\.gz$")
+"""re.Pattern: matches the name of an archive file and captures its month and
+part number. Each archive run adds a new part for the months it archives, so
+archive files are never modified once written."""
+
+_writer = None
+"""EventWriter: the running event writer, or None if events are written
+synchronously."""
+
+
+#######################################
+# Recording
+#######################################
+
+def record(name, user, detail=""):
+    """
+    Records a user event. If the event writer has been started, then the event
+    is buffered and written with other events in bulk. Otherwise, the event is
+    written immediately.
+    :return: None
+    """
+    event = models.Event(name=name, user=user, detail=detail)
+
+    if _writer is not None and _writer.is_alive():
+        _writer.add(event)
+    else:
+        event.save()
+
+
+def start(batch_size=100, interval=1.0):
+    """
+    Starts the event writer for the current process. Buffered events are
+    written once `batch_size` events are waiting or `interval` seconds have
+    passed, and are flushed when the process exits.
+    :return: EventWriter
+    """
+    global _writer
+
+    if _writer is None or not _writer.is_alive():
+        _writer = EventWriter(batch_size, interval)
+        _writer.start()
+        atexit.register(stop)
+
+    return _writer
+
+
+def stop():
+    """
+    Stops the event writer after flushing all of the buffered events. Events
+    recorded afterwards are written immediately.
+    :return: None
+    """
+    global _writer
+
+    if _writer is not None:
+        _writer.stop()
+        _writer = None
+
+
+class EventWriter(threading.Thread):
+    """
+    EventWriter is a background thread that writes buffered events to the
+    database with a single bulk INSERT per batch, so a burst of events is a
+    handful of short write transactions rather than one per event.
+    """
+    def __init__(self, batch_size=100, interval=1.0):
+        super().__init__(name="event-writer", daemon=True)
+        self.batch_size = batch_size
+        self.interval = interval
+        self.events = []
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+
+    def add(self, event):
+        """
+        Adds the given event to the buffer and wakes the writer if a full batch
+        is waiting.
+        :return: None
+        """
+        with self.lock:
+            self.events.append(event)
+            full = len(self.events) >= self.batch_size
+
+        if full:
+            self.wakeup.set()
+
+    def run(self):
+        """
+        Writes the buffered events until the writer is stopped.
+        :return: None
+        """
+        try:
+            while not self.stopped.is_set():
+                self.wakeup.wait(self.interval)
+                self.wakeup.clear()
+                self.flush()
+        finally:
+            db.connection.close()
+
+    def flush(self):
+        """
+        Writes all of the buffered events to the database.
+        :return: None
+        """
+        with self.lock:
+            events, self.events = self.events, []
+
+        if not events:
+            return
+
+        try:
+            models.Event.objects.bulk_create(events, self.batch_size)
+        except Exception:
+            logger.exception("failed to write %s events", len(events))
+
+    def stop(self):
+        """
+        Stops the writer thread and writes any events that are still buffered.
+        :return: None
+        """
+        self.stopped.set()
+        self.wakeup.set()
+        self.join()
+
+        # events added while the thread was stopping are written here
+        self.flush()
+        db.connection.close()
+
+
+#######################################
+# Archive
+#######################################
+
+def archive(before, batch_size=ARCHIVE_BATCH_SIZE):
+    """
+    Moves all of the events created before the given datetime into the monthly
+    compressed archive files and returns the number of archived events. The
+    events of each month are written to a new archive part, which is synced to
+    disk before any of the events are deleted, so a failure never loses events
+    (at worst they are archived twice). The events are then deleted in bounded
+    batches, so the database write lock is only held for a short time.
+    :return: int
+    """
+    queryset = models.Event.objects.filter(created_at__lt=before).order_by(
+        "created_at", "id")
+
+    rows = queryset.values(
+        "id", "created_at", "name", "detail", "user_id", "user__email",
+    ).iterator(chunk_size=batch_size)
+
+    parts = {}
+    last = None
+
+    try:
+        for event in rows:
+            month = event["created_at"].strftime("%Y-%m")
+            if month not in parts:
+                parts[month] = ArchivePart(month)
+
+            parts[month].write(_archive_record(event))
+            last = event
+
+        for part in parts.values():
+            part.commit()
+    finally:
+        for part in parts.values():
+            part.discard()
+
+    if last is None:
+        return 0
+
+    # only the archived events are deleted, up to the last archived event
+    archived = queryset.filter(
+        Q(created_at__lt=last["created_at"]) |
+        Q(created_at=last["created_at"], id__lte=last["id"]))
+
+    total = 0
+
+    while True:
+        ids = list(archived.values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+
+        models.Event.objects.filter(pk__in=ids).delete()
+        total += len(ids)
+
+    return total
+
+
+def archive_months():
+    """
+    Returns a sorted list containing the months that have archived events, in
+    the YYYY-MM format.
+    :return: List[str]
+    """
+    if not os.path.isdir(settings.EVENT_ARCHIVE_DIR):
+        return []
+
+    months = set()
+    for name in os.listdir(settings.EVENT_ARCHIVE_DIR):
+        match = ARCHIVE_NAME.match(name)
+        if match:
+            months.add(match.group(1))
+
+    return sorted(months)
+
+
+def archive_path(month, part=0):
+    """
+    Returns the path of the archive file for the given YYYY-MM month and part.
+    The first part of a month has no part number.
+    :return: str
+    """
+    if part:
+        name = "events-{}.{}.ndjson.gz".format(month, part)
+    else:
+        name = "events-{}.ndjson.gz".format(month)
+
+    return os.path.join(settings.EVENT_ARCHIVE_DIR, name)
+
+
+def archive_parts(month):
+    """
+    Returns a sorted list containing the part numbers of the archive files of
+    the given YYYY-MM month.
+    :return: List[int]
+    """
+    if not os.path.isdir(settings.EVENT_ARCHIVE_DIR):
+        return []
+
+    parts = []
+    for name in os.listdir(settings.EVENT_ARCHIVE_DIR):
+        match = ARCHIVE_NAME.match(name)
+        if match and match.group(1) == month:
+            parts.append(int(match.group(2) or 0))
+
+    return sorted(parts)
+
+
+def read_archive(month, search=None):
+    """
+    Yields each archived event of the given month as an NDJSON line. If a
+    `search` value is given, then only events whose name, detail or user
+    e-mail contain the value are yielded. The archive is streamed, so it is
+    never loaded into memory as a whole.
+    :return: Iterator[str]
+    """
+    search = search.lower() if search else None
+
+    for part in archive_parts(month):
+        path = archive_path(month, part)
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if search:
+                    event = json.loads(line)
+                    values = (event["name"], event["detail"],
+                              event["user_email"])
+
+                    if not any(search in (v or "").lower() for v in values):
+                        continue
+
+                yield line
+
+
+def _archive_record(event):
+    """
+    Returns the given event values as an archive record.
+    :return: dict
+    """
+    return {
+        "id": str(event["id"]),
+        "created_at": event["created_at"].isoformat(),
+        "name": event["name"],
+        "detail": event["detail"],
+        "user_id": str(event["user_id"]) if event["user_id"] else None,
+        "user_email": event["user__email"],
+    }
+
+
+class ArchivePart:
+    """
+    ArchivePart writes the archived events of a month to a new archive file.
+    The events are written to a temporary file, which is synced to disk and
+    renamed to the next part of the month once committed, so a crash or a full
+    disk never leaves a partially written archive file behind.
+    """
+    def __init__(self, month):
+        self.month = month
+        self.path = None
+
+        os.makedirs(settings.EVENT_ARCHIVE_DIR, 0o700, exist_ok=True)
+
+        fd, self.tmp_path = tempfile.mkstemp(
+            prefix=".events-{}.".format(month), dir=settings.EVENT_ARCHIVE_DIR)
+        self.file = os.fdopen(fd, "wb")
+        self.gzip = gzip.GzipFile(fileobj=self.file, mode="wb")
+
+    def write(self, record):
+        """
+        Writes the given archive record.
+        :return: None
+        """
+        self.gzip.write(bytes(json.dumps(record) + "\n", "utf-8"))
+
+    def commit(self):
+        """
+        Syncs the archive file to disk and renames it to the next part of the
+        month.
+        :return: None
+        """
+        self.gzip.close()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+        parts = archive_parts(self.month)
+        path = archive_path(self.month, parts[-1] + 1 if parts else 0)
+        os.replace(self.tmp_path, path)
+        self.path = path
+
+        # the rename is only durable once the directory is synced
+        fd = os.open(settings.EVENT_ARCHIVE_DIR, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def discard(self):
+        """
+        Removes the temporary file if the archive file was not committed.
+        :return: None
+        """
+        if self.path is None:
+            self.gzip.close()
+            self.file.close()
+            os.unlink(self.tmp_path)
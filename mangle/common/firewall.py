@@ -0,0 +1,260 @@
+import difflib
+import ipaddress
+import shlex
+
+from mangle.common import iptables, ipset, models, nftables
+
+
+CLIENTS_CHAIN = "MangleVPN_Clients"
+"""str: the name of the chain that sends client traffic to the group chains."""
+
+GROUP_CHAIN_PREFIX = "MangleVPN_Group_"
+"""str: the prefix of every group firewall chain name."""
+
+
+def reconcile(tx=None):
+    """
+    Reconciles the live iptables group chains and client rules with the rules
+    computed from the groups, firewall rules and clients in the database. The
+    live rules are read with a single iptables-save call and only the rules
+    that differ are changed. If an iptables Transaction is given, then the
+    changes are added to it instead of being applied immediately.
+    :return: None
+    """
+    if nftables.enabled():
+        return
+
+    live = iptables.get_table_rules("filter")
+    groups = list(models.Group.objects.filter(is_enabled=True).all())
+
+    with iptables.transaction(tx) as tx:
+        # the client rules are reconciled first, so that rules referencing an
+        # orphaned group chain are removed before the chain is deleted
+        _reconcile_unordered(tx, CLIENTS_CHAIN, live.get(CLIENTS_CHAIN),
+                             desired_client_rules(groups))
+
+        desired = desired_group_rules(groups)
+
+        for group in groups:
+            _reconcile_ordered(tx, group.chain, live.get(group.chain),
+                               desired[group.id])
+
+        chains = set(group.chain for group in groups)
+
+        for chain in live:
+            if chain.startswith(GROUP_CHAIN_PREFIX) and chain not in chains:
+                tx.delete_chain("filter", chain)
+
+
+def reconcile_group(group):
+    """
+    Reconciles the live firewall chain of the given group with the group's
+    firewall rules, changing only the rules that differ.
+    :return: bool
+    """
+    if nftables.enabled():
+        return group.create_firewall_chain()
+
+    code, out, err = iptables.run_output("-t", "filter", "-S", group.chain)
+
+    live = None
+    if code == 0:
+        live = [rule.split(None, 2)[2] for rule in iptables.parse_rules(out)]
+
+    with iptables.transaction() as tx:
+        _reconcile_ordered(tx, group.chain, live,
+                           desired_group_rules([group])[group.id])
+
+    return True
+
+
+def move_clients(clients, old_groups):
+    """
+    Moves the firewall rules of the given clients from their user's previous
+    group to their user's current group, where `old_groups` maps each user ID
+    to their previous Group. When iptables rules are used, the client rules
+    are reconciled once instead of being moved one at a time.
+    :return: None
+    """
+    if not nftables.enabled() and not ipset.enabled():
+        reconcile()
+        return
+
+    for client in clients:
+        old_group = old_groups.get(client.device.user_id)
+        if old_group:
+            client.delete_firewall_rule(old_group)
+        client.create_firewall_rule()
+
+
+def reconcile_clients():
+    """
+    Reconciles the live client firewall rules with the clients in the database
+    in a single batch. With iptables only the client rules that differ are
+    changed, with ipset only the set entries that differ are changed, and with
+    nftables the clients map is atomically replaced.
+    :return: bool
+    """
+    groups = list(models.Group.objects.filter(is_enabled=True).all())
+    clients = models.Client.objects.select_related("device__user").filter(
+        device__user__group__in=groups)
+
+    if nftables.enabled():
+        clients = clients.select_related("device__user__group")
+        elements = [client.nft_element for client in clients]
+        return nftables.replace_map(nftables.VPN_TABLE, "clients", elements)
+
+    if not ipset.enabled():
+        reconcile()
+        return True
+
+    names = {group.id: group.set_name for group in groups}
+    desired = {name: set() for name in names.values()}
+
+    for client in clients:
+        desired[names[client.user.group_id]].add(client.virtual_ip)
+
+    commands = []
+    for name, entries in ipset.members(desired).items():
+        for entry in sorted(entries - desired[name]):
+            commands.append("del {} {}".format(name, entry))
+        for entry in sorted(desired[name] - entries):
+            commands.append("add {} {}".format(name, entry))
+
+    return ipset.restore(commands)
+
+
+def desired_group_rules(groups):
+    """
+    Returns a dict that maps each of the given group IDs to the list of rules
+    its firewall chain should contain, in canonical iptables-save form.
+    :return: Dict[UUID,List[str]]
+    """
+    rules = {group.id: [] for group in groups}
+
+    queryset = models.FirewallRule.objects.filter(
+        group__in=groups,
+        is_enabled=True,
+    ).order_by(*models.FirewallRule.chain_ordering)
+
+    for rule in queryset:
+        rules[rule.group_id].append(canonical(rule.args))
+
+    # each group will have a default DROP rule at the end
+    for group_rules in rules.values():
+        group_rules.append(canonical(["-j", "DROP"]))
+
+    return rules
+
+
+def desired_client_rules(groups):
+    """
+    Returns the list of rules the clients chain should contain for the given
+    groups, in canonical iptables-save form.
+    :return: List[str]
+    """
+    if ipset.enabled():
+        ipset.create_all([group.set_name for group in groups])
+        return [canonical(group.set_rule) for group in groups]
+
+    clients = models.Client.objects.select_related("device__user")
+    chains = {group.id: group.chain for group in groups}
+
+    rules = []
+    for client in clients.all():
+        chain = chains.get(client.user.group_id)
+        if chain:
+            rules.append(canonical(["-s", client.virtual_ip, "-j", chain]))
+
+    return rules
+
+
+def canonical(args):
+    """
+    Returns the given iptables rule arguments in the canonical form printed by
+    iptables-save, which allows rules to be compared with the live rules. This
+    only handles the arguments used by the application rules.
+    :return: str
+    """
+    tokens = shlex.split(" ".join([str(arg) for arg in args]))
+    rule = []
+    protocol = None
+
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        value = tokens[i + 1] if i + 1 < len(tokens) else None
+
+        if token in ("-s", "-d") and value:
+            # addresses are always printed in CIDR notation
+            try:
+                value = str(ipaddress.ip_network(value, strict=False))
+            except ValueError:
+                pass
+            rule.extend([token, value])
+            i += 2
+        elif token == "-p" and value:
+            # the 'all' protocol is the default and is not printed
+            protocol = value
+            if value != "all":
+                rule.extend([token, value])
+            i += 2
+        elif token in ("--dport", "--sport") and protocol and "-m" not in rule:
+            # single ports are printed with the implicit protocol match
+            rule.extend(["-m", protocol, token])
+            i += 1
+        else:
+            rule.append("-m" if token == "--match" else token)
+            i += 1
+
+    return " ".join(rule)
+
+
+def _reconcile_ordered(tx, chain, live, desired):
+    """
+    Adds the operations needed to turn the `live` rules of the given chain into
+    the `desired` rules, where the order of the rules is significant. Rules
+    are deleted and inserted by position, and the operations are added from
+    the end of the chain so that earlier positions are not shifted.
+    :return: None
+    """
+    if live is None:
+        tx.create_chain("filter", chain)
+        live = []
+
+    matcher = difflib.SequenceMatcher(a=live, b=desired, autojunk=False)
+
+    for tag, i1, i2, j1, j2 in reversed(matcher.get_opcodes()):
+        if tag == "equal":
+            continue
+
+        for position in range(i2, i1, -1):
+            tx.run("-t", "filter", "-D", chain, position)
+
+        for offset, rule in enumerate(desired[j1:j2]):
+            tx.insert_rule("filter", chain, i1 + offset + 1, rule)
+
+
+def _reconcile_unordered(tx, chain, live, desired):
+    """
+    Adds the operations needed to turn the `live` rules of the given chain into
+    the `desired` rules, where the order of the rules is not significant.
+    :return: None
+    """
+    if live is None:
+        tx.create_chain("filter", chain)
+        live = []
+
+    wanted = set(desired)
+    seen = set()
+
+    # duplicate rules are deleted as well
+    for rule in live:
+        if rule not in wanted or rule in seen:
+            tx.delete_rule("filter", chain, rule)
+        seen.add(rule)
+
+    for rule in desired:
+        if rule not in seen:
+            tx.append_rule("filter", chain, rule)
+            seen.add(rule)
@@ -0,0 +1,182 @@
+import json
+import logging
+import os
+import socket
+import socketserver
+
+from concurrent.futures import ThreadPoolExecutor
+from django import db
+from mangle.common import config
+from mangle.common.utils import fs
+
+
+logger = logging.getLogger(__name__)
+
+
+def call(path, action, env=None, args=None, timeout=30):
+    """
+    Sends the given hook action to the hook server listening on the UNIX
+    socket at the given path and returns the hook exit code.
+    :return: int
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+
+    try:
+        sock.connect(path)
+        sock.sendall(encode({
+            "action": action,
+            "args": list(args or []),
+            "env": dict(env or {}),
+        }))
+        return int(decode(sock.makefile("rb").readline()).get("code", 1))
+    finally:
+        sock.close()
+
+
+def encode(message):
+    """
+    Returns the given hook message encoded as a single JSON line.
+    :return: bytes
+    """
+    return bytes(json.dumps(message) + "\n", "utf-8")
+
+
+def decode(data):
+    """
+    Returns the hook message decoded from the given JSON line. An empty dict is
+    returned if the line cannot be decoded.
+    :return: dict
+    """
+    try:
+        return json.loads(data.decode("utf-8"))
+    except ValueError:
+        return {}
+
+
+def write_status(path, status):
+    """
+    Writes the given deferred hook status to the file at the given path. The
+    status is 2 while deferred, and 1 or 0 once the hook succeeds or fails.
+    The file is replaced atomically, since OpenVPN polls it while the hook is
+    running and must never read an empty file.
+    :return: None
+    """
+    fs.write_file_atomic(path, str(status))
+
+
+class HookServer(socketserver.UnixStreamServer):
+    """
+    HookServer is a long-lived UNIX socket server that runs the OpenVPN client
+    hooks on behalf of the hook shim that OpenVPN executes. This allows each
+    OpenVPN client event to be handled without booting the application.
+
+    Hooks with an action in `deferred` are run on a worker pool when OpenVPN
+    supports deferring them (OpenVPN 2.5+ `client_connect_deferred_file`),
+    which lets OpenVPN continue with other handshakes while the hook runs.
+    """
+    def __init__(self, path, hooks, deferred=(), workers=4):
+        self.hooks = hooks
+        self.deferred = deferred
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+        # remove the socket file left behind by a previous server
+        if os.path.exists(path):
+            os.unlink(path)
+
+        super().__init__(path, HookRequestHandler)
+        os.chmod(path, 0o600)
+
+    def server_close(self):
+        """
+        Waits for any deferred hooks to finish and closes the server.
+        :return: None
+        """
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+    def dispatch(self, action, env, args=None):
+        """
+        Runs the hook with the given action and returns the hook exit code.
+        :return: int
+        """
+        if action not in self.hooks:
+            logger.error("unknown hook action: %s", action)
+            return 1
+
+        # the server outlives the settings that it started with, so make sure
+        # they are fresh before running the hook
+        config.refresh()
+
+        if action in self.deferred and env.get("client_connect_deferred_file"):
+            return self.defer(action, env)
+
+        try:
+            return self.run_hook(action, env)
+        finally:
+            db.close_old_connections()
+
+    def defer(self, action, env):
+        """
+        Marks the hook as deferred for OpenVPN and runs the hook on the worker
+        pool. The hook result is written to the deferred file once finished.
+        :return: int
+        """
+        write_status(env["client_connect_deferred_file"], 2)
+        self.executor.submit(self.run_deferred_hook, action, env)
+        return 0
+
+    def run_deferred_hook(self, action, env):
+        """
+        Runs the deferred hook and writes the client config and hook result to
+        the files given by OpenVPN.
+        :return: None
+        """
+        try:
+            code = self.run_hook(action, env)
+        finally:
+            # each worker thread has its own database connection
+            db.connection.close()
+
+        # the client config file must be written before the result, since
+        # OpenVPN reads the config file as soon as the result is available
+        config_file = env.get("client_connect_config_file")
+        if config_file:
+            with open(config_file, "w") as f:
+                f.write("")
+
+        write_status(env["client_connect_deferred_file"], 1 if code == 0 else 0)
+
+    def run_hook(self, action, env):
+        """
+        Runs the hook with the given action and returns the hook exit code.
+        :return: int
+        """
+        db.close_old_connections()
+
+        try:
+            return 0 if self.hooks[action](env) else 1
+        except Exception:
+            logger.exception("hook action failed: %s", action)
+            return 1
+
+
+class HookRequestHandler(socketserver.StreamRequestHandler):
+    """
+    HookRequestHandler reads a single JSON encoded hook message from the shim
+    and responds with the hook exit code.
+    """
+    def handle(self):
+        """
+        Handles a single hook request.
+        :return: None
+        """
+        message = decode(self.rfile.readline())
+
+        code = self.server.dispatch(
+            action=message.get("action", ""),
+            env=message.get("env", {}),
+            args=message.get("args", []),
+        )
+
+        self.wfile.write(encode({"code": code}))
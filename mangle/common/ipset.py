@@ -0,0 +1,119 @@
+from mangle.common import config
+from .utils import bash
+
+
+def enabled():
+    """
+    Returns whether client group membership is managed using ipset sets for
+    the running OpenVPN server. This is set from the `vpn_firewall_ipset`
+    setting when the OpenVPN server starts.
+    :return: bool
+    """
+    return config.get_bool("vpn_firewall_ipset_active", False)
+
+
+def create(name, type="hash:ip"):
+    """
+    Creates the given set. If the set already exists, this does nothing.
+    :return: bool
+    """
+    return run("create", name, type, "-exist")
+
+
+def create_all(names, type="hash:ip"):
+    """
+    Creates all of the given sets with a single `ipset restore` call. Sets
+    that already exist are left as they are.
+    :return: bool
+    """
+    return restore(["create {} {}".format(name, type) for name in names])
+
+
+def restore(commands):
+    """
+    Runs all of the given ipset commands (eg. 'add <set> <entry>') with a
+    single `ipset restore` call. Existing entries and sets are ignored.
+    :return: bool
+    """
+    if not commands:
+        return True
+
+    script = "".join([command + "\n" for command in commands])
+    code, out, err = bash.run_output("ipset", "restore", "-exist", input=script)
+    return code == 0
+
+
+def members(names):
+    """
+    Returns a dict that maps each of the given sets to the set of its entries,
+    read with a single `ipset save` call. Sets that don't exist are empty.
+    :return: Dict[str,Set[str]]
+    """
+    entries = {name: set() for name in names}
+
+    code, out, err = run_output("save")
+    for line in out.splitlines():
+        fields = line.split()
+        if len(fields) >= 3 and fields[0] == "add" and fields[1] in entries:
+            entries[fields[1]].add(fields[2])
+
+    return entries
+
+
+def destroy(name):
+    """
+    Destroys the given set. The set must not be referenced by any rules.
+    :return: bool
+    """
+    return run("destroy", name)
+
+
+def flush(name):
+    """
+    Deletes all of the entries from the given set.
+    :return: bool
+    """
+    return run("flush", name)
+
+
+def add(name, entry):
+    """
+    Adds the given entry to a set. If the entry already exists, this does
+    nothing.
+    :return: bool
+    """
+    return run("add", name, entry, "-exist")
+
+
+def delete(name, entry):
+    """
+    Deletes the given entry from a set. If the entry doesn't exist, this does
+    nothing.
+    :return: bool
+    """
+    return run("del", name, entry, "-exist")
+
+
+def set_exists(name):
+    """
+    Returns whether the given set exists.
+    :return: bool
+    """
+    return run("list", name, "-name")
+
+
+def run(*args):
+    """
+    Returns whether the given ipset command executed successfully.
+    :return: bool
+    """
+    code, out, err = run_output(*args)
+    return code == 0
+
+
+def run_output(*args):
+    """
+    Returns the output returned from the given ipset command.
+    :return: Tuple[int,str,str]
+    """
+    return bash.run_output("ipset", *args)
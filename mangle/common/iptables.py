@@ -1,6 +1,13 @@
+import contextlib
+import logging
+import shlex
+
 from .utils import bash
 
 
+logger = logging.getLogger(__name__)
+
+
 def get_chains(table):
     """
     Returns a list containing all of the chains from the given table.
@@ -11,7 +18,7 @@ def get_chains(table):
     chains = []
     for line in out.split("\n"):
         if line.startswith("-N"):
-            chains.append(line.split("-N")[1])
+            chains.append(line.split()[1])
 
     return chains
 
@@ -26,6 +33,26 @@ def get_rules(table, chain=""):
     return parse_rules(out)
 
 
+def get_table_rules(table):
+    """
+    Returns a dict that maps each chain in the given table to a list of the
+    chain's rules (without the leading '-A <chain>'), read from a single
+    iptables-save call.
+    :return: Dict[str,List[str]]
+    """
+    code, out, err = bash.run_output("iptables-save", "-t", table)
+
+    chains = {}
+    for line in out.split("\n"):
+        if line.startswith(":"):
+            chains.setdefault(line[1:].split()[0], [])
+        elif line.startswith("-A"):
+            _, chain, rule = (line.split(None, 2) + [""])[:3]
+            chains.setdefault(chain, []).append(rule)
+
+    return chains
+
+
 def flush(table, chain=""):
     """
     Flushes all of the rules from the given chain. If the chain is not given,
@@ -182,3 +209,170 @@ def run_output(*args):
 
     # only execute the command if args were given
     return bash.run_output("iptables", "--wait", *args)
+
+
+@contextlib.contextmanager
+def transaction(tx=None):
+    """
+    Yields an iptables Transaction which is committed when the context exits.
+    If an existing Transaction is given, then it is yielded instead and is left
+    for the caller to commit.
+    :return: Iterator[Transaction]
+    """
+    if tx is not None:
+        yield tx
+    else:
+        tx = Transaction()
+        yield tx
+        tx.commit()
+
+
+class Transaction:
+    """
+    Transaction collects iptables operations and applies them all at once with
+    a single atomic `iptables-restore --noflush` call, rather than starting an
+    iptables process (and taking the xtables lock) for each operation.
+
+    If the restore fails (e.g. a rule to delete doesn't exist), then each of
+    the operations is run individually as a fallback.
+    """
+    def __init__(self):
+        self.chains = {}
+        self.operations = []
+
+    def __len__(self):
+        return len(self.operations) + sum(len(c) for c in self.chains.values())
+
+    def create_chain(self, table, chain):
+        """
+        Creates the given chain. If the chain already exists, then it is
+        flushed.
+        :return: None
+        """
+        chains = self.chains.setdefault(table, [])
+        if chain not in chains:
+            chains.append(chain)
+
+    def flush(self, table, chain):
+        """
+        Flushes all of the rules from the given chain.
+        :return: None
+        """
+        self._add(table, "-F", chain)
+
+    def delete_chain(self, table, chain):
+        """
+        Deletes the given chain (flushes the chain first).
+        :return: None
+        """
+        self._add(table, "-F", chain)
+        self._add(table, "-X", chain)
+
+    def append_rule(self, table, chain, *rule):
+        """
+        Appends the given rule to the end of a chain.
+        :return: None
+        """
+        self._add(table, "-A", chain, *rule)
+
+    def insert_rule(self, table, chain, position, *rule):
+        """
+        Inserts the given rule into a specific position in a chain.
+        :return: None
+        """
+        self._add(table, "-I", chain, position, *rule)
+
+    def delete_rule(self, table, chain, *rule):
+        """
+        Deletes the first instance of the given rule from a chain.
+        :return: None
+        """
+        self._add(table, "-D", chain, *rule)
+
+    def run(self, *args):
+        """
+        Adds the given iptables command arguments (e.g. '-t nat -A ...') to
+        the transaction. If no table is given, then the filter table is used.
+        :return: None
+        """
+        args = shlex.split(" ".join([str(arg) for arg in args]))
+
+        if not args:
+            return
+
+        table = "filter"
+        if args[0] == "-t":
+            table, args = args[1], args[2:]
+
+        self._add(table, *args)
+
+    def render(self):
+        """
+        Returns the transaction in the iptables-restore format.
+        :return: str
+        """
+        tables = list(self.chains)
+        for table, _ in self.operations:
+            if table not in tables:
+                tables.append(table)
+
+        lines = []
+        for table in tables:
+            lines.append("*{}".format(table))
+
+            for chain in self.chains.get(table, []):
+                lines.append(":{} - [0:0]".format(chain))
+
+            for op_table, args in self.operations:
+                if op_table == table:
+                    lines.append(" ".join([str(arg) for arg in args]))
+
+            lines.append("COMMIT")
+
+        return "\n".join(lines) + "\n"
+
+    def commit(self):
+        """
+        Applies all of the transaction operations and returns whether they were
+        applied successfully.
+        :return: bool
+        """
+        if not len(self):
+            return True
+
+        code, out, err = bash.run_output(
+            "iptables-restore", "--noflush", "--wait", input=self.render())
+
+        if code == 0:
+            return True
+
+        logger.warning("iptables-restore failed, applying individually: %s",
+                       err)
+        return self._commit_each()
+
+    def _commit_each(self):
+        """
+        Applies each of the transaction operations with its own iptables call
+        and returns whether all of them were applied successfully.
+        :return: bool
+        """
+        ok = True
+
+        for table, chains in self.chains.items():
+            for chain in chains:
+                if not chain_exists(table, chain):
+                    ok = create_chain(table, chain) and ok
+                else:
+                    ok = flush(table, chain) and ok
+
+        for table, args in self.operations:
+            ok = run("-t", table, *args) and ok
+
+        return ok
+
+    def _add(self, table, *args):
+        """
+        Adds the given operation arguments for the given table.
+        :return: None
+        """
+        self.operations.append((table, args))
@@ -1,15 +1,57 @@
+import json
+import smtplib
+
+import redis
+
 from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from mangle.common import config, tasks
 
 
+QUEUE_KEY = "mangle-vpn:mail"
+"""str: the Redis list that queued e-mails are pushed to."""
+
+PROCESSING_KEY = "mangle-vpn:mail:processing"
+"""str: the Redis list that holds the e-mails that are being sent. E-mails are
+only removed from it once they have been sent, so the e-mails left behind by a
+failed mail task are sent again."""
+
+
 def send(recipient, subject, body):
     """
-    Sends an e-mail with the given details by calling an application task.
+    Sends an e-mail with the given details by queueing it for the mail task.
+    :return: bool
+    """
+    return send_many([(recipient, subject, body)])
+
+
+def send_many(messages):
+    """
+    Sends all of the given (recipient, subject, body) e-mails by queueing them
+    and calling the mail task once, which sends all of the queued e-mails over
+    a single SMTP connection.
     :return: bool
     """
     sender = config.get("smtp_reply_address", config.get("smtp_username"))
-    tasks.send_email(recipient, subject, body, sender)
+
+    return enqueue([(recipient, subject, body, sender)
+                    for recipient, subject, body in messages])
+
+
+def enqueue(messages):
+    """
+    Queues all of the given (recipient, subject, body, sender) e-mails and
+    calls the mail task once.
+    :return: bool
+    """
+    if not messages:
+        return True
+
+    # e-mails are pushed to the head of the queue and sent from its tail
+    _redis().lpush(QUEUE_KEY, *[json.dumps(list(msg)) for msg in messages])
+
+    tasks.send_queued_emails()
     return True
 
 
@@ -21,24 +63,85 @@ def send_template(recipient, subject, template, data=None):
     send(recipient, subject, render_to_string(template, data))
 
 
-def init():
+def queued():
+    """
+    Returns the number of queued e-mails, including the e-mails that were left
+    behind by a failed mail task.
+    :return: int
     """
-    Sets the Django SMTP settings from the application settings and returns
-    whether the application is ready to send e-mails.
+    pipe = _redis().pipeline()
+    pipe.llen(QUEUE_KEY)
+    pipe.llen(PROCESSING_KEY)
+    return sum(pipe.execute())
+
+
+def dequeue(count):
+    """
+    Moves up to the given number of queued e-mails to the processing list and
+    returns a list of tuples containing each queued item and its e-mail. Each
+    item must be acknowledged with `ack()` once its e-mail has been sent.
+    :return: List[Tuple[bytes,EmailMultiAlternatives]]
+    """
+    pipe = _redis().pipeline()
+    for _ in range(count):
+        pipe.rpoplpush(QUEUE_KEY, PROCESSING_KEY)
+
+    emails = []
+    for item in pipe.execute():
+        if item is None:
+            break
+
+        recipient, subject, body, sender = json.loads(item)
+
+        msg = EmailMultiAlternatives(subject, body, sender, (recipient, ))
+        msg.attach_alternative(body, "text/html")
+        emails.append((item, msg))
+
+    return emails
+
+
+def ack(item):
+    """
+    Removes the given queued item from the processing list once its e-mail has
+    been sent (or has failed permanently).
     :return: None
     """
-    config.reload()
+    _redis().lrem(PROCESSING_KEY, 1, item)
 
-    if not is_configured():
-        return False
 
-    settings.EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
-    settings.EMAIL_USE_TLS = config.get("smtp_tls", True)
-    settings.EMAIL_HOST = config.get("smtp_host")
-    settings.EMAIL_PORT = config.get("smtp_port")
-    settings.EMAIL_HOST_USER = config.get("smtp_username")
-    settings.EMAIL_HOST_PASSWORD = config.get("smtp_password")
-    return True
+def requeue():
+    """
+    Moves the e-mails left in the processing list by a failed mail task back to
+    the queue and returns the number of moved e-mails. This must only be called
+    while no other mail task is running.
+    :return: int
+    """
+    client = _redis()
+    count = 0
+
+    while client.rpoplpush(PROCESSING_KEY, QUEUE_KEY) is not None:
+        count += 1
+
+    return count
+
+
+def connection():
+    """
+    Returns a new SMTP connection configured from the application settings.
+    The connection is not opened until it is used.
+    :return: EmailBackend
+    """
+    values = config.snapshot()
+
+    return get_connection(
+        backend="django.core.mail.backends.smtp.EmailBackend",
+        host=values.smtp_host,
+        port=values.smtp_port,
+        username=values.smtp_username,
+        password=values.smtp_password,
+        use_tls=values.smtp_tls,
+        timeout=30,
+    )
 
 
 def is_configured():
@@ -50,3 +153,24 @@ def is_configured():
                 not config.get("smtp_port") or
                 not config.get("smtp_username") or
                 not config.get("smtp_password"))
+
+
+def is_transient_error(error):
+    """
+    Returns whether the given error raised while sending an e-mail is likely
+    to be temporary, in which case the e-mail should be retried.
+    :return: bool
+    """
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return False
+    return isinstance(error, (smtplib.SMTPServerDisconnected, OSError))
+
+
+def _redis():
+    """
+    Returns a Redis client used for the mail queue.
+    :return: redis.Redis
+    """
+    return redis.Redis.from_url(settings.REDIS_URL)
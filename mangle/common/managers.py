@@ -1,8 +1,23 @@
 from django.contrib.auth.models import BaseUserManager
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 
+QUERY_CHUNK_SIZE = 500
+"""int: the maximum number of values in a single `IN` lookup, which keeps the
+queries below SQLite's limit of 999 parameters."""
+
+
+def chunks(values, size=QUERY_CHUNK_SIZE):
+    """
+    Returns a generator that yields lists of at most `size` of the given values.
+    :return: Generator[List]
+    """
+    values = list(values)
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
 class BaseManager(models.Manager):
     @property
     def qs(self):
@@ -19,6 +34,16 @@ class BaseManager(models.Manager):
         """
         return self.qs.filter(pk=pk).first()
 
+    def filter_in(self, field, values):
+        """
+        Returns a list of querysets that together contain the models whose
+        `field` matches any of the given values, with at most
+        `QUERY_CHUNK_SIZE` values in each `IN` lookup.
+        :return: List[QuerySet]
+        """
+        lookup = "{}__in".format(field)
+        return [self.qs.filter(**{lookup: chunk}) for chunk in chunks(values)]
+
 
 class UserManager(BaseUserManager, BaseManager):
     def by_email(self, email):
@@ -28,6 +53,18 @@ class UserManager(BaseUserManager, BaseManager):
         """
         return self.qs.filter(email__iexact=email).first()
 
+    def by_emails(self, emails):
+        """
+        Returns a list containing the users with any of the given e-mail
+        addresses. E-mail addresses are stored in lowercase, so they are
+        matched case insensitively using the `email` index.
+        :return: List[User]
+        """
+        users = []
+        for queryset in self.filter_in("email", [e.lower() for e in emails]):
+            users.extend(queryset)
+        return users
+
     def get_by_natural_key(self, username):
         """
         Returns the user with the given username. This overrides the auth
@@ -100,6 +137,82 @@ class ClientManager(BaseManager):
         """
         return self.qs.filter(device__user=user)
 
+    def by_rate(self):
+        """
+        Returns a queryset containing all clients ordered by their combined
+        receive and send rates, highest first.
+        :return: QuerySet
+        """
+        return self.qs.annotate(
+            rate=models.F("rate_received") + models.F("rate_sent"),
+        ).order_by("-rate", "virtual_ip")
+
+    def update_created_at(self, created_at):
+        """
+        Updates the creation times of the clients, where `created_at` maps each
+        client ID to its creation time. The clients are updated with a single
+        UPDATE per chunk of a third of `QUERY_CHUNK_SIZE` clients, since every
+        client takes three query parameters.
+        :return: None
+        """
+        for chunk in chunks(created_at.items(), QUERY_CHUNK_SIZE // 3):
+            self.qs.filter(pk__in=[pk for pk, _ in chunk]).update(
+                created_at=models.Case(
+                    *[models.When(pk=pk, then=models.Value(value))
+                      for pk, value in chunk],
+                    output_field=models.DateTimeField(),
+                ),
+            )
+
+    def update_traffic(self, traffic):
+        """
+        Updates the traffic totals and rates of the clients, where `traffic`
+        maps each client common name to a tuple containing its bytes received,
+        bytes sent, receive rate and send rate. All of the clients are updated
+        in a single transaction.
+        :return: None
+        """
+        now = timezone.now()
+
+        with transaction.atomic():
+            for common_name, values in traffic.items():
+                self.qs.filter(common_name=common_name).update(
+                    bytes_received=values[0],
+                    bytes_sent=values[1],
+                    rate_received=values[2],
+                    rate_sent=values[3],
+                    updated_at=now,
+                )
+
+
+class RevokedDeviceManager(BaseManager):
+    def delete_expired(self):
+        """
+        Deletes all of the revoked devices whose certificates have expired and
+        returns the number of deleted devices. Expired certificates are
+        rejected by OpenVPN regardless, so they no longer need to be revoked.
+        :return: int
+        """
+        count, _ = self.qs.filter(expires_at__lte=timezone.now()).delete()
+        return count
+
+    def serials(self):
+        """
+        Returns a sorted list containing the unique serial numbers of all of
+        the revoked devices.
+        :return: List[str]
+        """
+        return sorted(set(self.qs.values_list("serial", flat=True)))
+
+
+class PooledKeyManager(BaseManager):
+    def by_key_size(self, key_size):
+        """
+        Returns a queryset containing all pooled keys of the given size.
+        :return: QuerySet
+        """
+        return self.qs.filter(key_size=key_size)
+
 
 class SettingManager(BaseManager):
     def by_name(self, name):
@@ -0,0 +1,28 @@
+# Generated by Django 2.1.7 on 2026-10-18 09:12
+
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0005_auto_20190331_1121'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PooledKey',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('key', models.TextField()),
+                ('key_size', models.IntegerField(db_index=True)),
+            ],
+            options={
+                'db_table': 'pooled_keys',
+                'ordering': ('created_at',),
+            },
+        ),
+    ]
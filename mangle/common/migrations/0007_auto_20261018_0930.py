@@ -0,0 +1,23 @@
+# Generated by Django 2.1.7 on 2026-10-18 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0006_pooledkey'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='device',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+        migrations.AddField(
+            model_name='revokeddevice',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, default=None, null=True),
+        ),
+    ]
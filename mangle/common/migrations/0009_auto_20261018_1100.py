@@ -0,0 +1,33 @@
+# Generated by Django 2.1.7 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0008_auto_20261018_1015'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='bytes_received',
+            field=models.BigIntegerField(blank=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='bytes_sent',
+            field=models.BigIntegerField(blank=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='rate_received',
+            field=models.BigIntegerField(blank=True, default=0),
+        ),
+        migrations.AddField(
+            model_name='client',
+            name='rate_sent',
+            field=models.BigIntegerField(blank=True, default=0),
+        ),
+    ]
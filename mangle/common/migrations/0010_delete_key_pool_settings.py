@@ -0,0 +1,25 @@
+# Generated by Django 2.1.7 on 2026-10-19 09:00
+
+from django.db import migrations
+
+
+def delete_key_pool_settings(apps, schema_editor):
+    """
+    Deletes the key pool counters, which are now kept in Redis.
+    :return: None
+    """
+    Setting = apps.get_model("common", "Setting")
+    Setting.objects.filter(
+        name__in=("pki_key_pool_hits", "pki_key_pool_misses")).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0009_auto_20261018_1100'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_key_pool_settings,
+                             migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 2.1.7 on 2026-10-19 09:10
+
+from django.db import migrations
+
+
+def delete_crl_digest_setting(apps, schema_editor):
+    """
+    Deletes the CRL digest, which is now kept next to the CRL file.
+    :return: None
+    """
+    Setting = apps.get_model("common", "Setting")
+    Setting.objects.filter(name="pki_crl_digest").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0010_delete_key_pool_settings'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_crl_digest_setting,
+                             migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 2.1.7 on 2026-10-19 10:00
+
+from django.db import migrations
+
+
+def lowercase_emails(apps, schema_editor):
+    """
+    Lowercases the users' e-mail addresses, which are now always saved in
+    lowercase. If the addresses of any users only differ by case, then the
+    migration fails with a list of those users, since lowercasing them would
+    give several users the same address. They must be changed or deleted
+    before the migration is run again.
+    :return: None
+    """
+    User = apps.get_model("common", "User")
+
+    users = {}
+    for pk, email in User.objects.values_list("id", "email"):
+        users.setdefault(email.lower(), []).append((pk, email))
+
+    conflicts = sorted(
+        ", ".join(sorted(email for _, email in accounts))
+        for accounts in users.values() if len(accounts) > 1
+    )
+
+    if conflicts:
+        raise RuntimeError(
+            "the e-mail addresses of these users only differ by case and "
+            "must be changed or deleted before they can be lowercased: "
+            "{}".format("; ".join(conflicts)))
+
+    for lowercase, accounts in users.items():
+        pk, email = accounts[0]
+        if email != lowercase:
+            User.objects.filter(pk=pk).update(email=lowercase)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0011_delete_crl_digest_setting'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
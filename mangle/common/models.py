@@ -1,4 +1,3 @@
-import copy
 import uuid
 import pyotp
 
@@ -6,7 +5,7 @@ from django.contrib.auth.models import AbstractBaseUser
 from django.utils.crypto import get_random_string
 from django.db import models
 from django.utils import timezone
-from mangle.common import config, iptables, managers, pki
+from mangle.common import config, iptables, ipset, managers, nftables, pki
 
 
 class Model(models.Model):
@@ -18,18 +17,41 @@ class Model(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    tracked_fields = ()
+    """Tuple[str]: the fields whose changes are tracked since the model was
+    loaded or last saved. Only these fields are snapshotted, so models that
+    do not track any fields pay nothing for change tracking."""
+
     class Meta:
         abstract = True
         ordering = ("id", )
 
     def __init__(self, *args, **kwargs):
         """
-        Creates a shallow copy of the object and stores it in the _original
-        property so it can be determined if any fields changed values since it
-        was first loaded.
+        Snapshots the values of the model's tracked fields so it can be
+        determined if any of them changed values since it was first loaded.
         """
         super().__init__(*args, **kwargs)
-        self.original = copy.copy(self)
+        self._loaded = self._tracked_values()
+
+    def save(self, *args, **kwargs):
+        """
+        Saves the model and snapshots the saved values of the tracked fields.
+        The post-save signal receivers still see the changed fields.
+        :return: None
+        """
+        super().save(*args, **kwargs)
+        self._loaded = self._tracked_values()
+
+    @property
+    def changed_fields(self):
+        """
+        Returns the set of tracked fields whose values have changed since the
+        model was loaded or last saved.
+        :return: Set[str]
+        """
+        current = self._tracked_values()
+        return {f for f, value in current.items() if value != self._loaded[f]}
 
     @property
     def exists(self):
@@ -41,11 +63,31 @@ class Model(models.Model):
 
     def has_changed(self, field: str):
         """
-        Returns whether the given model field valid has changed since the model
-        was initially loaded.
+        Returns whether the given tracked model field value has changed since
+        the model was loaded or last saved.
         :return: bool
         """
-        return getattr(self, field) == getattr(self.original, field)
+        if field not in self.tracked_fields:
+            raise ValueError("field is not tracked: {}".format(field))
+        return field in self.changed_fields
+
+    def previous(self, field: str):
+        """
+        Returns the value the given tracked model field had when the model was
+        loaded or last saved.
+        :return: Any
+        """
+        if field not in self.tracked_fields:
+            raise ValueError("field is not tracked: {}".format(field))
+        return self._loaded[field]
+
+    def _tracked_values(self):
+        """
+        Returns a dict containing the current values of the tracked fields.
+        Deferred fields are read as None rather than being loaded.
+        :return: dict
+        """
+        return {f: self.__dict__.get(f) for f in self.tracked_fields}
 
 
 class User(AbstractBaseUser, Model):
@@ -62,6 +104,8 @@ class User(AbstractBaseUser, Model):
 
     objects = managers.UserManager()
 
+    tracked_fields = ("group_id", )
+
     USERNAME_FIELD = "email"
 
     class Meta:
@@ -116,8 +160,10 @@ class User(AbstractBaseUser, Model):
     def save(self, *args, **kwargs):
         """
         Sets the user's `mfa_secret` if it has not been set prior to saving.
+        The user's e-mail address is always saved in lowercase.
         :return: None
         """
+        self.email = self.email.lower()
         if not self.mfa_secret:
             self.reset_mfa()
         super().save(*args, **kwargs)
@@ -141,6 +187,7 @@ class User(AbstractBaseUser, Model):
 
 
 class Device(Model):
+    expires_at = models.DateTimeField(blank=True, default=None, null=True)
     fingerprint = models.CharField(blank=True, db_index=True, max_length=255)
     last_login = models.DateTimeField(blank=True, null=True)
     name = models.CharField(max_length=32)
@@ -169,33 +216,61 @@ class Device(Model):
         :return: KeyPair
         """
         keypair = pki.create_client_keypair(self.common_name, 3650)
+        self.expires_at = timezone.make_aware(keypair.crt.not_valid_after,
+                                              timezone.utc)
         self.fingerprint = keypair.fingerprint
         self.serial = keypair.crt.serial_number
         self.save()
         return keypair
 
 
+class PooledKey(Model):
+    key = models.TextField()
+    key_size = models.IntegerField(db_index=True)
+
+    objects = managers.PooledKeyManager()
+
+    class Meta:
+        db_table = "pooled_keys"
+        ordering = ("created_at", )
+
+
 class RevokedDevice(Model):
+    expires_at = models.DateTimeField(blank=True, default=None, null=True)
     serial = models.CharField(max_length=255)
 
+    objects = managers.RevokedDeviceManager()
+
     class Meta:
         db_table = "revoked_devices"
         ordering = ("created_at", )
 
 
 class Client(Model):
+    bytes_received = models.BigIntegerField(blank=True, default=0)
+    bytes_sent = models.BigIntegerField(blank=True, default=0)
     common_name = models.CharField(db_index=True, max_length=255, unique=True)
     device = models.OneToOneField("Device", on_delete=models.CASCADE)
     platform = models.CharField(default="", max_length=32)
+    rate_received = models.BigIntegerField(blank=True, default=0)
+    rate_sent = models.BigIntegerField(blank=True, default=0)
     remote_ip = models.CharField(max_length=32)
     virtual_ip = models.CharField(db_index=True, max_length=32, unique=True)
 
     objects = managers.ClientManager()
 
+    disconnected = False
+    """bool: whether the client already disconnected from OpenVPN, in which case
+    its connection is not killed when it is deleted."""
+
     class Meta:
         db_table = "clients"
         ordering = ("virtual_ip", )
         default_related_name = "client"
+        indexes = [
+            models.Index(fields=["-created_at", "-id"],
+                         name="clients_created_at_id_idx"),
+        ]
 
     @property
     def duration(self):
@@ -213,6 +288,15 @@ class Client(Model):
         """
         return self.user.group
 
+    @property
+    def nft_element(self):
+        """
+        Returns the nftables verdict map element that sends traffic from the
+        client to the group's firewall chain.
+        :return: str
+        """
+        return "{} : jump {}".format(self.virtual_ip, self.group.chain)
+
     @property
     def user(self):
         """
@@ -223,26 +307,45 @@ class Client(Model):
 
     def create_firewall_rule(self):
         """
-        Creates the client firewall rule.
+        Creates the client firewall rule. When ipset is enabled, the client is
+        added to the group's set instead.
         :return: bool
         """
-        iptables.append_unique_rule(
+        if nftables.enabled():
+            return nftables.add_element(
+                nftables.VPN_TABLE, "clients", self.nft_element)
+
+        if ipset.enabled():
+            return ipset.add(self.group.set_name, self.virtual_ip)
+
+        return iptables.append_unique_rule(
             "filter",
             "MangleVPN_Clients",
             "-s", self.virtual_ip,
             "-j", self.group.chain,
         )
 
-    def delete_firewall_rule(self):
+    def delete_firewall_rule(self, group=None):
         """
-        Deletes the client firewall rule.
+        Deletes the client firewall rule. When ipset is enabled, the client is
+        deleted from the group's set instead. If a `group` is given, then the
+        rule for that group is deleted instead of the user's current group.
         :return: bool
         """
-        iptables.delete_rule(
+        group = group or self.group
+
+        if nftables.enabled():
+            return nftables.delete_element(
+                nftables.VPN_TABLE, "clients", self.virtual_ip)
+
+        if ipset.enabled():
+            return ipset.delete(group.set_name, self.virtual_ip)
+
+        return iptables.delete_rule(
             "filter",
             "MangleVPN_Clients",
             "-s", self.virtual_ip,
-            "-j", self.group.chain,
+            "-j", group.chain,
         )
 
 
@@ -268,6 +371,49 @@ class Group(Model):
         """
         return "MangleVPN_Group_{}".format(str(self.id).replace("-", ""))[:28]
 
+    @property
+    def enabled_firewall_rules(self):
+        """
+        Returns the group's enabled firewall rules in the order they are added
+        to the group's firewall chain.
+        :return: QuerySet
+        """
+        return self.firewall_rules.filter(is_enabled=True).order_by(
+            *FirewallRule.chain_ordering)
+
+    @property
+    def nft_rules(self):
+        """
+        Returns a list containing all of the group's nftables firewall rules,
+        ending with the default drop rule.
+        :return: List[str]
+        """
+        rules = []
+
+        for rule in self.enabled_firewall_rules:
+            rules.append(rule.nft_rule)
+
+        rules.append("drop")
+        return rules
+
+    @property
+    def set_name(self):
+        """
+        Returns the name of the group's client ipset set.
+        :return: str
+        """
+        return "MangleVPN_Set_{}".format(str(self.id).replace("-", ""))[:31]
+
+    @property
+    def set_rule(self):
+        """
+        Returns the iptables rule that sends traffic from the group's client
+        ipset set to the group's firewall chain.
+        :return: List[str]
+        """
+        return ["-m", "set", "--match-set", self.set_name, "src",
+                "-j", self.chain, ]
+
     @property
     def clients(self):
         """
@@ -276,28 +422,59 @@ class Group(Model):
         """
         return Client.objects.filter(device__user__group_id=self.id).all()
 
-    def create_firewall_chain(self):
+    def create_firewall_chain(self, tx=None):
+        """
+        Creates the group firewall chain. If an iptables Transaction is given,
+        then the chain is added to it instead of being applied immediately.
+        :return: bool
+        """
+        if nftables.enabled():
+            return nftables.replace_chain(
+                nftables.VPN_TABLE, self.chain, self.nft_rules)
+
+        with iptables.transaction(tx) as tx:
+            tx.create_chain("filter", self.chain)
+
+            # create all of the group's firewall rules
+            for rule in self.enabled_firewall_rules:
+                tx.append_rule("filter", self.chain, *rule.args)
+
+            # each group will have a default DROP rule at the end
+            tx.append_rule("filter", self.chain, "-j", "DROP")
+
+        return True
+
+    def delete_firewall_chain(self, tx=None):
         """
-        Creates the group firewall chain.
+        Deletes the group firewall chain. If an iptables Transaction is given,
+        then the deletion is added to it instead of being applied immediately.
         :return: bool
         """
-        iptables.create_chain("filter", self.chain)
-        iptables.flush("filter", self.chain)
+        if nftables.enabled():
+            return nftables.delete_chain(nftables.VPN_TABLE, self.chain)
 
-        # create all of the group's firewall rules
-        for rule in self.firewall_rules.order_by("-action"):
-            if rule.is_enabled:
-                rule.create_firewall_rule()
+        with iptables.transaction(tx) as tx:
+            tx.delete_chain("filter", self.chain)
 
-        # each group will have a default DROP rule at the end
-        iptables.append_unique_rule("filter", self.chain, "-j DROP")
+        return True
 
-    def delete_firewall_chain(self):
+    def create_firewall_set(self):
         """
-        Deletes the group firewall chain.
+        Creates the group's client ipset set and the rule that sends traffic
+        from the set's clients to the group firewall chain.
         :return: bool
         """
-        iptables.delete_chain("filter", self.chain)
+        return (ipset.create(self.set_name) and
+                iptables.append_unique_rule(
+                    "filter", "MangleVPN_Clients", *self.set_rule))
+
+    def delete_firewall_set(self):
+        """
+        Deletes the group's client ipset set and the rule that references it.
+        :return: bool
+        """
+        iptables.delete_rule("filter", "MangleVPN_Clients", *self.set_rule)
+        return ipset.destroy(self.set_name)
 
 
 class FirewallRule(Model):
@@ -308,6 +485,9 @@ class FirewallRule(Model):
     port = models.CharField(blank=True, default="", max_length=255)
     protocol = models.CharField(blank=True, default="", max_length=255)
 
+    chain_ordering = ("-action", "created_at", )
+    """tuple: the order of the rules within the group's firewall chain."""
+
     class Meta:
         db_table = "firewall_rules"
         ordering = ("-action", )
@@ -341,6 +521,29 @@ class FirewallRule(Model):
         args.extend(["-j", self.action, ])
         return args
 
+    @property
+    def nft_rule(self):
+        """
+        Returns the firewall rule as an nftables rule.
+        :return: str
+        """
+        parts = []
+
+        if self.destination:
+            parts.append("ip daddr {}".format(self.destination))
+
+        if self.protocol and self.protocol != "all":
+            # iptables port ranges (80:443) are written as 80-443 in nftables
+            if self.port:
+                ports = [p.replace(":", "-") for p in self.port.split(",") if p]
+                parts.append("{} dport {{ {} }}".format(
+                    self.protocol, ", ".join(ports)))
+            else:
+                parts.append("meta l4proto {}".format(self.protocol))
+
+        parts.append(self.action.lower())
+        return " ".join(parts)
+
     def create_firewall_rule(self):
         """
         Creates the firewall rule.
@@ -350,9 +553,14 @@ class FirewallRule(Model):
 
     def delete_firewall_rule(self):
         """
-        Creates the firewall rule.
+        Deletes the firewall rule.
         :return: bool
         """
+        # nftables rules are deleted by handle, so the group chain is rebuilt
+        # without the rule instead
+        if nftables.enabled():
+            return self.group.create_firewall_chain()
+
         return iptables.delete_rule("filter", self.group.chain, *self.args)
 
 
@@ -365,6 +573,10 @@ class Event(Model):
         db_table = "events"
         ordering = ("-created_at", "name", )
         default_related_name = "events"
+        indexes = [
+            models.Index(fields=["-created_at", "-id"],
+                         name="events_created_at_id_idx"),
+        ]
 
 
 class Setting(Model):
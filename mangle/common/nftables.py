@@ -0,0 +1,146 @@
+import logging
+
+from mangle.common import config
+from .utils import bash
+
+
+logger = logging.getLogger(__name__)
+
+
+FAMILY = "ip"
+"""str: the nftables address family of the application tables."""
+
+VPN_TABLE = "mangle_vpn"
+"""str: the name of the nftables table containing the OpenVPN ruleset."""
+
+
+def enabled():
+    """
+    Returns whether the nftables firewall backend is used for the running
+    OpenVPN server. This is set from the `vpn_firewall_backend` setting when the
+    OpenVPN server starts.
+    :return: bool
+    """
+    return config.get("vpn_firewall_backend_active") == "nftables"
+
+
+def replace_table(table, script):
+    """
+    Atomically replaces the given table with the table defined in the given
+    nftables script. The table is created if it does not exist.
+    :return: bool
+    """
+    return apply(
+        "table {0} {1}\n"
+        "delete table {0} {1}\n"
+        "{2}".format(FAMILY, table, script)
+    )
+
+
+def delete_table(table):
+    """
+    Deletes the given table if it exists.
+    :return: bool
+    """
+    if not table_exists(table):
+        return True
+    return run("delete", "table", FAMILY, table)
+
+
+def table_exists(table):
+    """
+    Returns whether the given table exists.
+    :return: bool
+    """
+    return run("list", "table", FAMILY, table)
+
+
+def replace_chain(table, chain, rules):
+    """
+    Atomically replaces all of the rules in the given chain. The chain is
+    created if it does not exist.
+    :return: bool
+    """
+    lines = [
+        "add chain {} {} {}".format(FAMILY, table, chain),
+        "flush chain {} {} {}".format(FAMILY, table, chain),
+    ]
+
+    for rule in rules:
+        lines.append("add rule {} {} {} {}".format(FAMILY, table, chain, rule))
+
+    return apply("\n".join(lines))
+
+
+def delete_chain(table, chain):
+    """
+    Deletes the given chain (flushes the chain first).
+    :return: bool
+    """
+    return apply(
+        "flush chain {0} {1} {2}\n"
+        "delete chain {0} {1} {2}".format(FAMILY, table, chain)
+    )
+
+
+def replace_map(table, name, elements):
+    """
+    Atomically replaces all of the elements of the given map.
+    :return: bool
+    """
+    lines = ["flush map {} {} {}".format(FAMILY, table, name)]
+
+    if elements:
+        lines.append("add element {} {} {} {{ {} }}".format(
+            FAMILY, table, name, ", ".join(elements)))
+
+    return apply("\n".join(lines))
+
+
+def add_element(table, name, element):
+    """
+    Adds the given element to a set or map.
+    :return: bool
+    """
+    return apply("add element {} {} {} {{ {} }}".format(
+        FAMILY, table, name, element))
+
+
+def delete_element(table, name, element):
+    """
+    Deletes the given element from a set or map.
+    :return: bool
+    """
+    return apply("delete element {} {} {} {{ {} }}".format(
+        FAMILY, table, name, element))
+
+
+def apply(script):
+    """
+    Applies the given nftables script in a single atomic transaction and
+    returns whether it was applied successfully.
+    :return: bool
+    """
+    code, out, err = bash.run_output("nft", "-f", "-", input=script + "\n")
+
+    if code != 0:
+        logger.error("failed to apply nftables script: %s", err)
+
+    return code == 0
+
+
+def run(*args):
+    """
+    Returns whether the given nft command executed successfully.
+    :return: bool
+    """
+    code, out, err = run_output(*args)
+    return code == 0
+
+
+def run_output(*args):
+    """
+    Returns the output returned from the given nft command.
+    :return: Tuple[int,str,str]
+    """
+    return bash.run_output("nft", *args)
@@ -1,9 +1,12 @@
+import asyncio
+import collections
 import logging
+import os
 import socket
 
 from django.conf import settings
 from django.template.loader import render_to_string
-from mangle.common import config, pki
+from mangle.common import config, hooks, pki
 from mangle.common.utils import bash, net, strings
 
 
@@ -18,7 +21,12 @@ def create_server_keys():
     crt, key = pki.create_server_keypair("OpenVPN Server", 3650).pem()
     config.set("vpn_crt", crt)
     config.set("vpn_key", key)
-    config.set("vpn_dh_params", pki.create_dh_params(2048))
+
+    # Diffie-Hellman parameters are only used with RSA server keys, elliptic
+    # curve keys use ECDH instead
+    if not pki.key_curve(key):
+        config.set("vpn_dh_params", pki.create_dh_params(2048))
+
     config.set("vpn_tls_auth_key", create_tls_auth_key())
 
 
@@ -70,13 +78,15 @@ def server_config():
     :return: str
     """
     conf = render_to_string("openvpn/server.conf", {
-        "root_dir": settings.BASE_DIR,
         "bind_address": net.interface_ip(config.get("vpn_interface")),
         "bind_port": config.get("vpn_port"),
         "ca_crt": config.get("ca_crt"),
         "crl_file": settings.PKI_CRL_FILE,
         "dh_params": config.get("vpn_dh_params"),
         "domain": config.get("domain"),
+        "ecdh_curve": pki.key_curve(config.get("vpn_key")),
+        "hook_script": settings.OPENVPN_HOOK_SCRIPT,
+        "hook_socket": settings.OPENVPN_HOOK_SOCKET,
         "log_file": settings.OPENVPN_LOG_FILE,
         "managment_socket": settings.OPENVPN_MANAGEMENT_SOCKET,
         "nameservers": config.get_list("vpn_nameservers"),
@@ -103,6 +113,7 @@ def client_config(crt, key, os="windows"):
         "ca_crt": config.get("ca_crt"),
         "client_crt": crt,
         "client_key": key,
+        "ecdh_curve": pki.key_curve(config.get("vpn_key")),
         "hostname": config.get("vpn_hostname"),
         "os": os,
         "port": config.get("vpn_port"),
@@ -112,13 +123,79 @@ def client_config(crt, key, os="windows"):
     return strings.remove_empty_lines(conf)
 
 
+Status = collections.namedtuple("Status", "time clients")
+"""type: the status of the OpenVPN server.
+
+The `time` is the UNIX time the status was written, and `clients` contains a
+dict for each connected client that maps the client list column names (eg.
+'Common Name' or 'Client ID') to the client's values.
+"""
+
+
+def parse_status(lines):
+    """
+    Returns the Status parsed from the given status version 2 or 3 lines, which
+    are either read from the status file or returned by the `status 2` and
+    `status 3` management commands. None is returned if the lines do not
+    contain a client list header, eg. status version 1.
+    :return: Optional[Status]
+    """
+    columns = None
+    clients = []
+    time = None
+
+    for line in lines:
+        # status version 3 is tab delimited, version 2 is comma delimited
+        fields = line.split("\t") if "\t" in line else line.split(",")
+
+        if fields[0] == "TIME" and len(fields) > 2:
+            time = int(fields[2])
+        elif fields[:2] == ["HEADER", "CLIENT_LIST"]:
+            columns = fields[2:]
+        elif fields[0] == "CLIENT_LIST" and columns:
+            clients.append(dict(zip(columns, fields[1:])))
+
+    if columns is None:
+        return None
+
+    return Status(time, clients)
+
+
+def read_status(path=None):
+    """
+    Returns the Status read from the OpenVPN status file. None is returned if
+    the file does not exist or cannot be parsed.
+    :return: Optional[Status]
+    """
+    path = path or settings.OPENVPN_STATUS_FILE
+
+    try:
+        with open(path) as f:
+            status = parse_status(f.read().splitlines())
+        mtime = int(os.path.getmtime(path))
+    except FileNotFoundError:
+        return None
+
+    if status and status.time is None:
+        status = status._replace(time=mtime)
+
+    return status
+
+
 def kill_client(name):
     """
-    Kills the OpenVPN client connection with the given name.
+    Kills the OpenVPN client connection with the given name or address. The
+    kill is sent through the hook service, which holds the management
+    connection while it collects the client bandwidth. If the hook service is
+    not running, then the management interface is used directly.
     :return: None
     """
-    with management() as m:
-        m.run("kill", name)
+    try:
+        hooks.call(settings.OPENVPN_HOOK_SOCKET, "client-kill",
+                   env={"client": name})
+    except (FileNotFoundError, ConnectionRefusedError):
+        with management() as m:
+            m.run("kill", name)
 
 
 def management():
@@ -185,7 +262,7 @@ class Management:
         except socket.error as exc:
             logger.error("failed to open managmenet socket")
             logger.error(exc)
-            raise ValueError("failed to open management socket")
+            raise ManagementError("failed to open management socket")
 
     def _recv(self):
         """
@@ -207,3 +284,287 @@ class Management:
         :return:
         """
         self.sock.sendall(bytes(" ".join(args) + "\r\n", "utf-8"))
+
+
+#######################################
+# AsyncManagement
+#######################################
+
+Notification = collections.namedtuple("Notification", "type message env")
+"""type: a real-time notification sent by the management interface.
+
+The `type` is the notification name (eg. 'CLIENT' or 'BYTECOUNT_CLI'), the
+`message` is the text following the name, and `env` contains the environment
+sent with multi-line CLIENT notifications (empty for other notifications).
+"""
+
+CLIENT_ENV_EVENTS = ("CONNECT", "REAUTH", "ESTABLISHED", "DISCONNECT",
+                     "CR_RESPONSE")
+"""tuple: the CLIENT notifications that are followed by ENV lines."""
+
+
+class ManagementError(Exception):
+    """
+    ManagementError is raised when the management interface responds to a
+    command with an ERROR, the connection is lost before a response, or the
+    management socket cannot be opened.
+    """
+
+
+class AsyncManagement:
+    """
+    AsyncManagement is an asyncio client for the OpenVPN management UNIX socket
+    that keeps a single connection open. Commands are queued and sent one at a
+    time, and their single-line (SUCCESS/ERROR) or multi-line (END terminated)
+    responses are framed apart from the real-time notifications, which are
+    available through the `notifications()` async iterator.
+
+    The connection is re-established with an exponential backoff whenever it
+    is lost, after which the `init_commands` (eg. 'bytecount 5') are re-sent
+    before any queued commands.
+    """
+    def __init__(self, path, init_commands=(), min_delay=0.5, max_delay=30):
+        self.path = path
+        self.init_commands = list(init_commands)
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.closed = False
+        self.commands = None
+        self.connected = None
+        self.events = None
+        self.pending = None
+        self.reader = None
+        self.task = None
+        self.writer = None
+
+    async def __aenter__(self):
+        """
+        Starts the client when used as an async context manager.
+        :return: AsyncManagement
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Closes the client when used as an async context manager.
+        :return: None
+        """
+        await self.close()
+
+    async def start(self):
+        """
+        Starts the connection loop and waits until the client is connected.
+        :return: None
+        """
+        # the queues are created here so that they belong to the running loop
+        self.commands = asyncio.Queue()
+        self.events = asyncio.Queue(maxsize=10000)
+        self.connected = asyncio.Event()
+        self.task = asyncio.ensure_future(self._run())
+
+        await self.connected.wait()
+
+    async def close(self):
+        """
+        Stops the connection loop and closes the connection.
+        :return: None
+        """
+        self.closed = True
+
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+        self._disconnect()
+
+    async def run(self, *args):
+        """
+        Queues the given command and returns its response once received. The
+        response is a str for single-line responses or a list of lines for
+        multi-line responses. A ManagementError is raised if the management
+        interface responds with an ERROR.
+
+        If the caller stops waiting, eg. after a timeout, the command still
+        completes, so its response is never read as the response of the next
+        command.
+        :return: Union[str,List[str]]
+        """
+        future = asyncio.get_event_loop().create_future()
+        await self.commands.put((" ".join([str(arg) for arg in args]), future))
+        return await asyncio.shield(future)
+
+    async def notifications(self):
+        """
+        Yields each of the real-time notifications as they are received. If the
+        notifications are not consumed fast enough, the oldest are dropped.
+        :return: AsyncIterator[Notification]
+        """
+        while True:
+            yield await self.events.get()
+
+    async def _run(self):
+        """
+        Connects to the management interface and reads and writes until the
+        connection is lost, then reconnects with an exponential backoff.
+        :return: None
+        """
+        delay = self.min_delay
+
+        while not self.closed:
+            try:
+                self.reader, self.writer = await asyncio.open_unix_connection(
+                    self.path)
+            except OSError as e:
+                logger.warning("failed to open management socket: %s", e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_delay)
+                continue
+
+            delay = self.min_delay
+            tasks = [asyncio.ensure_future(self._read()),
+                     asyncio.ensure_future(self._write())]
+
+            try:
+                done, _ = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("management connection lost: %s", e)
+            finally:
+                self.connected.clear()
+
+                # the pending command is failed before the tasks are cancelled,
+                # otherwise cancelling the writer would cancel the command
+                if self.pending and not self.pending.done():
+                    self.pending.set_exception(
+                        ManagementError("management connection lost"))
+
+                for task in tasks:
+                    task.cancel()
+
+                self._disconnect()
+
+            if not self.closed:
+                await asyncio.sleep(delay)
+
+    async def _read(self):
+        """
+        Reads lines from the management interface, resolving the response of
+        the command that was sent and publishing the notifications.
+        :return: None
+        """
+        lines = []
+        client = None
+
+        while True:
+            data = await self.reader.readline()
+            if not data:
+                raise ConnectionError("management socket closed")
+
+            line = data.decode("utf-8", "replace").rstrip("\r\n")
+
+            # notifications can arrive at any time, even between the lines of
+            # a multi-line response
+            if line.startswith(">"):
+                client = self._notify(line[1:], client)
+                continue
+
+            if self.pending is None or self.pending.done():
+                logger.warning("unexpected management response: %s", line)
+                continue
+
+            if not lines and line.startswith("SUCCESS:"):
+                self.pending.set_result(line[8:].strip())
+            elif not lines and line.startswith("ERROR:"):
+                self.pending.set_exception(ManagementError(line[6:].strip()))
+            elif line == "END":
+                self.pending.set_result(lines)
+                lines = []
+            else:
+                lines.append(line)
+
+    async def _write(self):
+        """
+        Sends the init commands and then each queued command, waiting for the
+        response of each command before sending the next.
+        :return: None
+        """
+        for command in self.init_commands:
+            try:
+                await self._send(command)
+            except ManagementError as e:
+                logger.error("management command failed: %s: %s", command, e)
+
+        self.connected.set()
+
+        while True:
+            command, future = await self.commands.get()
+            if future.done():
+                continue
+
+            try:
+                await self._send(command, future)
+            except ManagementError:
+                pass
+
+    async def _send(self, command, future=None):
+        """
+        Sends the given command and returns its response. The response is set
+        on the given future, if any.
+        :return: Union[str,List[str]]
+        """
+        self.pending = future or asyncio.get_event_loop().create_future()
+        self.writer.write(bytes(command + "\r\n", "utf-8"))
+        await self.writer.drain()
+        return await self.pending
+
+    def _notify(self, line, client):
+        """
+        Publishes the notification in the given line and returns the CLIENT
+        notification whose ENV lines are still being read, if any.
+        :return: Optional[Notification]
+        """
+        name, _, message = line.partition(":")
+
+        if name == "CLIENT":
+            if message.startswith("ENV,") and client is not None:
+                if message == "ENV,END":
+                    self._publish(client)
+                    return None
+
+                key, _, value = message[4:].partition("=")
+                client.env[key] = value
+                return client
+
+            if message.split(",", 1)[0] in CLIENT_ENV_EVENTS:
+                return Notification(name, message, {})
+
+        self._publish(Notification(name, message, {}))
+        return client
+
+    def _publish(self, notification):
+        """
+        Adds the given notification to the notification queue, dropping the
+        oldest notification if the queue is full.
+        :return: None
+        """
+        if self.events.full():
+            self.events.get_nowait()
+        self.events.put_nowait(notification)
+
+    def _disconnect(self):
+        """
+        Closes the connection if it is open.
+        :return: None
+        """
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+            self.reader = None
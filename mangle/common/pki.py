@@ -1,32 +1,69 @@
+import functools
+import hashlib
+import logging
+import os
+
+import redis
+
 from datetime import datetime, timedelta
 
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import dh, rsa
-from mangle.common import config
+from cryptography.hazmat.primitives.asymmetric import dh, ec, rsa
+from django.conf import settings
+from mangle.common import config, models
+from mangle.common.utils import fs
+
 
+logger = logging.getLogger(__name__)
 
-KEY_SIZE = config.get("pki_key_size", 2048)
-"""int: the size of generated keys.
 
-Defines the number of bits that will be used when generating RSA private keys 
-and Diffie-Hellman parameters. Read from the application settings but defaults
-to 2048 bits.
+POOL_STATS_KEY = "mangle-vpn:pki:key-pool"
+"""str: the Redis hash containing the key pool hit and miss counters."""
+
+KEY_ALGORITHMS = {
+    "rsa": None,
+    "ecdsa-p256": ec.SECP256R1,
+    "ecdsa-p384": ec.SECP384R1,
+}
+"""dict: the supported private key algorithms mapped to their elliptic curve.
+
+The key algorithm is read from the `pki_key_algorithm` application setting when
+a key is generated, so the CA, server and client keys all use the algorithm
+that was configured when they were created.
 """
 
+CURVE_NAMES = {
+    "secp256r1": "prime256v1",
+    "secp384r1": "secp384r1",
+}
+"""dict: the elliptic curve names mapped to the names used by OpenSSL."""
+
 
 def certificate_authority():
     """
-    Return's the application certificate authority keypair.
+    Return's the application certificate authority keypair. The keypair is
+    only parsed once for each value of the `ca_crt` and `ca_key` settings.
     :return: KeyPair
     """
-    return load_keypair(
+    return _load_certificate_authority(
         crt=config.get("ca_crt"),
         key=config.get("ca_key"),
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _load_certificate_authority(crt, key):
+    """
+    Returns the certificate authority KeyPair parsed from the given PEM strings.
+    The result is cached by the PEM strings, so the cached KeyPair is replaced
+    as soon as the certificate authority settings change.
+    :return: KeyPair
+    """
+    return load_keypair(crt, key)
+
+
 def create_certificate_authority():
     """
     Creates and sets the application certificate authority keys.
@@ -39,10 +76,11 @@ def create_certificate_authority():
 
 def create_client_keypair(name, days):
     """
-    Returns a new client keypair.
+    Returns a new client keypair. The private key is taken from the key pool
+    when a pre-generated key is available.
     :return: KeyPair
     """
-    return create_keypair(name, days, False, False)
+    return create_keypair(name, days, False, False, pooled_private_key())
 
 
 def create_server_keypair(name, days):
@@ -53,19 +91,21 @@ def create_server_keypair(name, days):
     return create_keypair(name, days, True, False)
 
 
-def create_keypair(name, days, is_server, is_ca):
+def create_keypair(name, days, is_server, is_ca, private_key=None):
     """
-    Returns a new KeyPair.
+    Returns a new KeyPair. If a `private_key` is not given, then a new private
+    key is generated.
     :return: KeyPair
     """
-    private_key = rsa.generate_private_key(65537, KEY_SIZE, default_backend())
+    if private_key is None:
+        private_key = generate_private_key()
 
     builder = x509.CertificateBuilder(
         serial_number=x509.random_serial_number(),
         not_valid_before=datetime.now() - timedelta(days=1),
         not_valid_after=datetime.now() + timedelta(days=days),
         public_key=private_key.public_key(),
-        extensions=_get_certificate_extensions(is_server, is_ca),
+        extensions=_get_certificate_extensions(is_server, is_ca, private_key),
         subject_name=x509.Name([
             x509.NameAttribute(x509.NameOID.COMMON_NAME, name),
         ]),
@@ -84,12 +124,71 @@ def create_keypair(name, days, is_server, is_ca):
     # sign the certificate with the signer private key and return a new KeyPair
     certificate = builder.sign(
         private_key=signer.key,
-        algorithm=hashes.SHA512(),
+        algorithm=_signature_hash(signer.key),
         backend=default_backend()
     )
     return KeyPair(certificate, private_key)
 
 
+def key_algorithm():
+    """
+    Returns the configured private key algorithm. Defaults to RSA if the
+    setting is not a supported algorithm.
+    :return: str
+    """
+    algorithm = config.get("pki_key_algorithm", "rsa")
+    return algorithm if algorithm in KEY_ALGORITHMS else "rsa"
+
+
+def key_size():
+    """
+    Returns the number of bits used when generating RSA private keys and
+    Diffie-Hellman parameters. This is read from the application settings each
+    time, since the settings are not loaded when this module is imported.
+    :return: int
+    """
+    return config.get_int("pki_key_size", 2048)
+
+
+def generate_private_key():
+    """
+    Returns a new private key using the configured key algorithm.
+    :return: Union[rsa.PrivateKey,ec.EllipticCurvePrivateKey]
+    """
+    curve = KEY_ALGORITHMS[key_algorithm()]
+
+    if curve:
+        return ec.generate_private_key(curve(), default_backend())
+    return rsa.generate_private_key(65537, key_size(), default_backend())
+
+
+def key_curve(key):
+    """
+    Returns the OpenSSL name of the elliptic curve used by the given private
+    key PEM string, or None if it is not an elliptic curve key or no key is
+    given. The result is cached, since the OpenVPN server key is checked for
+    every client config that is generated.
+    :return: Optional[str]
+    """
+    if not key:
+        return None
+    return _key_curve(key)
+
+
+@functools.lru_cache(maxsize=4)
+def _key_curve(key):
+    """
+    Returns the OpenSSL name of the elliptic curve used by the given private
+    key PEM string, or None if it is not an elliptic curve key.
+    :return: Optional[str]
+    """
+    private_key = parse_private_key(key)
+
+    if isinstance(private_key, ec.EllipticCurvePrivateKey):
+        return CURVE_NAMES.get(private_key.curve.name, private_key.curve.name)
+    return None
+
+
 def create_dh_params(size=None):
     """
     Returns a new set of Diffie-Hellman parameters of the given size. If the
@@ -97,7 +196,7 @@ def create_dh_params(size=None):
     :return: str
     """
     if not size:
-        size = KEY_SIZE
+        size = key_size()
 
     params = dh.generate_parameters(2, size, default_backend())
     return encode_dh_params(params)
@@ -130,13 +229,59 @@ def create_crl(*serials):
     # sign the CRL with the certificate authority private key
     crl = builder.sign(
         private_key=signer.key,
-        algorithm=hashes.SHA512(),
+        algorithm=_signature_hash(signer.key),
         backend=default_backend(),
     )
     return encode_certificate(crl)
 
 
-def _get_certificate_extensions(is_server, is_ca):
+def update_crl(path, force=False):
+    """
+    Writes the certificate revocation list to the file at the given path and
+    returns whether the file was written. Expired revoked devices are pruned
+    first, and the CRL is only signed and written when the set of revoked
+    serial numbers or the certificate authority has changed since the last
+    write, unless `force` is True. The digest of the last write is kept in a
+    file next to the CRL file, since it describes that file rather than the
+    shared application state.
+    :return: bool
+    """
+    models.RevokedDevice.objects.delete_expired()
+    serials = models.RevokedDevice.objects.serials()
+
+    digest = hashlib.sha256()
+    digest.update(bytes(config.get("ca_crt", ""), "utf-8"))
+    digest.update(bytes("\n".join(serials), "utf-8"))
+    digest = digest.hexdigest()
+
+    # the OpenVPN server creates an empty CRL file when it is missing, which
+    # must always be replaced
+    written = os.path.isfile(path) and os.path.getsize(path) > 0
+    digest_path = path + ".sha256"
+
+    if not force and written and os.path.isfile(digest_path):
+        if fs.read_file(digest_path).strip() == digest:
+            return False
+
+    fs.write_file_atomic(path, create_crl(*serials), 0o644)
+    fs.write_file_atomic(digest_path, digest, 0o644)
+    return True
+
+
+def _signature_hash(private_key):
+    """
+    Returns the hash algorithm used when signing with the given private key.
+    Elliptic curve keys use the hash that matches the strength of the curve.
+    :return: hashes.HashAlgorithm
+    """
+    if isinstance(private_key, ec.EllipticCurvePrivateKey):
+        if private_key.curve.key_size > 256:
+            return hashes.SHA384()
+        return hashes.SHA256()
+    return hashes.SHA512()
+
+
+def _get_certificate_extensions(is_server, is_ca, private_key):
     """
     Returns a list that contains all of the certificate extensions based on the
     certificate type.
@@ -156,14 +301,16 @@ def _get_certificate_extensions(is_server, is_ca):
         value=x509.BasicConstraints(is_ca, path_length)
     ))
 
-    # KeyUsage
+    # KeyUsage, where key encipherment only applies to RSA keys
+    key_encipherment = is_server and isinstance(private_key, rsa.RSAPrivateKey)
+
     extensions.append(x509.Extension(
         oid=x509.KeyUsage.oid,
         critical=True,
         value=x509.KeyUsage(
             digital_signature=True,
             content_commitment=False,
-            key_encipherment=is_server,
+            key_encipherment=key_encipherment,
             data_encipherment=False,
             key_agreement=True,
             key_cert_sign=is_ca,
@@ -210,7 +357,7 @@ def parse_private_key(key, password=None):
     """
     Returns a private key object parsed from the given PEM string. If the
     private key requires a password, then the given password value is used.
-    :return: rsa.PrivateKey
+    :return: Union[rsa.PrivateKey,ec.EllipticCurvePrivateKey]
     """
     return serialization.load_pem_private_key(
         data=bytes(key, "utf-8"),
@@ -228,16 +375,24 @@ def encode_certificate(certificate):
     return str(data, "utf-8")
 
 
-def encode_private_key(private_key):
+def encode_private_key(private_key, password=None):
     """
-    Returns a PEM string encoded from the given RSA private key object.
+    Returns a PEM string encoded from the given private key object. If a
+    password is given, then the private key is encrypted with the password.
     :return: str
     """
-    data = private_key.private_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.TraditionalOpenSSL,
-        encryption_algorithm=serialization.NoEncryption()
-    )
+    if password:
+        data = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.BestAvailableEncryption(password)
+        )
+    else:
+        data = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.TraditionalOpenSSL,
+            encryption_algorithm=serialization.NoEncryption()
+        )
     return str(data, "utf-8")
 
 
@@ -253,13 +408,115 @@ def encode_dh_params(params):
     return str(data, "utf-8")
 
 
+#######################################
+# Key Pool
+#######################################
+
+def pooled_private_key():
+    """
+    Returns a private key taken from the pool of pre-generated private keys.
+    If the pool is empty, then a new private key is generated instead. Only
+    RSA keys are pooled, since elliptic curve keys are cheap to generate.
+    :return: Union[rsa.PrivateKey,ec.EllipticCurvePrivateKey]
+    """
+    if key_algorithm() != "rsa":
+        return generate_private_key()
+
+    for pooled in models.PooledKey.objects.by_key_size(key_size())[:5]:
+        # the key may have been taken by another process between the SELECT
+        # and DELETE, in which case nothing is deleted and the next is tried
+        deleted, _ = models.PooledKey.objects.filter(pk=pooled.pk).delete()
+
+        if deleted:
+            _count_pool("hits")
+            return parse_private_key(pooled.key, _pool_password())
+
+    _count_pool("misses")
+    return generate_private_key()
+
+
+def fill_key_pool(size):
+    """
+    Generates private keys until the key pool contains the given number of
+    keys and returns the number of keys that were generated. Pooled keys that
+    no longer match the configured key size or algorithm are deleted.
+    :return: int
+    """
+    if key_algorithm() != "rsa":
+        models.PooledKey.objects.all().delete()
+        return 0
+
+    bits = key_size()
+    models.PooledKey.objects.exclude(key_size=bits).delete()
+
+    count = size - models.PooledKey.objects.by_key_size(bits).count()
+
+    for _ in range(count):
+        models.PooledKey.objects.create(
+            key=encode_private_key(generate_private_key(), _pool_password()),
+            key_size=bits,
+        )
+
+    return max(count, 0)
+
+
+def key_pool_stats():
+    """
+    Returns the key pool size and the number of private keys that were taken
+    from (hits) or missing from (misses) the pool.
+    :return: dict
+    """
+    try:
+        counters = _redis().hgetall(POOL_STATS_KEY)
+    except redis.RedisError:
+        counters = {}
+
+    return {
+        "size": models.PooledKey.objects.by_key_size(key_size()).count(),
+        "target": config.get_int("pki_key_pool_size", 10),
+        "hits": int(counters.get(b"hits", 0)),
+        "misses": int(counters.get(b"misses", 0)),
+    }
+
+
+def _count_pool(name):
+    """
+    Increments the given key pool counter. The counters are kept in Redis
+    rather than the application settings, so that taking a key does not
+    trigger a settings reload in every process. A Redis failure never stops
+    a key from being returned.
+    :return: None
+    """
+    try:
+        _redis().hincrby(POOL_STATS_KEY, name, 1)
+    except redis.RedisError as e:
+        logger.warning("failed to count key pool %s: %s", name, e)
+
+
+def _pool_password():
+    """
+    Returns the password used to encrypt the pooled private keys.
+    :return: bytes
+    """
+    return bytes(settings.SECRET_KEY, "utf-8")
+
+
+def _redis():
+    """
+    Returns a Redis client used for the key pool counters.
+    :return: redis.Redis
+    """
+    return redis.Redis.from_url(settings.REDIS_URL, socket_timeout=1,
+                                socket_connect_timeout=1)
+
+
 #######################################
 # KeyPair
 #######################################
 
 class KeyPair:
     """
-    A KeyPair contains an X509 certificate and it's RSA private key objects and
+    A KeyPair contains an X509 certificate and it's private key objects and
     defines utility methods for
     """
     def __init__(self, crt, key):
@@ -1,6 +1,22 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
 from django.db.models import signals
 from django.dispatch import receiver
-from mangle.common import models, tasks
+from mangle.common import firewall, ipset, models, tasks
+
+
+@receiver(connection_created)
+def connection_post_create(connection, **kwargs):
+    """
+    Sets the SQLite PRAGMAs on each new SQLite database connection.
+    :return: None
+    """
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute("PRAGMA {} = {}".format(name, value))
 
 
 @receiver(signals.post_save, sender=models.User)
@@ -12,11 +28,15 @@ def user_post_save(instance, **kwargs):
     if not instance.is_active:
         models.Client.objects.by_user(instance).delete()
 
-    # if the user's group has changed then the each client must have their rule
-    # deleted and re-created in order to have the new group rules applied
+    # if the user's group has changed then the each client must have their
+    # previous group's rule deleted and re-created in order to have the new
+    # group rules applied
     if instance.has_changed("group_id"):
+        old_group = models.Group.objects.by_pk(instance.previous("group_id"))
+
         for client in models.Client.objects.by_user(instance).all():
-            client.delete_firewall_rule()
+            if old_group:
+                client.delete_firewall_rule(old_group)
             client.create_firewall_rule()
 
 
@@ -27,7 +47,11 @@ def device_post_delete(instance, **kwargs):
     :return: None
     """
     if instance.serial:
-        models.RevokedDevice.objects.create(serial=instance.serial)
+        models.RevokedDevice.objects.create(
+            expires_at=instance.expires_at,
+            serial=instance.serial,
+        )
+        tasks.update_crl()
 
 
 @receiver(signals.post_save, sender=models.Group)
@@ -37,9 +61,16 @@ def group_post_save(instance, **kwargs):
     :return: None
     """
     if instance.is_enabled:
-        instance.create_firewall_chain()
+        firewall.reconcile_group(instance)
+
+        if ipset.enabled():
+            instance.create_firewall_set()
     else:
         instance.clients.delete()
+
+        if ipset.enabled():
+            instance.delete_firewall_set()
+
         instance.delete_firewall_chain()
 
 
@@ -49,17 +80,23 @@ def group_post_delete(instance, **kwargs):
     Handles post-delete actions for the given group.
     :return: None
     """
+    if ipset.enabled():
+        instance.delete_firewall_set()
+
     instance.delete_firewall_chain()
 
 
 @receiver(signals.post_delete, sender=models.Client)
 def client_post_delete(instance, **kwargs):
     """
-    Handles post-delete actions for the given client.
+    Handles post-delete actions for the given client. The client connection is
+    only killed if the client has not already disconnected.
     :return: None
     """
     instance.delete_firewall_rule()
-    tasks.disconnect_openvpn_client(instance.remote_ip)
+
+    if not instance.disconnected:
+        tasks.disconnect_openvpn_client(instance.remote_ip)
 
 
 @receiver(signals.post_save, sender=models.Client)
@@ -77,7 +114,7 @@ def firewall_rule_post_save(instance, **kwargs):
     Handles post-save action for the given firewall rule.
     :return: None
     """
-    instance.group.create_firewall_chain()
+    firewall.reconcile_group(instance.group)
 
 
 @receiver(signals.post_delete, sender=models.FirewallRule)
@@ -0,0 +1,195 @@
+import logging
+import time
+
+from datetime import datetime
+from django.db import transaction
+from django.utils import timezone
+from mangle.common import firewall, models, openvpn
+
+
+logger = logging.getLogger(__name__)
+
+
+STALE_AFTER = 60
+"""int: the number of seconds after which the status file is considered stale,
+eg. because the OpenVPN server is not running."""
+
+_state = {
+    "pending": frozenset(),
+    "time": None,
+}
+"""dict: the time of the last reconciled status and the differences that were
+found in it, which are only fixed once they are seen again."""
+
+
+def reconcile(status=None):
+    """
+    Reconciles the clients in the database with the clients connected to the
+    OpenVPN server, such as after a client-disconnect hook was missed. Missing
+    clients are created, orphaned clients are deleted and the client firewall
+    rules are reconciled once. The status file is read if no Status is given.
+
+    A status is only reconciled once, and a difference is only fixed once it is
+    seen in two consecutive statuses, so clients that connect or disconnect
+    while their hooks are still running are left to the hooks. Returns the
+    number of created and deleted clients.
+
+    Every client that is not in the status is considered orphaned, so the
+    database must only be used by this OpenVPN server.
+    :return: Tuple[int,int]
+    """
+    status = status or openvpn.read_status()
+
+    if not status or status.time == _state["time"]:
+        return 0, 0
+
+    if time.time() - status.time > STALE_AFTER:
+        logger.debug("OpenVPN status is stale, skipping reconciliation")
+        return 0, 0
+
+    live = {}
+    for client in status.clients:
+        if client.get("Common Name"):
+            live[client["Common Name"]] = client
+
+    existing = dict(models.Client.objects.values_list("common_name",
+                                                      "virtual_ip"))
+
+    differences = frozenset(
+        [("missing", name) for name in live if name not in existing] +
+        [("orphaned", name) for name in existing if name not in live]
+    )
+
+    confirmed = differences & _state["pending"]
+    _state["pending"] = differences
+    _state["time"] = status.time
+
+    if not confirmed:
+        return 0, 0
+
+    orphaned = [name for kind, name in confirmed if kind == "orphaned"]
+    missing = [live[name] for kind, name in confirmed if kind == "missing"]
+
+    # the virtual IPs of orphaned clients can be reused by missing clients
+    # once the orphaned clients are deleted
+    in_use = set(ip for name, ip in existing.items() if name not in orphaned)
+
+    with transaction.atomic():
+        deleted = _delete_clients(orphaned)
+        created, inactive = _create_clients(missing, in_use)
+
+    # the connections are only killed once the transaction is committed, since
+    # the hook server that kills them may be waiting for the database
+    for address in inactive:
+        _kill_client(address)
+
+    if deleted or created:
+        firewall.reconcile_clients()
+
+        logger.info("reconciled clients with the OpenVPN status: %s created, "
+                    "%s deleted", created, deleted)
+
+    return created, deleted
+
+
+def _delete_clients(names):
+    """
+    Deletes the clients with the given common names, which are no longer
+    connected, and returns the number of deleted clients. The clients are
+    deleted without the delete signals, since their firewall rules are
+    reconciled in one pass once the transaction is committed and there is no
+    connection left to kill.
+    :return: int
+    """
+    deleted = 0
+
+    for queryset in models.Client.objects.filter_in("common_name", names):
+        deleted += queryset._raw_delete(queryset.db)
+
+    return deleted
+
+
+def _split_common_name(common_name):
+    """
+    Returns a tuple containing the lowercase e-mail address and the device name
+    of the given client common name.
+    :return: Tuple[str,str]
+    """
+    email, _, name = common_name.rpartition(":")
+    return email.lower(), name
+
+
+def _create_clients(clients, in_use):
+    """
+    Creates the given status clients that belong to a device. Returns the
+    number of created clients and the addresses of the clients whose user is
+    no longer active, whose connections must be killed. Clients that do not
+    match a device, eg. because the device was renamed since it connected, are
+    left connected.
+    :return: Tuple[int,List[str]]
+    """
+    if not clients:
+        return 0, []
+
+    # the certificates of older devices may contain mixed-case e-mail
+    # addresses, while the e-mail addresses are stored in lowercase
+    emails = set(_split_common_name(client["Common Name"])[0]
+                 for client in clients)
+    devices = {}
+
+    for queryset in models.Device.objects.filter_in("user__email", emails):
+        for device in queryset.select_related("user__group"):
+            devices[(device.user.email, device.name)] = device
+
+    created = []
+    connected = {}
+    inactive = []
+
+    for client in clients:
+        device = devices.get(_split_common_name(client["Common Name"]))
+
+        if not device:
+            logger.warning("OpenVPN client %s does not match a device",
+                           client["Common Name"])
+            continue
+
+        if not device.user.is_active:
+            logger.warning("killing inactive OpenVPN client %s",
+                           client["Common Name"])
+            inactive.append(client["Real Address"])
+            continue
+
+        if client["Virtual Address"] in in_use:
+            continue
+
+        instance = models.Client(
+            common_name=client["Common Name"],
+            device=device,
+            remote_ip=client["Real Address"],
+            virtual_ip=client["Virtual Address"],
+        )
+        created.append(instance)
+
+        if client.get("Connected Since (time_t)"):
+            connected[instance.pk] = datetime.fromtimestamp(
+                int(client["Connected Since (time_t)"]), timezone.utc)
+
+    models.Client.objects.bulk_create(created)
+
+    # created_at is always set to the current time when the clients are
+    # created, so it is set to the time the clients connected afterwards
+    models.Client.objects.update_created_at(connected)
+
+    return len(created), inactive
+
+
+def _kill_client(address):
+    """
+    Kills the OpenVPN client connection with the given address. Failures are
+    logged, since the client is killed again by the next reconciliation.
+    :return: None
+    """
+    try:
+        openvpn.kill_client(address)
+    except (openvpn.ManagementError, OSError) as e:
+        logger.warning("failed to kill OpenVPN client %s: %s", address, e)
@@ -1,49 +1,220 @@
 import logging
+import time
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
+from django.utils import timezone
 from huey import crontab
-from huey.contrib.djhuey import db_task, db_periodic_task
-from mangle.common import mail, models, openvpn, pki
+from huey.contrib.djhuey import db_task, db_periodic_task, lock_task
+from mangle.common import config, events, mail, models, openvpn, pki, status
 
 
 logger = logging.getLogger(__name__)
 
 
 @db_periodic_task(crontab(minute=0, hour="*"))
+@lock_task("update-crl")
 def create_crl():
     """
-    Creates and writes the application certificate revocation list file.
+    Creates and writes the application certificate revocation list file if
+    the revoked certificates have changed, and prunes expired certificates.
     :return: None
     """
-    serials = []
+    _update_crl()
 
-    # create a list that contains all of the revoked certificate serial numbers
-    for revoked in models.RevokedDevice.objects.all():
-        serials.append(revoked.serial)
 
-    with open(settings.PKI_CRL_FILE, "w") as f:
-        f.write(pki.create_crl(*serials))
+@db_task(retries=5, retry_delay=5)
+@lock_task("update-crl")
+def update_crl():
+    """
+    Updates the application certificate revocation list file after a device
+    has been revoked. If the CRL is already being updated, then the task is
+    retried so that the latest revocation is always written.
+    :return: None
+    """
+    _update_crl()
+
+
+def _update_crl():
+    """
+    Writes the application certificate revocation list file if it changed.
+    :return: None
+    """
+    config.refresh()
+
+    if pki.update_crl(settings.PKI_CRL_FILE):
+        logger.info("CRL generated for %s revoked certs",
+                    models.RevokedDevice.objects.count())
+
+
+@db_periodic_task(crontab(minute="*"))
+@lock_task("fill-key-pool")
+def fill_key_pool():
+    """
+    Fills the pool of pre-generated private keys used to create device keys.
+    :return: None
+    """
+    config.refresh()
+
+    count = pki.fill_key_pool(config.get_int("pki_key_pool_size", 10))
 
-    logger.info("CRL generated for {} revoked certs".format(len(serials)))
+    if count:
+        logger.info("key pool filled with %s new keys", count)
+
+
+@db_periodic_task(crontab(minute="*"))
+@lock_task("reconcile-clients")
+def reconcile_clients():
+    """
+    Reconciles the clients and their firewall rules with the clients that are
+    connected to the OpenVPN server, according to the OpenVPN status file.
+    :return: None
+    """
+    config.refresh()
+    status.reconcile()
+
+
+@db_periodic_task(crontab(minute=30, hour=3))
+@lock_task("archive-events")
+def archive_events():
+    """
+    Moves the events that are older than the event retention period into the
+    event archive. Events are kept forever if the retention period is 0.
+    :return: None
+    """
+    config.refresh()
+
+    days = config.get_int("event_retention_days", 365)
+    if not days:
+        return
+
+    count = events.archive(timezone.now() - timezone.timedelta(days=days))
+
+    if count:
+        logger.info("archived %s events older than %s days", count, days)
 
 
 @db_task()
 def send_email(recipient, subject, body, sender):
     """
-    Sends the given application e-mail.
+    Queues the given application e-mail for the mail task. This is kept for
+    the e-mails that were queued under this task name by earlier versions.
+    :return: None
+    """
+    mail.enqueue([(recipient, subject, body, sender)])
+
+
+@db_task(retries=5, retry_delay=5)
+@lock_task("send-emails")
+def send_queued_emails():
+    """
+    Sends all of the queued application e-mails. If the e-mails are already
+    being sent, then the task is retried so that e-mails queued while the
+    queue was being emptied are not left behind.
+    :return: None
+    """
+    _send_queued_emails()
+
+
+@db_periodic_task(crontab(minute="*"))
+@lock_task("send-emails")
+def send_stranded_emails():
+    """
+    Sends any queued application e-mails that were left in the queue, such as
+    when SMTP was not configured or the mail task failed.
     :return: None
     """
-    if not mail.init():
+    _send_queued_emails()
+
+
+def _send_queued_emails():
+    """
+    Sends the queued e-mails in batches over a single SMTP connection, which is
+    only reopened after a transient failure. E-mails are sent no faster than
+    the `smtp_rate_limit` (e-mails per second, 0 for no limit) and transient
+    failures are retried up to `smtp_retries` times. If an e-mail still fails,
+    then it and the remaining e-mails are left queued for the next mail task.
+    :return: None
+    """
+    if not mail.queued():
+        return
+
+    config.refresh()
+
+    if not mail.is_configured():
         logger.error("email failed: SMTP not configured")
+        return
+
+    # e-mails left behind by a mail task that failed are sent again
+    mail.requeue()
+
+    values = config.snapshot()
+    interval = 1 / values.smtp_rate_limit if values.smtp_rate_limit else 0
+
+    connection = mail.connection()
+    sent = failed = 0
+    deferred = False
+
+    try:
+        while not deferred:
+            emails = mail.dequeue(values.smtp_batch_size)
+            if not emails:
+                break
+
+            for item, msg in emails:
+                started = time.monotonic()
+
+                try:
+                    if _send_email(connection, msg, values.smtp_retries):
+                        sent += 1
+                    else:
+                        failed += 1
+                except Exception as e:
+                    logger.error("email deferred: %s - '%s': %s",
+                                 msg.to[0], msg.subject, e)
+                    deferred = True
+                    break
+
+                mail.ack(item)
+
+                # wait out the remainder of the rate limit interval
+                time.sleep(max(0, interval - (time.monotonic() - started)))
+    finally:
+        connection.close()
+
+    if sent or failed or deferred:
+        logger.info("emails sent: %s, failed: %s, deferred: %s", sent, failed,
+                    mail.queued())
+
+
+def _send_email(connection, msg, retries):
+    """
+    Sends the given e-mail over the given SMTP connection and returns whether
+    it was sent. The connection is reopened and the e-mail is retried with an
+    increasing delay after a transient failure. The error is raised if the
+    e-mail still fails after all of the retries.
+    :return: bool
+    """
+    for attempt in range(retries + 1):
+        try:
+            # the connection is opened here rather than by send_messages(),
+            # which would otherwise close it again after each e-mail
+            connection.open()
+            connection.send_messages([msg])
+            return True
+        except Exception as e:
+            connection.close()
+
+            if not mail.is_transient_error(e):
+                logger.error("email failed: %s - '%s': %s",
+                             msg.to[0], msg.subject, e)
+                return False
+
+            if attempt == retries:
+                raise
 
-    msg = EmailMultiAlternatives(subject, body, sender, (recipient, ))
-    msg.attach_alternative(body, "text/html")
+            time.sleep(2 ** attempt)
 
-    if msg.send() == 0:
-        logger.error("email failed: %s - '%s'", recipient, subject)
-    else:
-        logger.info("email sent: %s - '%s'", recipient, subject)
+    return False
 
 
 @db_task()
@@ -52,7 +223,6 @@ def disconnect_openvpn_client(client):
     Kills the OpenVPN client connnection with the given address.
     :return: None
     """
-    with openvpn.Management(settings.OPENVPN_MANAGEMENT_SOCKET) as m:
-        m.run("kill", client)
+    openvpn.kill_client(client)
 
     logger.info("disconnected openvpn client %s", client)
@@ -14,22 +14,29 @@ def run(*args, **kwargs):
 def run_output(*args, **kwargs):
     """
     Runs a BASH command with the given arguments and returns a tuple containing
-    the command process exit code, the standard output, and standard error.
+    the command process exit code, the standard output, and standard error. If
+    an `input` keyword argument is given, then it is written to the standard
+    input of the command process.
     :return: Tuple[int,str,str]
     """
     command = " ".join([str(arg) for arg in args])
+    stdin = kwargs.pop("input", None)
 
     proc = subprocess.Popen(
         command,
         executable="/bin/bash",
         shell=True,
+        stdin=subprocess.PIPE if stdin is not None else None,
         stderr=subprocess.PIPE,
         stdout=subprocess.PIPE,
         **kwargs,
     )
 
     # this call will block until the process finishes
-    stdout, stderr = proc.communicate()
+    if stdin is not None:
+        stdout, stderr = proc.communicate(bytes(stdin, "utf-8"))
+    else:
+        stdout, stderr = proc.communicate()
 
     return (proc.returncode,
             stdout.decode("utf-8").strip(),
@@ -1,5 +1,6 @@
 import logging
 import os
+import tempfile
 
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,29 @@ def append_file(path, content, perms=None):
         os.chmod(path, perms)
 
 
+def write_file_atomic(path, content, perms=None):
+    """
+    Writes the given content to a temporary file and renames it to the given
+    path, so that readers of the file never see a partially written file. The
+    given file permissions are set before the file is renamed.
+    :return: None
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".{}.".format(name), dir=directory)
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.chmod(tmp_path, perms if isinstance(perms, int) else 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
 def write_file(path, content, perms=None):
     """
     Writes the given content to the file at the given path and sets the given
@@ -15,6 +15,22 @@ for generating random numbers.
 """
 
 
+def format_bytes(value):
+    """
+    Returns a human readable string for the given number of bytes, eg. '1.5 MB'.
+    :return: str
+    """
+    value = int(value)
+
+    if value < 1024:
+        return "{} B".format(value)
+
+    for unit in ("KB", "MB", "GB", "TB"):
+        value /= 1024
+        if value < 1024 or unit == "TB":
+            return "{:.1f} {}".format(value, unit)
+
+
 def random_alphanumeric(length):
     """
     Returns a random alphanumeric string of the given length.
@@ -1,3 +1,4 @@
+import json
 import multiprocessing
 import os
 
@@ -107,20 +108,25 @@ USE_TZ = True
 
 # Directories
 DATA_DIR = os.path.join(BASE_DIR, "data")
+EVENT_ARCHIVE_DIR = os.path.join(DATA_DIR, "archive")
 KEY_DIR = os.path.join(DATA_DIR, "keys")
 LOG_DIR = os.path.join(DATA_DIR, "logs")
 SYSTEMD_DIR = os.path.join(DATA_DIR, "systemd")
 
 # Files
+DATABASE_CONFIG_FILE = os.path.join(KEY_DIR, "database.json")
 DATABASE_PATH = os.path.join(DATA_DIR, "mangle.db")
 DJANGO_LOG_FILE = os.path.join(LOG_DIR, "django.log")
 HUEY_LOG_FILE = os.path.join(LOG_DIR, "huey.log")
 OPENVPN_CONFIG_FILE = os.path.join(DATA_DIR, "openvpn.conf")
+OPENVPN_HOOK_SCRIPT = os.path.join(BASE_DIR, "scripts", "openvpn-hook.py")
+OPENVPN_HOOK_SOCKET = "/run/mangle-vpn-hooks.sock"
 OPENVPN_LOG_FILE = os.path.join(LOG_DIR, "openvpn.log")
 OPENVPN_MANAGEMENT_SOCKET = "/run/mangle-vpn.sock"
 OPENVPN_STATUS_FILE = os.path.join(LOG_DIR, "openvpn-status.log")
 PKI_CRL_FILE = os.path.join(KEY_DIR, "crl.pem")
 SECRET_KEY_FILE = os.path.join(KEY_DIR, "secret.key")
+SYSTEMD_HOOKS_FILE = os.path.join(SYSTEMD_DIR, "mangle-hooks.service")
 SYSTEMD_VPN_FILE = os.path.join(SYSTEMD_DIR, "mangle-vpn.service")
 SYSTEMD_WEB_FILE = os.path.join(SYSTEMD_DIR, "mangle-web.service")
 SYSTEMD_TASKS_FILE = os.path.join(SYSTEMD_DIR, "mangle-tasks.service")
@@ -143,9 +149,49 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': DATABASE_PATH,
+        'OPTIONS': {
+            # seconds to wait for the write lock before raising 'database is
+            # locked'
+            'timeout': 20,
+        },
     }
 }
 
+# PRAGMAs set on each SQLite connection, which allow the web, task and hook
+# processes to read while another process writes (WAL), avoid an fsync on
+# every commit (synchronous=NORMAL is safe in WAL mode) and wait for the write
+# lock instead of failing
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 20000,
+    'cache_size': -16000,       # 16MB
+    'mmap_size': 268435456,     # 256MB
+    'temp_store': 'MEMORY',
+}
+
+# a PostgreSQL database is used instead of SQLite when the database config file
+# exists, the database must only be used by a single OpenVPN server
+if os.path.exists(DATABASE_CONFIG_FILE):
+    with open(DATABASE_CONFIG_FILE, "r") as f:
+        _database = json.load(f)
+
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': _database.get('name', 'mangle'),
+        'USER': _database.get('user', 'mangle'),
+        'PASSWORD': _database.get('password', ''),
+        'HOST': _database.get('host', 'localhost'),
+        'PORT': _database.get('port', 5432),
+        # keep connections open between requests and tasks instead of opening
+        # a new connection each time, set to 0 when using a connection pooler
+        'CONN_MAX_AGE': _database.get('conn_max_age', 600),
+        # server-side cursors (used by the streaming exports) do not work with
+        # a connection pooler in transaction pooling mode
+        'DISABLE_SERVER_SIDE_CURSORS': _database.get(
+            'disable_server_side_cursors', False),
+    }
+
 
 #######################################
 # Django REST Framework
@@ -242,6 +288,12 @@ with open(SECRET_KEY_FILE, "r") as f:
     SECRET_KEY = f.read()
 
 
+#######################################
+# Redis
+#######################################
+REDIS_URL = "redis://localhost:6379/0"
+
+
 #######################################
 # Huey
 # https://huey.readthedocs.io/en/latest/django.html
@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import unittest
+
+from unittest import mock
+from mangle.common import config
+
+
+BENCHMARKS = bool(os.environ.get("MANGLE_BENCHMARKS"))
+"""bool: whether the benchmarks are run along with the tests."""
+
+benchmark = unittest.skipUnless(BENCHMARKS, "MANGLE_BENCHMARKS is not set")
+"""Callable: skips the decorated benchmark unless benchmarks are enabled."""
+
+
+def patch_config(test, **values):
+    """
+    Sets the given application settings for the duration of the given test,
+    without writing them to the database.
+    :return: None
+    """
+    patcher = mock.patch.dict(config._settings, values)
+    patcher.start()
+
+    # the parsed settings are rebuilt once the settings are restored
+    test.addCleanup(config._rebuild)
+    test.addCleanup(patcher.stop)
+
+    config._rebuild()
+
+
+def measure(func, *args, repeat=1, **kwargs):
+    """
+    Calls the given function `repeat` times and returns the fastest duration of
+    a call in seconds.
+    :return: float
+    """
+    durations = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(*args, **kwargs)
+        durations.append(time.perf_counter() - started)
+
+    return min(durations)
+
+
+def report(name, **values):
+    """
+    Writes the given benchmark results to stderr.
+    :return: None
+    """
+    results = ", ".join("{}={}".format(k, v) for k, v in values.items())
+    sys.stderr.write("\n[benchmark] {}: {}\n".format(name, results))
@@ -0,0 +1,97 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from mangle.common import models
+
+
+class AdminQueryCountTest(TestCase):
+    """
+    Locks each paginated admin list endpoint to a fixed number of queries per
+    page, regardless of the page size, so N+1 regressions are caught.
+    """
+    rows = 30
+    """int: the number of rows created for each list endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        # the models are bulk created, since the post-save signals change the
+        # firewall
+        group = models.Group(name="Default")
+        models.Group.objects.bulk_create([group] + [
+            models.Group(name="Group {}".format(i)) for i in range(cls.rows)])
+
+        cls.admin = models.User(email="admin@example.com", group=group,
+                                is_admin=True, mfa_secret="A" * 16)
+        users = [models.User(email="user{}@example.com".format(i), group=group,
+                             mfa_secret="A" * 16) for i in range(cls.rows)]
+        models.User.objects.bulk_create([cls.admin] + users)
+
+        devices = [models.Device(user=user, name="device")
+                   for user in users]
+        models.Device.objects.bulk_create(devices)
+
+        models.Client.objects.bulk_create([
+            models.Client(common_name=device.common_name,
+                          device=device,
+                          remote_ip="192.0.2.{}".format(i),
+                          virtual_ip="10.8.0.{}".format(i + 2))
+            for i, device in enumerate(devices)])
+
+        models.Event.objects.bulk_create([
+            models.Event(name="user.login", user=user) for user in users])
+
+        models.FirewallRule.objects.bulk_create([
+            models.FirewallRule(group=group, destination="10.0.0.{}".format(i))
+            for i in range(cls.rows)])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+        # the settings are refreshed by the config middleware, which would
+        # add queries that don't depend on the endpoint
+        patcher = mock.patch("mangle.common.config.refresh")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = mock.patch("mangle.common.config.subscribe")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assertPageQueries(self, url, num, **params):
+        """
+        Asserts that a small page and a full page of the given endpoint take
+        the given number of queries.
+        :return: None
+        """
+        for size in (5, self.rows):
+            with self.assertNumQueries(num):
+                response = self.client.get(url, dict(params, size=size))
+
+            self.assertEqual(response.status_code, 200)
+
+            results = response.json()["results"]
+            self.assertEqual(len(results), size)
+
+    def test_users(self):
+        self.assertPageQueries("/api/admin/users/", 2)
+
+    def test_groups(self):
+        self.assertPageQueries("/api/admin/groups/", 2)
+
+    def test_firewall_rules(self):
+        self.assertPageQueries("/api/admin/firewall/", 2)
+
+    def test_clients(self):
+        self.assertPageQueries("/api/admin/clients/", 2)
+
+    def test_clients_cursor(self):
+        self.assertPageQueries("/api/admin/clients/", 1, pagination="cursor")
+
+    def test_events(self):
+        self.assertPageQueries("/api/admin/events/", 2)
+
+    def test_events_cursor(self):
+        self.assertPageQueries("/api/admin/events/", 1, pagination="cursor")
@@ -0,0 +1,36 @@
+from django.test import SimpleTestCase
+from mangle.common import config
+from mangle.tests import patch_config
+
+
+class TypedSettingTest(SimpleTestCase):
+    def test_get_int(self):
+        patch_config(self, smtp_port="587", vpn_bytecount_interval="10")
+
+        self.assertEqual(config.get_int("smtp_port", 25), 587)
+        self.assertEqual(config.get_int("vpn_bytecount_interval", 5), 10)
+        self.assertEqual(config.snapshot().smtp_port, 587)
+
+    def test_get_int_invalid_value_without_default(self):
+        patch_config(self, smtp_port="invalid")
+
+        self.assertEqual(config.get_int("smtp_port", 25), 25)
+        self.assertIsNone(config.snapshot().smtp_port)
+
+    def test_get_int_invalid_value_with_default(self):
+        patch_config(self, vpn_bytecount_interval="invalid")
+
+        # the registered default is used rather than the caller's default
+        self.assertEqual(config.get_int("vpn_bytecount_interval", 1), 5)
+
+    def test_get_int_unregistered_setting(self):
+        patch_config(self, unregistered_setting="42")
+
+        self.assertEqual(config.get_int("unregistered_setting"), 42)
+        self.assertEqual(config.get_int("missing_setting", 7), 7)
+
+    def test_get_bool(self):
+        patch_config(self, smtp_tls="yes", vpn_firewall_ipset="off")
+
+        self.assertTrue(config.get_bool("smtp_tls"))
+        self.assertFalse(config.get_bool("vpn_firewall_ipset", True))
@@ -0,0 +1,124 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from mangle.common import hooks
+from mangle.tests import benchmark, measure, report
+
+
+class HookServerTestCase(SimpleTestCase):
+    """
+    HookServerTestCase runs a hook server with test hooks on a temporary
+    socket.
+    """
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        self.path = os.path.join(tmp, "hooks.sock")
+
+        patcher = mock.patch("mangle.common.config.refresh")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.envs = []
+        self.server = hooks.HookServer(self.path, {
+            "client-connect": self.connect,
+            "client-disconnect": self.disconnect,
+        })
+
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.start()
+
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(thread.join)
+        self.addCleanup(self.server.shutdown)
+
+    def connect(self, env):
+        """
+        Records the hook environment and accepts the laptop client.
+        :return: bool
+        """
+        self.envs.append(env)
+        return env.get("common_name") == "user@example.com:laptop"
+
+    def disconnect(self, env):
+        """
+        Fails like a hook with a bug.
+        :return: bool
+        """
+        raise RuntimeError("hook failed")
+
+
+class HookServerTest(HookServerTestCase):
+    def test_returns_hook_result(self):
+        env = {"common_name": "user@example.com:laptop"}
+
+        self.assertEqual(hooks.call(self.path, "client-connect", env), 0)
+        self.assertEqual(self.envs, [env])
+
+        env = {"common_name": "user@example.com:phone"}
+        self.assertEqual(hooks.call(self.path, "client-connect", env), 1)
+
+    def test_failed_hook_returns_error(self):
+        self.assertEqual(hooks.call(self.path, "client-disconnect"), 1)
+
+    def test_unknown_action_returns_error(self):
+        self.assertEqual(hooks.call(self.path, "client-unknown"), 1)
+
+    def test_shim_forwards_environment(self):
+        env = dict(os.environ, common_name="user@example.com:laptop")
+
+        code = subprocess.call([sys.executable, settings.OPENVPN_HOOK_SCRIPT,
+                                self.path, "client-connect"], env=env)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(self.envs[0]["common_name"], env["common_name"])
+
+
+@benchmark
+class HookBenchmark(HookServerTestCase):
+    def spawn_command(self):
+        """
+        Runs the management command the way that each hook was run before
+        the hook server. The action is unknown, so only the cost of booting
+        the application is measured, and none of the hook itself.
+        :return: None
+        """
+        subprocess.call([sys.executable, os.path.join(settings.BASE_DIR,
+                                                      "manage.py"),
+                         "vpn", "benchmark"],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def spawn_shim(self):
+        """
+        Runs the hook shim the way that OpenVPN runs each hook.
+        :return: None
+        """
+        env = dict(os.environ, common_name="user@example.com:laptop")
+        subprocess.check_call([sys.executable, settings.OPENVPN_HOOK_SCRIPT,
+                               self.path, "client-connect"], env=env)
+
+    def call_server(self):
+        """
+        Sends the hook to the hook server without spawning a process.
+        :return: None
+        """
+        hooks.call(self.path, "client-connect",
+                   {"common_name": "user@example.com:laptop"})
+
+    def test_connect_latency(self):
+        command = measure(self.spawn_command, repeat=5)
+        shim = measure(self.spawn_shim, repeat=20)
+        server = measure(self.call_server, repeat=100)
+
+        report("hooks",
+               manage_py="{:.1f}ms".format(command * 1000),
+               shim="{:.1f}ms".format(shim * 1000),
+               socket="{:.2f}ms".format(server * 1000))
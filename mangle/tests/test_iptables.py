@@ -0,0 +1,154 @@
+import time
+
+from unittest import mock
+
+from django.test import TestCase
+from mangle.common import firewall, iptables, models
+from mangle.common.utils import bash
+from mangle.tests import benchmark, measure, report
+
+
+def _create_groups(count, rules, start=0):
+    """
+    Creates the given number of groups, numbered from `start`, each with the
+    given number of firewall rules, and returns the groups.
+    :return: List[Group]
+    """
+    # the models are bulk created, since the post-save signals change the
+    # firewall
+    groups = [models.Group(name="Group {}".format(i))
+              for i in range(start, start + count)]
+    models.Group.objects.bulk_create(groups)
+
+    models.FirewallRule.objects.bulk_create([
+        models.FirewallRule(group=group, action="ACCEPT", protocol="tcp",
+                            port="443", destination="10.{}.{}.0/24".format(
+                                i // 256, i % 256))
+        for group in groups for i in range(rules)])
+
+    return groups
+
+
+class IptablesTestCase(TestCase):
+    """
+    IptablesTestCase runs without the nftables and ipset backends, and with
+    the live firewall rules empty.
+    """
+    def setUp(self):
+        for target, value in (
+                ("mangle.common.ipset.enabled", False),
+                ("mangle.common.nftables.enabled", False),
+                ("mangle.common.iptables.get_table_rules", {})):
+            patcher = mock.patch(target, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TransactionTest(IptablesTestCase):
+    def test_render(self):
+        tx = iptables.Transaction()
+        tx.create_chain("filter", "MangleVPN")
+        tx.append_rule("filter", "MangleVPN", "-s", "10.8.0.2", "-j", "DROP")
+        tx.run("-t nat -A POSTROUTING -s 10.8.0.0/24 -j MASQUERADE")
+        tx.delete_chain("filter", "MangleVPN_Old")
+
+        self.assertEqual(tx.render(), "\n".join([
+            "*filter",
+            ":MangleVPN - [0:0]",
+            "-A MangleVPN -s 10.8.0.2 -j DROP",
+            "-F MangleVPN_Old",
+            "-X MangleVPN_Old",
+            "COMMIT",
+            "*nat",
+            "-A POSTROUTING -s 10.8.0.0/24 -j MASQUERADE",
+            "COMMIT",
+        ]) + "\n")
+
+    @mock.patch("mangle.common.iptables.bash.run_output",
+                return_value=(0, "", ""))
+    def test_commit_runs_single_restore(self, run_output):
+        with iptables.transaction() as tx:
+            tx.create_chain("filter", "MangleVPN")
+            for i in range(100):
+                tx.append_rule("filter", "MangleVPN", "-s",
+                               "10.8.0.{}".format(i), "-j", "DROP")
+
+        run_output.assert_called_once_with(
+            "iptables-restore", "--noflush", "--wait", input=tx.render())
+
+    @mock.patch("mangle.common.iptables.bash.run_output",
+                return_value=(0, "", ""))
+    def test_commit_empty_transaction(self, run_output):
+        with iptables.transaction():
+            pass
+
+        run_output.assert_not_called()
+
+    @mock.patch("mangle.common.iptables.bash.run_output")
+    def test_commit_falls_back_to_each_operation(self, run_output):
+        run_output.side_effect = [(1, "", "Bad rule"), (0, "", ""),
+                                  (0, "", ""), (0, "", "")]
+
+        tx = iptables.Transaction()
+        tx.create_chain("filter", "MangleVPN")
+        tx.delete_rule("filter", "MangleVPN", "-j", "DROP")
+
+        self.assertTrue(tx.commit())
+        self.assertEqual(run_output.call_args_list[1:], [
+            mock.call("iptables", "--wait", "-t", "filter", "-S"),
+            mock.call("iptables", "--wait", "-t", "filter", "-N", "MangleVPN"),
+            mock.call("iptables", "--wait", "-t", "filter", "-D", "MangleVPN",
+                      "-j", "DROP"),
+        ])
+
+    def test_reconcile_adds_to_transaction(self):
+        group, = _create_groups(1, 2)
+
+        tx = iptables.Transaction()
+        firewall.reconcile(tx)
+        rules = tx.render().split("\n")
+
+        self.assertIn(":{} - [0:0]".format(group.chain), rules)
+        self.assertEqual(
+            [rule for rule in rules if group.chain in rule and "-I" in rule],
+            ["-I {} 1 -d 10.0.0.0/24 -p tcp -m tcp --dport 443 -j ACCEPT"
+             .format(group.chain),
+             "-I {} 2 -d 10.0.1.0/24 -p tcp -m tcp --dport 443 -j ACCEPT"
+             .format(group.chain),
+             "-I {} 3 -j DROP".format(group.chain)])
+
+
+@benchmark
+class IptablesBenchmark(IptablesTestCase):
+    RULES = 30
+
+    def test_restart_time(self):
+        # a process that reads the rules stands in for iptables-restore, and
+        # the cost of each iptables process is estimated from the cost of
+        # starting a process, since the firewall can't be changed here
+        started = time.perf_counter()
+        for _ in range(100):
+            bash.run_output("true")
+        spawn = (time.perf_counter() - started) / 100
+
+        created = 0
+
+        for count in (10, 50, 200):
+            _create_groups(count - created, self.RULES, created)
+            created = count
+
+            tx = iptables.Transaction()
+            build = measure(firewall.reconcile, tx)
+            restore = measure(bash.run_output, "cat", ">", "/dev/null",
+                              input=tx.render())
+
+            # each rule was appended with a check (-C) and an append (-A)
+            processes = 2 * len(tx)
+
+            report("iptables restart",
+                   groups=count,
+                   rules=len(tx),
+                   transaction="{:.0f}ms".format((build + restore) * 1000),
+                   per_rule_processes=processes,
+                   per_rule_estimate="{:.0f}ms".format(
+                       processes * spawn * 1000))
@@ -0,0 +1,230 @@
+import socket
+import types
+import unittest
+
+from unittest import mock
+
+import redis
+
+from django.test import SimpleTestCase, override_settings
+from mangle.common import mail, tasks
+from mangle.tests import benchmark, measure, report
+
+try:
+    from aiosmtpd.controller import Controller
+except ImportError:
+    Controller = None
+
+
+REDIS_URL = "redis://localhost:6379/15"
+"""str: the Redis database used by the mail tests."""
+
+
+def free_port():
+    """
+    Returns a local TCP port that is not in use.
+    :return: int
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def redis_available():
+    """
+    Returns whether the test Redis database can be reached.
+    :return: bool
+    """
+    try:
+        return redis.Redis.from_url(REDIS_URL).ping()
+    except redis.RedisError:
+        return False
+
+
+class SmtpHandler:
+    """
+    SmtpHandler is an aiosmtpd handler that keeps the delivered e-mails. The
+    recipients in `refused` are refused permanently, and the next `failures`
+    e-mails are failed with a transient error.
+    """
+    def __init__(self):
+        self.delivered = []
+        self.refused = set()
+        self.failures = 0
+        self.connections = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname,
+                          responses=None):
+        self.connections += 1
+        session.host_name = hostname
+
+        # aiosmtpd 1.2 passes no responses and expects a status, newer
+        # versions expect the given EHLO responses back
+        return responses if responses is not None else "250 HELP"
+
+    async def handle_RCPT(self, server, session, envelope, address, options):
+        if address in self.refused:
+            return "550 mailbox unavailable"
+
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        if self.failures:
+            self.failures -= 1
+            return "451 try again later"
+
+        self.delivered.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+@unittest.skipIf(Controller is None, "aiosmtpd is not installed")
+@unittest.skipUnless(redis_available(), "Redis is not available")
+@override_settings(REDIS_URL=REDIS_URL)
+class MailTestCase(SimpleTestCase):
+    """
+    MailTestCase sends the queued e-mails to a local SMTP server through a
+    separate Redis database.
+    """
+    def setUp(self):
+        self.handler = SmtpHandler()
+        self.smtp = Controller(self.handler, hostname="127.0.0.1",
+                               port=free_port())
+        self.smtp.start()
+        self.addCleanup(self.smtp.stop)
+
+        redis.Redis.from_url(REDIS_URL).delete(mail.QUEUE_KEY,
+                                               mail.PROCESSING_KEY)
+
+        values = types.SimpleNamespace(
+            smtp_batch_size=10,
+            smtp_host="127.0.0.1",
+            smtp_password="",
+            smtp_port=self.smtp.port,
+            smtp_rate_limit=0,
+            smtp_retries=1,
+            smtp_tls=False,
+            smtp_username="",
+        )
+
+        for target, value in (
+                ("mangle.common.config.get", "mangle@example.com"),
+                ("mangle.common.config.refresh", None),
+                ("mangle.common.config.snapshot", values),
+                ("mangle.common.mail.is_configured", True),
+                ("mangle.common.tasks.send_queued_emails", None),
+                ("mangle.common.tasks.time.sleep", None)):
+            patcher = mock.patch(target, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def queue(self, count):
+        """
+        Queues the given number of e-mails and returns their recipients.
+        :return: List[str]
+        """
+        recipients = ["user{}@example.com".format(i) for i in range(count)]
+        mail.send_many([(r, "Welcome", "<p>Hello</p>") for r in recipients])
+        return recipients
+
+
+class MailQueueTest(MailTestCase):
+    def test_delivers_over_one_connection(self):
+        recipients = self.queue(25)
+
+        tasks._send_queued_emails()
+
+        self.assertEqual(sorted(self.handler.delivered), sorted(recipients))
+        self.assertEqual(self.handler.connections, 1)
+        self.assertEqual(mail.queued(), 0)
+
+    def test_delivers_in_queued_order(self):
+        recipients = self.queue(5)
+
+        tasks._send_queued_emails()
+
+        self.assertEqual(self.handler.delivered, recipients)
+
+    def test_transient_failure_is_retried(self):
+        recipients = self.queue(3)
+        self.handler.failures = 1
+
+        tasks._send_queued_emails()
+
+        self.assertEqual(sorted(self.handler.delivered), sorted(recipients))
+        self.assertEqual(mail.queued(), 0)
+
+    def test_failed_emails_stay_queued(self):
+        recipients = self.queue(3)
+        self.handler.failures = 2
+
+        tasks._send_queued_emails()
+
+        # the first e-mail failed after its retry, so it and the remaining
+        # e-mails are sent by the next mail task
+        self.assertEqual(self.handler.delivered, [])
+        self.assertEqual(mail.queued(), 3)
+
+        tasks._send_queued_emails()
+
+        self.assertEqual(sorted(self.handler.delivered), sorted(recipients))
+        self.assertEqual(mail.queued(), 0)
+
+    def test_emails_left_by_a_crash_are_sent(self):
+        recipients = self.queue(3)
+
+        # a mail task that crashed leaves its e-mails in the processing list
+        mail.dequeue(2)
+
+        tasks._send_queued_emails()
+
+        self.assertEqual(sorted(self.handler.delivered), sorted(recipients))
+        self.assertEqual(mail.queued(), 0)
+
+    def test_refused_recipient_is_dropped(self):
+        recipients = self.queue(3)
+        self.handler.refused.add(recipients[1])
+
+        tasks._send_queued_emails()
+
+        self.assertEqual(self.handler.delivered,
+                         [recipients[0], recipients[2]])
+        self.assertEqual(mail.queued(), 0)
+
+    def test_send_email_task_queues_email(self):
+        tasks.send_email.call_local("legacy@example.com", "Welcome",
+                                    "<p>Hello</p>", "mangle@example.com")
+
+        tasks._send_queued_emails()
+
+        self.assertEqual(self.handler.delivered, ["legacy@example.com"])
+
+
+@benchmark
+class MailBenchmark(MailTestCase):
+    COUNT = 500
+
+    def send_each(self):
+        """
+        Sends each queued e-mail over a new SMTP connection, the way each
+        e-mail was sent by its own task before the mail queue.
+        :return: None
+        """
+        for item, msg in mail.dequeue(self.COUNT):
+            connection = mail.connection()
+            connection.send_messages([msg])
+            connection.close()
+            mail.ack(item)
+
+    def test_throughput(self):
+        self.queue(self.COUNT)
+        each = measure(self.send_each)
+
+        self.queue(self.COUNT)
+        queued = measure(tasks._send_queued_emails)
+
+        self.assertEqual(len(self.handler.delivered), self.COUNT * 2)
+
+        report("mail", emails=self.COUNT,
+               per_connection="{:.0f}/s".format(self.COUNT / each),
+               queued="{:.0f}/s".format(self.COUNT / queued))
@@ -0,0 +1,58 @@
+import importlib
+
+from django.apps import apps
+from django.test import TestCase
+from mangle.common import models
+
+
+lowercase_emails = importlib.import_module(
+    "mangle.common.migrations.0012_lowercase_user_emails").lowercase_emails
+
+
+class LowercaseEmailsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # the models are bulk created, since saving a user lowercases its
+        # e-mail address
+        cls.group = models.Group(name="Default")
+        models.Group.objects.bulk_create([cls.group])
+
+    def create_users(self, *emails):
+        """
+        Creates a user with each of the given e-mail addresses.
+        :return: None
+        """
+        models.User.objects.bulk_create([
+            models.User(email=email, group=self.group) for email in emails])
+
+    def emails(self):
+        """
+        Returns the sorted e-mail addresses of every user.
+        :return: List[str]
+        """
+        return sorted(models.User.objects.values_list("email", flat=True))
+
+    def test_lowercases_emails(self):
+        self.create_users("User@Example.com", "admin@example.com")
+
+        lowercase_emails(apps, None)
+
+        self.assertEqual(self.emails(),
+                         ["admin@example.com", "user@example.com"])
+
+    def test_fails_with_conflicting_users(self):
+        self.create_users("User@Example.com", "user@example.com",
+                          "ADMIN@example.com", "Admin@example.com",
+                          "Other@example.com")
+
+        with self.assertRaises(RuntimeError) as cm:
+            lowercase_emails(apps, None)
+
+        self.assertIn("ADMIN@example.com, Admin@example.com; "
+                      "User@Example.com, user@example.com",
+                      str(cm.exception))
+
+        # no e-mail address is changed when any of them conflict
+        self.assertEqual(self.emails(), [
+            "ADMIN@example.com", "Admin@example.com", "Other@example.com",
+            "User@Example.com", "user@example.com"])
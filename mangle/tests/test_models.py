@@ -0,0 +1,138 @@
+import copy
+import tracemalloc
+
+from unittest import mock
+
+from django.db import models as django_models
+from django.db.models import signals
+from django.test import TestCase
+from mangle.common import models
+from mangle.tests import benchmark, measure, report
+
+
+class ChangeTrackingTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        # the groups are bulk created, since the post-save signal changes the
+        # firewall
+        cls.default = models.Group(name="Default")
+        cls.admins = models.Group(name="Admins")
+        models.Group.objects.bulk_create([cls.default, cls.admins])
+
+        models.User.objects.bulk_create([
+            models.User(email="user@example.com", group=cls.default)])
+
+    def setUp(self):
+        self.user = models.User.objects.get(email="user@example.com")
+
+    def test_unchanged(self):
+        self.assertEqual(self.user.changed_fields, set())
+        self.assertFalse(self.user.has_changed("group_id"))
+        self.assertEqual(self.user.previous("group_id"), self.default.id)
+
+    def test_changed(self):
+        self.user.group = self.admins
+
+        self.assertEqual(self.user.changed_fields, {"group_id"})
+        self.assertTrue(self.user.has_changed("group_id"))
+        self.assertEqual(self.user.previous("group_id"), self.default.id)
+
+    def test_changed_back(self):
+        self.user.group = self.admins
+        self.user.group = self.default
+
+        self.assertFalse(self.user.has_changed("group_id"))
+
+    def test_untracked_field(self):
+        self.user.is_admin = True
+
+        self.assertEqual(self.user.changed_fields, set())
+        with self.assertRaises(ValueError):
+            self.user.has_changed("is_admin")
+        with self.assertRaises(ValueError):
+            self.user.previous("is_admin")
+
+    def test_save_snapshots_saved_values(self):
+        seen = []
+
+        def receiver(instance, **kwargs):
+            seen.append((instance.has_changed("group_id"),
+                         instance.previous("group_id")))
+
+        signals.post_save.connect(receiver, sender=models.User)
+        self.addCleanup(signals.post_save.disconnect, receiver,
+                        sender=models.User)
+
+        self.user.group = self.admins
+        self.user.save()
+
+        # the receivers see the change, but it is saved afterwards
+        self.assertEqual(seen, [(True, self.default.id)])
+        self.assertFalse(self.user.has_changed("group_id"))
+        self.assertEqual(self.user.previous("group_id"), self.admins.id)
+
+    def test_deferred_field_is_not_loaded(self):
+        with self.assertNumQueries(1):
+            user = models.User.objects.only("email").get(pk=self.user.pk)
+
+        self.assertIsNone(user.previous("group_id"))
+
+
+def _copying_init(self, *args, **kwargs):
+    """
+    Initializes the model and keeps a shallow copy of it, the way that every
+    model was initialized before only the tracked fields were snapshotted.
+    :return: None
+    """
+    django_models.Model.__init__(self, *args, **kwargs)
+    self.original = copy.copy(self)
+
+
+@benchmark
+class EventLoadBenchmark(TestCase):
+    EVENTS = 100000
+
+    @classmethod
+    def setUpTestData(cls):
+        group = models.Group(name="Default")
+        models.Group.objects.bulk_create([group])
+
+        user = models.User(email="user@example.com", group=group)
+        models.User.objects.bulk_create([user])
+
+        models.Event.objects.bulk_create([
+            models.Event(name="user.login", detail="192.0.2.1", user=user)
+            for _ in range(cls.EVENTS)], batch_size=500)
+
+    def load(self):
+        """
+        Loads every event.
+        :return: List[Event]
+        """
+        return list(models.Event.objects.all())
+
+    def peak_memory(self):
+        """
+        Returns the peak memory allocated while loading every event in MB.
+        :return: float
+        """
+        tracemalloc.start()
+        try:
+            self.load()
+            return tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+
+    def test_load(self):
+        tracked = measure(self.load, repeat=3)
+        tracked_memory = self.peak_memory()
+
+        with mock.patch.object(models.Model, "__init__", _copying_init):
+            copied = measure(self.load, repeat=3)
+            copied_memory = self.peak_memory()
+
+        report("load events", events=self.EVENTS,
+               tracked="{:.0f}ms".format(tracked * 1000),
+               tracked_peak="{:.0f}MB".format(tracked_memory),
+               copied="{:.0f}ms".format(copied * 1000),
+               copied_peak="{:.0f}MB".format(copied_memory))
@@ -0,0 +1,252 @@
+import asyncio
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+from mangle.common import openvpn
+
+
+GREETING = (">INFO:OpenVPN Management Interface Version 1 -- type 'help' for "
+            "more info")
+"""str: the greeting that OpenVPN sends on each new management connection."""
+
+STATUS_2 = [
+    "TITLE,OpenVPN 2.4.7 x86_64-pc-linux-gnu [SSL (OpenSSL)] [LZO] [LZ4]",
+    "TIME,Sat Oct 17 09:00:00 2026,1792227600",
+    "HEADER,CLIENT_LIST,Common Name,Real Address,Virtual Address,"
+    "Virtual IPv6 Address,Bytes Received,Bytes Sent,Connected Since,"
+    "Connected Since (time_t),Username,Client ID,Peer ID",
+    "CLIENT_LIST,jane@example.com:laptop,192.0.2.10:51234,10.8.0.6,,2048,"
+    "4096,Sat Oct 17 08:55:00 2026,1792227300,UNDEF,7,0",
+    "HEADER,ROUTING_TABLE,Virtual Address,Common Name,Real Address,"
+    "Last Ref,Last Ref (time_t)",
+    "ROUTING_TABLE,10.8.0.6,jane@example.com:laptop,192.0.2.10:51234,"
+    "Sat Oct 17 08:59:58 2026,1792227598",
+    "GLOBAL_STATS,Max bcast/mcast queue length,0",
+    "END",
+]
+"""List[str]: a recorded `status 2` response."""
+
+CLIENT_CONNECT = [
+    ">CLIENT:ESTABLISHED,7",
+    ">CLIENT:ENV,common_name=jane@example.com:laptop",
+    ">CLIENT:ENV,trusted_ip=192.0.2.10",
+    ">CLIENT:ENV,END",
+]
+"""List[str]: a recorded CLIENT notification with its environment."""
+
+
+class FakeManagementServer:
+    """
+    FakeManagementServer is a management socket server that replays a recorded
+    OpenVPN transcript. The transcript maps each expected command to the lines
+    that are sent in response, and `on_connect` lines are sent after the
+    greeting of each connection.
+    """
+    def __init__(self, path, transcript, on_connect=()):
+        self.path = path
+        self.transcript = transcript
+        self.on_connect = list(on_connect)
+        self.commands = []
+        self.connections = 0
+        self.server = None
+        self.writers = []
+
+    async def start(self):
+        self.server = await asyncio.start_unix_server(self.handle, self.path)
+
+    async def stop(self):
+        self.drop()
+        self.server.close()
+        await self.server.wait_closed()
+
+    def drop(self):
+        """
+        Closes all of the open connections, as if OpenVPN was restarted.
+        :return: None
+        """
+        for writer in self.writers:
+            writer.close()
+        self.writers = []
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        self.writers.append(writer)
+        self.send(writer, [GREETING] + self.on_connect)
+
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+
+            command = line.decode("utf-8").rstrip("\r\n")
+            self.commands.append(command)
+
+            response = self.transcript.get(command)
+            if response is not None:
+                self.send(writer, response)
+
+    def send(self, writer, lines):
+        writer.write(b"".join(bytes(l + "\r\n", "utf-8") for l in lines))
+
+
+class AsyncManagementTest(SimpleTestCase):
+    transcript = {
+        "bytecount 5": ["SUCCESS: bytecount interval changed"],
+        "kill 192.0.2.10": ["SUCCESS: common name 'jane' found, 1 client(s) "
+                            "killed"],
+        "kill 192.0.2.99": ["ERROR: common name '192.0.2.99' not found"],
+        "status 2": STATUS_2[:4] + [">BYTECOUNT_CLI:7,2048,4096"] +
+                    STATUS_2[4:],
+    }
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(self.loop.close)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "management.sock")
+
+    def run_transcript(self, test, transcript=None, on_connect=()):
+        """
+        Runs the given coroutine function with a management client connected
+        to a fake server replaying the transcript, and returns the server.
+        :return: FakeManagementServer
+        """
+        server = FakeManagementServer(
+            self.path, transcript or self.transcript, on_connect)
+
+        async def run():
+            await server.start()
+            management = openvpn.AsyncManagement(
+                self.path, init_commands=["bytecount 5"], min_delay=0.01)
+
+            try:
+                await asyncio.wait_for(management.start(), 5)
+                await asyncio.wait_for(test(management, server), 5)
+            finally:
+                await management.close()
+                await server.stop()
+
+        self.loop.run_until_complete(run())
+        return server
+
+    def test_single_line_responses(self):
+        async def test(management, server):
+            response = await management.run("kill", "192.0.2.10")
+            self.assertIn("1 client(s) killed", response)
+
+            with self.assertRaisesRegex(openvpn.ManagementError, "not found"):
+                await management.run("kill", "192.0.2.99")
+
+        server = self.run_transcript(test)
+        self.assertEqual(server.commands, [
+            "bytecount 5", "kill 192.0.2.10", "kill 192.0.2.99"])
+
+    def test_multi_line_response_with_notification(self):
+        async def test(management, server):
+            lines = await management.run("status", "2")
+            self.assertEqual(lines, STATUS_2[:-1])
+
+            status = openvpn.parse_status(lines)
+            self.assertEqual(status.time, 1792227600)
+            self.assertEqual(status.clients[0]["Common Name"],
+                             "jane@example.com:laptop")
+            self.assertEqual(status.clients[0]["Client ID"], "7")
+
+            # the notification sent between the response lines is published
+            # after the greeting
+            notification = await management.events.get()
+            self.assertEqual(notification.type, "INFO")
+
+            notification = await management.events.get()
+            self.assertEqual(notification, openvpn.Notification(
+                "BYTECOUNT_CLI", "7,2048,4096", {}))
+
+        self.run_transcript(test)
+
+    def test_client_notification_env(self):
+        async def test(management, server):
+            notifications = management.notifications()
+
+            notification = await notifications.__anext__()
+            self.assertEqual(notification.type, "INFO")
+
+            notification = await notifications.__anext__()
+            self.assertEqual(notification.type, "CLIENT")
+            self.assertEqual(notification.message, "ESTABLISHED,7")
+            self.assertEqual(notification.env, {
+                "common_name": "jane@example.com:laptop",
+                "trusted_ip": "192.0.2.10",
+            })
+
+        self.run_transcript(test, on_connect=CLIENT_CONNECT)
+
+    def test_reconnect_resends_init_commands(self):
+        async def test(management, server):
+            server.drop()
+
+            while server.connections < 2:
+                await asyncio.sleep(0.01)
+
+            # the command is only sent after the init commands
+            response = await management.run("kill", "192.0.2.10")
+            self.assertIn("killed", response)
+
+        server = self.run_transcript(test)
+        self.assertEqual(server.connections, 2)
+        self.assertEqual(server.commands, [
+            "bytecount 5", "bytecount 5", "kill 192.0.2.10"])
+
+    def test_connection_lost_fails_pending_command(self):
+        transcript = dict(self.transcript, **{"status 3": []})
+
+        async def test(management, server):
+            command = asyncio.ensure_future(management.run("status", "3"))
+            await asyncio.sleep(0.05)
+            server.drop()
+
+            with self.assertRaisesRegex(openvpn.ManagementError, "lost"):
+                await command
+
+        self.run_transcript(test, transcript)
+
+    def test_abandoned_command_keeps_responses_in_order(self):
+        transcript = dict(self.transcript, **{"status 3": []})
+
+        async def test(management, server):
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(management.run("status", "3"), 0.05)
+
+            # the late response belongs to the abandoned command, not to the
+            # command that is sent next
+            server.send(server.writers[0], ["SUCCESS: late"])
+            response = await management.run("kill", "192.0.2.10")
+            self.assertIn("killed", response)
+
+        server = self.run_transcript(test, transcript)
+        self.assertEqual(server.connections, 1)
+
+
+class ParseStatusTest(SimpleTestCase):
+    def test_status_2(self):
+        status = openvpn.parse_status(STATUS_2)
+
+        self.assertEqual(status.time, 1792227600)
+        self.assertEqual(len(status.clients), 1)
+        self.assertEqual(status.clients[0]["Virtual Address"], "10.8.0.6")
+
+    def test_status_3(self):
+        lines = [line.replace(",", "\t") for line in STATUS_2]
+        status = openvpn.parse_status(lines)
+
+        self.assertEqual(status.clients[0]["Real Address"], "192.0.2.10:51234")
+
+    def test_status_1(self):
+        lines = ["OpenVPN CLIENT LIST", "Updated,Sat Oct 17 09:00:00 2026",
+                 "Common Name,Real Address,Bytes Received,Bytes Sent,"
+                 "Connected Since", "END"]
+
+        self.assertIsNone(openvpn.parse_status(lines))
@@ -0,0 +1,255 @@
+import os
+import shutil
+import ssl
+import tempfile
+import time
+
+from unittest import mock
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from django.test import SimpleTestCase
+from mangle.common import pki
+from mangle.tests import benchmark, measure, patch_config, report
+
+
+class PkiTestCase(SimpleTestCase):
+    """
+    PkiTestCase creates a certificate authority with the given key algorithm
+    and sets it as the application certificate authority for each test.
+    """
+    algorithm = "ecdsa-p256"
+    key_size = 2048
+
+    def setUp(self):
+        self.use_algorithm(self.algorithm, self.key_size)
+
+    def use_algorithm(self, algorithm, key_size=2048):
+        """
+        Sets the key algorithm and creates a new certificate authority.
+        :return: None
+        """
+        patch_config(self, pki_key_algorithm=algorithm, pki_key_size=key_size)
+
+        self.ca = pki.create_keypair("OpenVPN CA", 3650, False, True)
+        crt, key = self.ca.pem()
+        patch_config(self, ca_crt=crt, ca_key=key)
+
+    def create_client(self):
+        """
+        Returns a new client keypair, which never uses the key pool.
+        :return: KeyPair
+        """
+        return pki.create_keypair("user@example.com:laptop", 365, False, False)
+
+
+class KeyAlgorithmTest(PkiTestCase):
+    def test_ecdsa_p256(self):
+        server = pki.create_server_keypair("server", 365)
+
+        self.assertIsInstance(server.key.curve, ec.SECP256R1)
+        self.assertIsInstance(server.crt.signature_hash_algorithm,
+                              hashes.SHA256)
+        self.assertEqual(pki.key_curve(server.private_key_pem), "prime256v1")
+
+        # elliptic curve keys can't be used for key encipherment
+        usage = server.crt.extensions.get_extension_for_class(x509.KeyUsage)
+        self.assertFalse(usage.value.key_encipherment)
+
+    def test_ecdsa_p384(self):
+        self.use_algorithm("ecdsa-p384")
+        client = self.create_client()
+
+        self.assertIsInstance(client.key.curve, ec.SECP384R1)
+        self.assertIsInstance(client.crt.signature_hash_algorithm,
+                              hashes.SHA384)
+        self.assertEqual(pki.key_curve(client.private_key_pem), "secp384r1")
+
+    def test_rsa(self):
+        self.use_algorithm("rsa", 2048)
+        server = pki.create_server_keypair("server", 365)
+
+        self.assertIsInstance(server.key, rsa.RSAPrivateKey)
+        self.assertEqual(server.key.key_size, 2048)
+        self.assertIsInstance(server.crt.signature_hash_algorithm,
+                              hashes.SHA512)
+        self.assertIsNone(pki.key_curve(server.private_key_pem))
+
+        usage = server.crt.extensions.get_extension_for_class(x509.KeyUsage)
+        self.assertTrue(usage.value.key_encipherment)
+
+    def test_unknown_algorithm_uses_rsa(self):
+        patch_config(self, pki_key_algorithm="ed448")
+
+        self.assertEqual(pki.key_algorithm(), "rsa")
+
+    def test_handshake(self):
+        handshake = Handshake(self.ca, pki.create_server_keypair("server", 365),
+                              self.create_client())
+        handshake.run()
+
+        self.assertEqual(handshake.server.getpeercert()["subject"],
+                         ((("commonName", "user@example.com:laptop"), ), ))
+
+
+class CertificateAuthorityTest(PkiTestCase):
+    def test_keypair_is_cached(self):
+        ca = pki.certificate_authority()
+
+        self.assertIs(pki.certificate_authority(), ca)
+        self.assertEqual(ca.fingerprint, self.ca.fingerprint)
+
+    def test_cache_is_replaced_when_settings_change(self):
+        ca = pki.certificate_authority()
+        self.use_algorithm(self.algorithm)
+
+        self.assertIsNot(pki.certificate_authority(), ca)
+        self.assertEqual(pki.certificate_authority().fingerprint,
+                         self.ca.fingerprint)
+
+    def test_client_is_signed_by_ca(self):
+        client = self.create_client()
+
+        self.assertEqual(client.crt.issuer, self.ca.crt.subject)
+        self.ca.key.public_key().verify(
+            client.crt.signature, client.crt.tbs_certificate_bytes,
+            ec.ECDSA(client.crt.signature_hash_algorithm))
+
+
+class Handshake:
+    """
+    Handshake performs TLS handshakes between a server and a client that
+    authenticate each other with the given keypairs, like the OpenVPN server
+    and its clients. The handshakes are performed in memory, so the time spent
+    by each side is only the time spent on cryptography.
+    """
+    def __init__(self, ca, server, client):
+        self.tmp = tempfile.mkdtemp()
+
+        try:
+            self.server_context = self.context(ssl.PROTOCOL_TLS_SERVER, ca,
+                                               server)
+            self.client_context = self.context(ssl.PROTOCOL_TLS_CLIENT, ca,
+                                               client)
+        finally:
+            shutil.rmtree(self.tmp)
+
+        self.client_context.check_hostname = False
+        self.server_time = 0.0
+
+    def context(self, protocol, ca, keypair):
+        """
+        Returns an SSL context that requires a certificate signed by the given
+        certificate authority from its peer.
+        :return: ssl.SSLContext
+        """
+        crt, key = keypair.pem()
+        path = os.path.join(self.tmp, "keypair.pem")
+
+        with open(path, "w") as f:
+            f.write(crt + key)
+
+        context = ssl.SSLContext(protocol)
+        context.load_cert_chain(path)
+        context.load_verify_locations(cadata=ca.certificate_pem)
+        context.verify_mode = ssl.CERT_REQUIRED
+        return context
+
+    def run(self):
+        """
+        Performs a single handshake.
+        :return: None
+        """
+        client_in, client_out = ssl.MemoryBIO(), ssl.MemoryBIO()
+        server_in, server_out = ssl.MemoryBIO(), ssl.MemoryBIO()
+
+        client = self.client_context.wrap_bio(client_in, client_out)
+        self.server = self.server_context.wrap_bio(server_in, server_out,
+                                                   server_side=True)
+
+        client_done = server_done = False
+
+        while not (client_done and server_done):
+            if not client_done:
+                client_done = self.step(client)
+            server_in.write(client_out.read())
+
+            if not server_done:
+                started = time.perf_counter()
+                server_done = self.step(self.server)
+                self.server_time += time.perf_counter() - started
+            client_in.write(server_out.read())
+
+    def step(self, sock):
+        """
+        Continues the handshake of the given side and returns whether it has
+        finished.
+        :return: bool
+        """
+        try:
+            sock.do_handshake()
+            return True
+        except ssl.SSLWantReadError:
+            return False
+
+
+@benchmark
+class KeyAlgorithmBenchmark(PkiTestCase):
+    HANDSHAKES = 50
+
+    def test_handshake_cpu(self):
+        for algorithm, key_size in (("rsa", 2048), ("rsa", 4096),
+                                    ("ecdsa-p256", 0), ("ecdsa-p384", 0)):
+            self.use_algorithm(algorithm, key_size or 2048)
+
+            keygen = measure(pki.generate_private_key, repeat=3)
+            server = pki.create_server_keypair("server", 365)
+            client = self.create_client()
+            sign = measure(pki.create_crl, *range(1, 101), repeat=10)
+
+            handshake = Handshake(self.ca, server, client)
+            total = measure(handshake.run, repeat=self.HANDSHAKES)
+            handshake.server_time = 0.0
+
+            for _ in range(self.HANDSHAKES):
+                handshake.run()
+
+            report("pki " + algorithm,
+                   key_size=key_size or server.key.curve.key_size,
+                   keygen="{:.1f}ms".format(keygen * 1000),
+                   crl_sign="{:.2f}ms".format(sign * 1000),
+                   handshake="{:.2f}ms".format(total * 1000),
+                   server_handshake="{:.2f}ms".format(
+                       handshake.server_time / self.HANDSHAKES * 1000))
+
+
+@benchmark
+class CertificateAuthorityBenchmark(PkiTestCase):
+    SIGNATURES = 200
+
+    def sign(self, private_key):
+        """
+        Signs client certificates for the given private key.
+        :return: None
+        """
+        for _ in range(self.SIGNATURES):
+            pki.create_keypair("user@example.com:laptop", 365, False, False,
+                               private_key)
+
+    def test_signing(self):
+        for algorithm, key_size in (("rsa", 4096), ("ecdsa-p256", 2048)):
+            self.use_algorithm(algorithm, key_size)
+            private_key = pki.generate_private_key()
+
+            cached = measure(self.sign, private_key)
+
+            # parses the certificate authority for every signature, like it
+            # was before the keypair was cached
+            with mock.patch("mangle.common.pki.certificate_authority",
+                            lambda: pki.load_keypair(*self.ca.pem())):
+                parsed = measure(self.sign, private_key)
+
+            report("pki ca " + algorithm,
+                   signatures=self.SIGNATURES,
+                   cached="{:.2f}ms".format(cached / self.SIGNATURES * 1000),
+                   parsed="{:.2f}ms".format(parsed / self.SIGNATURES * 1000))
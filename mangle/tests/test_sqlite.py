@@ -0,0 +1,226 @@
+import os
+import shutil
+import statistics
+import tempfile
+import threading
+import time
+import unittest
+
+from django.db import OperationalError, connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import SimpleTestCase, override_settings
+from mangle.tests import benchmark, report
+
+
+SQLITE = connection.vendor == "sqlite"
+"""bool: whether the application is configured with an SQLite database."""
+
+
+def _connect(path, options):
+    """
+    Returns a new SQLite connection to the given database file, which is
+    configured like the application's connections (including its PRAGMAs).
+    :return: DatabaseWrapper
+    """
+    settings_dict = dict(connection.settings_dict, NAME=path, OPTIONS=options)
+    return DatabaseWrapper(settings_dict, alias="stress")
+
+
+def _percentile(values, percent):
+    """
+    Returns the given percentile of the values in milliseconds.
+    :return: str
+    """
+    if not values:
+        return "-"
+
+    values = sorted(values)
+    value = values[min(len(values) - 1, int(len(values) * percent / 100))]
+    return "{:.1f}ms".format(value * 1000)
+
+
+class Stress:
+    """
+    Stress runs hook writers, which each write a client event per transaction
+    like the hook service, concurrently with web readers, which page through
+    the events like the admin UI, each on their own connection to a database
+    file. The duration of each write is recorded, which is mostly the time
+    spent waiting for the write lock.
+    """
+    def __init__(self, options, writers=4, readers=4, writes=100):
+        self.options = options
+        self.writers = writers
+        self.readers = readers
+        self.writes = writes
+        self.write_times = []
+        self.read_times = []
+        self.errors = []
+        self.lock = threading.Lock()
+
+    def run(self):
+        """
+        Runs the writers and readers until every writer has finished.
+        :return: None
+        """
+        tmp = tempfile.mkdtemp()
+        self.path = os.path.join(tmp, "stress.sqlite3")
+
+        try:
+            self.setup()
+
+            self.done = threading.Event()
+            self.barrier = threading.Barrier(self.writers + self.readers)
+
+            writers = [threading.Thread(target=self.write)
+                       for _ in range(self.writers)]
+            readers = [threading.Thread(target=self.read)
+                       for _ in range(self.readers)]
+
+            for thread in readers + writers:
+                thread.start()
+
+            for thread in writers:
+                thread.join()
+
+            self.done.set()
+            for thread in readers:
+                thread.join()
+        finally:
+            shutil.rmtree(tmp)
+
+    def setup(self):
+        """
+        Creates the events table with enough events that each page read takes
+        a while.
+        :return: None
+        """
+        db = _connect(self.path, self.options)
+
+        with db.cursor() as cursor:
+            cursor.execute(
+                "CREATE TABLE event (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "name TEXT, detail TEXT, created_at REAL)")
+            cursor.execute("CREATE INDEX event_created_at ON event "
+                           "(created_at)")
+            cursor.executemany(
+                "INSERT INTO event (name, detail, created_at) "
+                "VALUES (?, ?, ?)",
+                [("client.connect", "x" * 100, i) for i in range(20000)])
+
+        db.close()
+
+    def write(self):
+        """
+        Writes a client event in each transaction.
+        :return: None
+        """
+        db = _connect(self.path, self.options)
+        times = []
+
+        try:
+            self.barrier.wait()
+
+            for _ in range(self.writes):
+                started = time.perf_counter()
+
+                try:
+                    with db.cursor() as cursor:
+                        cursor.execute("BEGIN")
+                        cursor.execute(
+                            "INSERT INTO event (name, detail, created_at) "
+                            "VALUES (?, ?, ?)",
+                            ("client.connect", "x" * 100, time.time()))
+                        cursor.execute("COMMIT")
+                except OperationalError as e:
+                    db.close()
+                    with self.lock:
+                        self.errors.append(e)
+                    continue
+
+                times.append(time.perf_counter() - started)
+        finally:
+            db.close()
+
+        with self.lock:
+            self.write_times.extend(times)
+
+    def read(self):
+        """
+        Reads the newest page of events and the number of events until the
+        writers have finished.
+        :return: None
+        """
+        db = _connect(self.path, self.options)
+        times = []
+
+        try:
+            self.barrier.wait()
+
+            while not self.done.is_set():
+                started = time.perf_counter()
+
+                try:
+                    with db.cursor() as cursor:
+                        cursor.execute("SELECT COUNT(*) FROM event")
+                        cursor.fetchall()
+                        cursor.execute(
+                            "SELECT * FROM event ORDER BY created_at DESC "
+                            "LIMIT 30")
+                        cursor.fetchall()
+                except OperationalError as e:
+                    db.close()
+                    with self.lock:
+                        self.errors.append(e)
+                    continue
+
+                times.append(time.perf_counter() - started)
+        finally:
+            db.close()
+
+        with self.lock:
+            self.read_times.extend(times)
+
+    def report(self, name):
+        """
+        Writes the lock waits of the writers and the read times.
+        :return: None
+        """
+        report(name,
+               writes=len(self.write_times),
+               reads=len(self.read_times),
+               errors=len(self.errors),
+               write_p50=_percentile(self.write_times, 50),
+               write_p99=_percentile(self.write_times, 99),
+               write_max=_percentile(self.write_times, 100),
+               read_p50=_percentile(self.read_times, 50),
+               read_mean="{:.1f}ms".format(
+                   statistics.mean(self.read_times) * 1000
+                   if self.read_times else 0))
+
+
+@unittest.skipUnless(SQLITE, "the database is not SQLite")
+class SqliteStressTest(SimpleTestCase):
+    def test_writers_and_readers_do_not_fail(self):
+        stress = Stress(connection.settings_dict["OPTIONS"], writes=25)
+        stress.run()
+
+        self.assertEqual(stress.errors, [])
+        self.assertEqual(len(stress.write_times), 4 * 25)
+        self.assertTrue(stress.read_times)
+
+
+@benchmark
+@unittest.skipUnless(SQLITE, "the database is not SQLite")
+class SqliteStressBenchmark(SimpleTestCase):
+    def test_tuned(self):
+        stress = Stress(connection.settings_dict["OPTIONS"], writers=8,
+                        readers=8, writes=200)
+        stress.run()
+        stress.report("sqlite tuned")
+
+    @override_settings(SQLITE_PRAGMAS={})
+    def test_default(self):
+        # the sqlite3 module's default lock timeout is 5 seconds
+        stress = Stress({"timeout": 5}, writers=8, readers=8, writes=200)
+        stress.run()
+        stress.report("sqlite default")
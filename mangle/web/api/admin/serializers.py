@@ -1,9 +1,12 @@
+import collections
 import logging
+import multiprocessing
 
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
 from rest_framework import serializers
 from mangle.cli.management.commands import install
-from mangle.common import config, models, validators
+from mangle.common import config, firewall, models, validators
 from mangle.common.utils import bash, fs, net
 
 
@@ -84,31 +87,83 @@ class UserInviteSerializer(serializers.Serializer):
     def save(self, **kwargs):
         """
         Creates or updates the user for each e-mail address and returns a list
-        containing all of the users that were created (but not updated).
+        containing all of the users that were created (but not updated). The
+        existing users are found and updated with one query per
+        `QUERY_CHUNK_SIZE` e-mail addresses, and new users are created with a
+        single bulk INSERT.
         :return: List[User]
         """
         self.is_valid(True)
 
-        users = []
+        group = models.Group.objects.get(pk=self.validated_data["group_id"])
+        emails = list(collections.OrderedDict.fromkeys(
+            self.validated_data["email"]))
+
+        existing = {}
+        for user in models.User.objects.by_emails(emails):
+            existing[user.email] = user
+
+        # new users will have a password set
+        users = [models.User(email=email, group=group, is_enabled=True)
+                 for email in emails if email not in existing]
+        _reset_passwords(users)
+        models.User.objects.bulk_create(users)
 
         # if an e-mail address already exists, then that user is just updated
         # with the group and has their account enabled
-        for email in self.validated_data["email"]:
-            user = models.User.objects.by_email(email)
+        existing_ids = [user.pk for user in existing.values()]
+        for queryset in models.User.objects.filter_in("pk", existing_ids):
+            queryset.update(group=group, is_enabled=True)
 
-            if not user:
-                user = models.User(email=email)
+        _move_users(group, [u for u in existing.values()
+                            if u.group_id != group.id])
 
-                # new users will have a password set
-                password = user.reset_password()
-                user.temp_password = password
-                users.append(user)
+        return users
 
-            user.group_id = self.validated_data["group_id"]
-            user.is_enabled = True
-            user.save()
 
-        return users
+def _reset_passwords(users):
+    """
+    Sets a new temporary password and two-factor authentication secret for
+    each of the given new users. Passwords are hashed on a thread pool, since
+    hashing is slow by design and releases the GIL.
+    :return: None
+    """
+    def reset(user):
+        user.temp_password = user.reset_password()
+        user.reset_mfa()
+
+    with ThreadPoolExecutor(max_workers=multiprocessing.cpu_count()) as pool:
+        list(pool.map(reset, users))
+
+
+def _move_users(group, users):
+    """
+    Moves the connected clients of the given users, who were moved into the
+    given group by a bulk update, to the group's firewall rules. If the group
+    is disabled, then the clients are disconnected instead.
+    :return: None
+    """
+    if not users:
+        return
+
+    querysets = models.Client.objects.filter_in("device__user", users)
+
+    if not group.is_enabled:
+        for queryset in querysets:
+            queryset.delete()
+        return
+
+    clients = []
+    for queryset in querysets:
+        clients.extend(queryset.select_related("device__user__group"))
+
+    old_groups = models.Group.objects.in_bulk(
+        list(set(u.group_id for u in users)))
+
+    firewall.move_clients(
+        clients,
+        {u.id: old_groups.get(u.group_id) for u in users},
+    )
 
 
 #######################################
@@ -268,9 +323,13 @@ class ClientSerializer(serializers.ModelSerializer):
         fields = ("id",
                   "created_at",
                   "updated_at",
+                  "bytes_received",
+                  "bytes_sent",
                   "device",
                   "duration",
                   "platform",
+                  "rate_received",
+                  "rate_sent",
                   "remote_ip",
                   "virtual_ip", )
 
@@ -479,6 +538,8 @@ class MailSettingSerializer(BaseSettingSerializer):
 
 class VpnSettingSerializer(BaseSettingSerializer):
     vpn_domain = serializers.CharField(allow_blank=True, required=False)
+    vpn_firewall_backend = serializers.CharField(default="iptables")
+    vpn_firewall_ipset = serializers.BooleanField(default=False)
     vpn_hostname = serializers.CharField(required=True)
     vpn_interface = serializers.CharField(required=True)
     vpn_nameservers = serializers.CharField(allow_blank=True, required=False)
@@ -497,6 +558,17 @@ class VpnSettingSerializer(BaseSettingSerializer):
         super().save(**kwargs)
         config.set("vpn_restart_pending", True)
 
+    def validate_vpn_firewall_backend(self, value):
+        """
+        Validates and returns the VPN firewall backend.
+        :return: str
+        """
+        if value.lower() not in ("iptables", "nftables"):
+            raise serializers.ValidationError(
+                "Firewall backend must be iptables or nftables."
+            )
+        return value.lower()
+
     def validate_vpn_hostname(self, value):
         """
         Validates and returns the VPN hostname.
@@ -15,6 +15,9 @@ router.register("openvpn", views.OpenVPNViewSet, base_name="openvpn")
 urlpatterns = [
     path("", include(router.urls)),
 
+    # PKI
+    path("pki/pool", views.KeyPoolView.as_view()),
+
     # Settings
     path("settings/app", views.AppSettingView.as_view()),
     path("settings/mail", views.MailSettingView.as_view()),
@@ -2,13 +2,15 @@ import logging
 import time
 
 from django.conf import settings
-from django.http.response import JsonResponse
+from django.http import Http404
+from django.http.response import JsonResponse, StreamingHttpResponse
+from django.template.loader import render_to_string
 from rest_framework import filters, status, views, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from mangle.common import config, mail, models, openvpn
+from mangle.common import config, events, mail, models, openvpn, pki
 from mangle.common.utils import bash
-from mangle.web.api import authentication
+from mangle.web.api import authentication, export, pagination
 from mangle.web.api.admin import permissions, serializers
 
 
@@ -22,16 +24,104 @@ class AdminView(views.APIView):
 
 
 class AdminViewSet(AdminView, viewsets.GenericViewSet):
-    pass
+    select_related = ()
+    """Tuple[str]: the relations joined into every queryset of the view."""
+
+    prefetch_related = ()
+    """Tuple[str]: the relations prefetched for every queryset of the view."""
+
+    cursor_pagination_class = None
+    """type: the pagination class used when `pagination=cursor` is requested."""
+
+    @property
+    def paginator(self):
+        """
+        Returns the view's paginator. If the view supports cursor pagination and
+        it is requested, then the cursor paginator is used instead.
+        :return: BasePagination
+        """
+        if not hasattr(self, "_paginator"):
+            pagination_type = self.request.query_params.get("pagination")
+
+            if self.cursor_pagination_class and pagination_type == "cursor":
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = super().paginator
+
+        return self._paginator
+
+    def get_queryset(self):
+        """
+        Returns the view's queryset with the declared relations joined and
+        prefetched, so serializing a page of results takes the same number of
+        queries regardless of the page size.
+        :return: QuerySet
+        """
+        queryset = super().get_queryset()
+
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+
+        return queryset
+
+
+class ExportMixin:
+    export_fields = ()
+    """Tuple[str]: the field lookups that are included in exported rows."""
+
+    export_chunk_size = 2000
+    """int: the number of rows fetched from the database at a time."""
+
+    @action(["GET"], detail=False)
+    def export(self, request, *args, **kwargs):
+        """
+        Streams all of the rows matching the `search` query parameter as NDJSON
+        or, if `output=csv` is requested, as CSV. The rows are fetched in chunks
+        and never loaded into memory as a whole.
+        :return: StreamingHttpResponse
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+
+        rows = queryset.values_list(*self.export_fields).iterator(
+            chunk_size=self.export_chunk_size)
+
+        if request.query_params.get("output") == "csv":
+            response = StreamingHttpResponse(
+                export.csv_lines(self.export_fields, rows),
+                content_type="text/csv",
+            )
+            extension = "csv"
+        else:
+            response = StreamingHttpResponse(
+                export.ndjson_lines(self.export_fields, rows),
+                content_type="application/x-ndjson",
+            )
+            extension = "ndjson"
+
+        response["Content-Disposition"] = "attachment; filename={}.{}".format(
+            queryset.model._meta.db_table, extension)
+        return response
 
 
 #######################################
 # User
 #######################################
 
-class UserAdminViewSet(AdminView, viewsets.ModelViewSet):
+class UserAdminViewSet(ExportMixin, AdminViewSet, viewsets.ModelViewSet):
     queryset = models.User.objects.all()
     serializer_class = serializers.UserSerializer
+    select_related = ("group", )
+    export_fields = ("id",
+                     "created_at",
+                     "email",
+                     "name",
+                     "group__name",
+                     "is_admin",
+                     "is_enabled",
+                     "last_login",
+                     "mfa_enabled", )
     search_fields = ("email", "name", "group__name", )
 
     def create(self, request, *args, **kwargs):
@@ -46,7 +136,13 @@ class UserAdminViewSet(AdminView, viewsets.ModelViewSet):
         # contains the e-mail and password that is returned to the UI
         emails_passwords = []
 
-        # send e-mail notifications if desired
+        # contains the e-mail notifications, which are sent by a single task
+        messages = []
+
+        organization = config.get("app_organization")
+        subject = "Welcome to the {} VPN!".format(organization)
+        url = config.url()
+
         for user in users:
             emails_passwords.append({
                 "email": user.email,
@@ -54,19 +150,16 @@ class UserAdminViewSet(AdminView, viewsets.ModelViewSet):
             })
 
             if request.data.get("notify", False):
-                organization = config.get("app_organization")
-
-                mail.send_template(
-                    recipient=user.email,
-                    subject="Welcome to the {} VPN!".format(organization),
-                    template="mail/Welcome.html",
-                    data={
+                messages.append((user.email, subject, render_to_string(
+                    "mail/Welcome.html", {
                         "email": user.email,
                         "organization": organization,
                         "password": user.temp_password,
-                        "url": config.url(),
-                    }
-                )
+                        "url": url,
+                    },
+                )))
+
+        mail.send_many(messages)
 
         return Response(emails_passwords, status=status.HTTP_201_CREATED)
 
@@ -184,39 +277,116 @@ class FirewallAdminViewSet(AdminViewSet, viewsets.ModelViewSet):
 # Device
 #######################################
 
-class DeviceAdminViewSet(AdminViewSet, viewsets.mixins.DestroyModelMixin):
+class DeviceAdminViewSet(ExportMixin,
+                         AdminViewSet,
+                         viewsets.mixins.DestroyModelMixin):
     queryset = models.Device.objects.all()
     serializer_class = serializers.UserDeviceSerializer
+    search_fields = ("name",
+                     "user__email",
+                     "user__name", )
+    export_fields = ("id",
+                     "created_at",
+                     "name",
+                     "expires_at",
+                     "last_login",
+                     "user__email", )
 
 
 #######################################
 # Client
 #######################################
 
-class ClientAdminViewSet(AdminViewSet,
+class ClientAdminViewSet(ExportMixin,
+                         AdminViewSet,
                          viewsets.mixins.ListModelMixin,
                          viewsets.mixins.DestroyModelMixin):
     queryset = models.Client.objects.all()
     serializer_class = serializers.ClientSerializer
+    select_related = ("device__user", )
+    cursor_pagination_class = pagination.ApiCursorPagination
     search_fields = ("remote_ip",
                      "virtual_ip",
                      "device__name",
                      "device__user__email",
                      "device__user__name",
                      "device__user__group__name", )
+    export_fields = ("id",
+                     "created_at",
+                     "common_name",
+                     "platform",
+                     "remote_ip",
+                     "virtual_ip",
+                     "bytes_received",
+                     "bytes_sent",
+                     "rate_received",
+                     "rate_sent",
+                     "device__name",
+                     "device__user__email", )
+
+    @action(["GET"], detail=False)
+    def top(self, request, *args, **kwargs):
+        """
+        Returns the clients with the highest current bandwidth usage. The
+        number of clients is given by the `count` query parameter (10 by
+        default, 100 at most). The rates are the latest bandwidth rollup, so
+        this does not query the OpenVPN management interface.
+        :return: Response
+        """
+        try:
+            count = int(request.query_params.get("count", 10))
+        except ValueError:
+            count = 10
+
+        queryset = models.Client.objects.by_rate().select_related(
+            *self.select_related)[:max(1, min(count, 100))]
+
+        return Response(self.get_serializer(queryset, many=True).data)
 
 
 #######################################
 # Event
 #######################################
 
-class EventAdminViewSet(AdminViewSet, viewsets.mixins.ListModelMixin):
+class EventAdminViewSet(ExportMixin,
+                        AdminViewSet,
+                        viewsets.mixins.ListModelMixin):
     queryset = models.Event.objects.all()
     serializer_class = serializers.EventSerializer
+    select_related = ("user", )
+    cursor_pagination_class = pagination.ApiCursorPagination
     search_fields = ("name",
                      "user__email",
                      "user__name",
                      "user__group__name", )
+    export_fields = ("id",
+                     "created_at",
+                     "name",
+                     "detail",
+                     "user__email", )
+
+    @action(["GET"], detail=False)
+    def archive(self, request, *args, **kwargs):
+        """
+        Returns the months that have archived events.
+        :return: Response
+        """
+        return Response(events.archive_months())
+
+    @action(["GET"], detail=False, url_path=r"archive/(?P<month>\d{4}-\d{2})")
+    def archive_month(self, request, month=None, *args, **kwargs):
+        """
+        Streams the archived events of the given month as NDJSON, filtered by
+        the `search` query parameter.
+        :return: StreamingHttpResponse
+        """
+        if month not in events.archive_months():
+            raise Http404
+
+        return StreamingHttpResponse(
+            events.read_archive(month, request.query_params.get("search")),
+            content_type="application/x-ndjson",
+        )
 
 
 #######################################
@@ -261,6 +431,19 @@ class OpenVPNViewSet(AdminViewSet):
         return self.list(request)
 
 
+#######################################
+# PKI
+#######################################
+
+class KeyPoolView(AdminView):
+    def get(self, request):
+        """
+        Returns the private key pool size and hit/miss counts.
+        :return: Response
+        """
+        return Response(pki.key_pool_stats())
+
+
 #######################################
 # Setting
 #######################################
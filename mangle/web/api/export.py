@@ -0,0 +1,59 @@
+import csv
+import datetime
+import json
+import uuid
+
+
+def column_names(fields):
+    """
+    Returns the export column names of the given queryset field lookups, where
+    each related lookup is flattened, eg. "user__email" becomes "user_email".
+    :return: List[str]
+    """
+    return [field.replace("__", "_") for field in fields]
+
+
+def encode_value(value):
+    """
+    Returns the given queryset value in a form that can be encoded as JSON.
+    :return: Any
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def ndjson_lines(fields, rows):
+    """
+    Yields each of the given rows as a JSON object line.
+    :return: Iterator[str]
+    """
+    columns = column_names(fields)
+
+    for row in rows:
+        yield json.dumps(dict(zip(columns, map(encode_value, row)))) + "\n"
+
+
+def csv_lines(fields, rows):
+    """
+    Yields a CSV header line followed by each of the given rows as a CSV line.
+    :return: Iterator[str]
+    """
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+
+    yield writer.writerow(column_names(fields))
+
+    for row in rows:
+        yield writer.writerow([encode_value(value) for value in row])
+
+
+class _LineBuffer:
+    """
+    _LineBuffer is a file-like object that returns what is written to it rather
+    than storing it, which lets the csv writer produce one line at a time.
+    """
+    def write(self, value):
+        return value
@@ -1,5 +1,21 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
 
 
 class ApiPagination(PageNumberPagination):
     page_size_query_param = "size"
+
+
+class ApiCursorPagination(CursorPagination):
+    """
+    ApiCursorPagination pages through results by their created_at position
+    rather than by page number, which avoids counting the results and scanning
+    past all of the previous pages. Used when `pagination=cursor` is requested.
+
+    The cursor only uses the first ordering field. Results with the same
+    created_at are paged by an offset from that position, and `-id` only makes
+    their order stable.
+    """
+    ordering = ("-created_at", "-id", )
+    page_size = 25
+    page_size_query_param = "size"
+    max_page_size = 1000
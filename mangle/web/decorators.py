@@ -41,7 +41,7 @@ def install_required(func):
     :return: Response
     """
     def decorator(request, *args, **kwargs):
-        if not config.get_bool("app_installed", False):
+        if not config.snapshot().app_installed:
             return redirect("/install")
         return func(request, *args, **kwargs)
     return decorator
@@ -3,10 +3,14 @@ from mangle.common import config
 
 def config_middleware(get_response):
     """
-    Middleware that reloads the application config on each request.
+    Middleware that refreshes the application config on each request. The
+    settings are only reloaded when they have been changed.
     :returns: Response
     """
     def middleware(request):
-        config.reload()
+        # the subscription is started on the first request, since gunicorn
+        # workers are forked after the application has been loaded
+        config.subscribe()
+        config.refresh()
         return get_response(request)
     return middleware
@@ -3,7 +3,7 @@ import logging
 from django.contrib.auth import authenticate, login, logout
 from django.shortcuts import redirect, render
 from django.views.decorators.csrf import ensure_csrf_cookie
-from mangle.common import config, models
+from mangle.common import config, events
 from mangle.web import forms
 from mangle.web.decorators import *
 from mangle.web.authentication.backend import redirect_login
@@ -216,7 +216,7 @@ def process_mfa(request):
     if not request.user.verify_mfa_code(code):
         request.session["errors"] = {"code": "Invalid authentication code."}
 
-        models.Event.objects.create(
+        events.record(
             name="web.error",
             user=request.user,
             detail="Incorrect two-factor authentication code"
@@ -233,7 +233,7 @@ def process_mfa(request):
         request.user.mfa_enabled = True
         request.user.save()
 
-    models.Event.objects.create(
+    events.record(
         name="web.login",
         user=request.user,
         detail="Logged in to web application from {}.".format(get_client_ip(request))
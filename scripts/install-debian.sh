@@ -8,8 +8,8 @@ echo iptables-persistent iptables-persistent/autosave_v6 boolean false | sudo de
 
 # Install required OS Packages
 apt-get update
-apt-get install -y iptables iptables-persistent make nginx ntp openssl python3 \
-    redis-server sqlite3 wget
+apt-get install -y ipset iptables iptables-persistent make nftables nginx ntp \
+    openssl python3 redis-server sqlite3 wget
 
 # Ubuntu version-specific steps
 if [[ ${OS_VERSION_ID} == "16.04" ]]; then
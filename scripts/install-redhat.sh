@@ -7,8 +7,8 @@ systemctl disable firewalld
 
 # Install OS packages
 yum install -y epel-release
-yum install -y iptables iptables-services make nginx ntp openssl openvpn redis \
-    sqlite wget
+yum install -y ipset iptables iptables-services make nftables nginx ntp openssl \
+    openvpn redis sqlite wget
 
 # Install Python3 (not available from official Red Hat repos) and symlink binary
 yum install -y https://centos7.iuscommunity.org/ius-release.rpm
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+OpenVPN hook shim.
+
+OpenVPN executes this script for each client hook (authenticate, connect and
+disconnect) with the hook server socket path and hook action as arguments. The
+hook is forwarded to the long-running hook server and the script exits with the
+code returned by the hook. When the hook server is unavailable, the hook is run
+in-process by the `manage.py vpn` command instead.
+
+This script intentionally only uses the standard library so that it does not
+pay the cost of importing the application.
+
+Usage: openvpn-hook.py <socket> <action> [args...]
+"""
+import json
+import os
+import socket
+import sys
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MANAGE_PY = os.path.join(ROOT_DIR, "manage.py")
+TIMEOUT = 30
+
+
+def call(path, action, args):
+    """
+    Sends the hook to the hook server and returns the hook exit code.
+    :return: int
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(TIMEOUT)
+
+    try:
+        sock.connect(path)
+        sock.sendall(bytes(json.dumps({
+            "action": action,
+            "args": args,
+            "env": dict(os.environ),
+        }) + "\n", "utf-8"))
+        return int(json.loads(sock.makefile("rb").readline()).get("code", 1))
+    finally:
+        sock.close()
+
+
+def main():
+    path, action, args = sys.argv[1], sys.argv[2], sys.argv[3:]
+
+    try:
+        code = call(path, action, args)
+    except (FileNotFoundError, ConnectionRefusedError):
+        # the hook server is not running, so fall back to running the hook
+        # using the management command
+        os.execv(MANAGE_PY, [MANAGE_PY, "vpn", action] + args)
+    except (OSError, ValueError):
+        code = 1
+
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()